@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
+from .csr_graph import CsrGraph, DirectedCsrGraph, UndirectedCsrGraph
 from .directed_graph import DirectedGraph, DirectedSimpleGraph
 from .edge import Edge
+from .edge_column import EdgeColumn
 from .graph import Graph
 from .multipartite_graph import GraphPartitionError, MultipartiteGraph
 from .simple_graph import SimpleGraph
@@ -9,8 +11,10 @@ from .undirected_graph import UndirectedGraph, UndirectedSimpleGraph
 from .vertex import Vertex
 
 __all__ = [
+    "CsrGraph", "DirectedCsrGraph", "UndirectedCsrGraph",
     "DirectedGraph", "DirectedSimpleGraph",
     "Edge",
+    "EdgeColumn",
     "Graph",
     "GraphPartitionError", "MultipartiteGraph",
     "SimpleGraph",
@@ -1,25 +1,38 @@
 # -*- coding: utf-8 -*-
+from .contraction_hierarchy import ContractionHierarchy
 from .cutting import find_edge_cut, find_vertex_cut
+from .delta_stepping import delta_stepping
+from .incremental_scc import IncrementalSCC
 from .lowest_common_ancestor import LowestCommonAncestor
 from .matching import match
 from .minimal_spanning_tree import kruskal, prim
-from .searching import bfs, dfs_iterative, dfs_recursive
+from .searching import bfs, bfs_distances, bfs_order, dfs_iterative, dfs_recursive, \
+    direction_optimizing_bfs, iter_bfs, iter_dfs, multi_source_bfs, reachable
 from .searching_strategy import BFSStrategy, DFSStrategy, EmptyStrategy
-from .shortest_paths import Paths, bellman_ford, dijkstra, floyd_warshall
-from .strongly_connected_components import find_scc
-from .topological_sorting import DirectedCyclicGraphError, dfs_topological_sort, \
-    inputs_topological_sort
+from .shortest_paths import NegativeCycleError, Paths, a_star, bellman_ford, \
+    bidirectional_dijkstra, dijkstra, euclidean_heuristic_2d, euclidean_heuristic_3d, \
+    floyd_warshall, johnson, multi_source_dijkstra, reconstruct_path, reconstruct_path_from_hops
+from .strongly_connected_components import condensation, find_scc, find_scc_ids
+from .topological_sorting import DirectedCyclicGraphError, DynamicTopologicalOrder, \
+    dfs_topological_sort, inputs_topological_sort
 from .tree_diameter import count_diameter
 
 __all__ = [
+    "ContractionHierarchy",
     "find_edge_cut", "find_vertex_cut",
+    "delta_stepping",
+    "IncrementalSCC",
     "LowestCommonAncestor",
     "match",
     "kruskal", "prim",
-    "bfs", "dfs_iterative", "dfs_recursive",
+    "bfs", "bfs_distances", "bfs_order", "dfs_iterative", "dfs_recursive",
+    "direction_optimizing_bfs", "iter_bfs", "iter_dfs", "multi_source_bfs", "reachable",
     "BFSStrategy", "DFSStrategy", "EmptyStrategy",
-    "Paths", "bellman_ford", "dijkstra", "floyd_warshall",
-    "find_scc",
-    "DirectedCyclicGraphError", "inputs_topological_sort", "dfs_topological_sort",
+    "NegativeCycleError", "Paths", "a_star", "bellman_ford", "bidirectional_dijkstra", "dijkstra",
+    "euclidean_heuristic_2d", "euclidean_heuristic_3d", "floyd_warshall", "johnson",
+    "multi_source_dijkstra", "reconstruct_path", "reconstruct_path_from_hops",
+    "condensation", "find_scc", "find_scc_ids",
+    "DirectedCyclicGraphError", "DynamicTopologicalOrder", "inputs_topological_sort",
+    "dfs_topological_sort",
     "count_diameter"
 ]
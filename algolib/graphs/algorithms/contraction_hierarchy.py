@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""Algorithm for repeated shortest paths queries using contraction hierarchies."""
+from heapq import heapify, heappop, heappush
+import pickle
+from typing import Any, BinaryIO, List, Tuple
+
+from .shortest_paths import Paths
+from ..directed_graph import DirectedGraph
+from ..graph import Graph
+from ..vertex import Vertex
+
+
+class ContractionHierarchy:
+    _WITNESS_SETTLED_LIMIT = 64
+    _ESTIMATE_SETTLED_LIMIT = 16
+
+    def __init__(self, graph: Graph):
+        """Preprocesses given graph by contracting its vertices one by one and adding shortcut
+        edges, which preserve distances between remaining vertices.
+
+        :param graph: the weighted graph with non-negative weights
+        :raise ValueError: if the graph contains an edge with negative weight"""
+        self._vertex_ids = [vertex.id for vertex in graph.vertices]
+        self._indices = {vertex_id: i for i, vertex_id in enumerate(self._vertex_ids)}
+        # Edges to vertices contracted later, for searching forwards from the source
+        self._upward = [[] for _ in self._vertex_ids]
+        # Edges from vertices contracted later, for searching backwards from the target
+        self._downward = [[] for _ in self._vertex_ids]
+        # Contracted vertex in the middle of each shortcut edge
+        self._shortcuts = {}
+        self._contract(graph)
+
+    @classmethod
+    def load(cls, file: BinaryIO) -> "ContractionHierarchy":
+        """Reads the hierarchy saved to given binary file. The file is read with :mod:`pickle`,
+        so loading a file from an untrusted source can execute arbitrary code. Only files from
+        trusted sources should be loaded.
+
+        :param file: the binary file
+        :return: the hierarchy"""
+        vertex_ids, upward, downward, shortcuts = pickle.load(file)
+        hierarchy = cls.__new__(cls)
+        hierarchy._vertex_ids = vertex_ids
+        hierarchy._indices = {vertex_id: i for i, vertex_id in enumerate(vertex_ids)}
+        hierarchy._upward = upward
+        hierarchy._downward = downward
+        hierarchy._shortcuts = shortcuts
+        return hierarchy
+
+    def save(self, file: BinaryIO):
+        """Writes this hierarchy to given binary file, so it can be loaded without preprocessing
+        the graph again. The file is written with :mod:`pickle`, so it must be kept where no
+        one else can modify it before it is loaded.
+
+        :param file: the binary file"""
+        pickle.dump((self._vertex_ids, self._upward, self._downward, self._shortcuts), file,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+
+    def find_path(self, source: Vertex, target: Vertex) -> Tuple[float, List[Vertex]]:
+        """Computes the shortest path between given vertices in the preprocessed graph.
+
+        :param source: the source vertex
+        :param target: the target vertex
+        :return: the distance and the vertices on the path from the source to the target, or
+            infinite distance and empty list if the target is not reachable
+        :raise KeyError: if any of the vertices does not belong to the preprocessed graph"""
+        source_index = self._index(source)
+        target_index = self._index(target)
+        forward = _HierarchySearch(source_index, self._upward, self._downward)
+        backward = _HierarchySearch(target_index, self._downward, self._upward)
+        best_distance = 0.0 if source_index == target_index else Paths.INFINITY
+        meeting_index = source_index if source_index == target_index else None
+
+        active = True
+
+        # Both searches advance alternately until neither can improve the best distance.
+        while active:
+            active = False
+
+            for front, other in ((forward, backward), (backward, forward)):
+                if front.is_active(best_distance):
+                    active = True
+                    index, distance = front.settle_next()
+
+                    if index is not None and distance + other.distances[index] < best_distance:
+                        best_distance = distance + other.distances[index]
+                        meeting_index = index
+
+        if meeting_index is None:
+            return Paths.INFINITY, []
+
+        indices = forward.path_to(meeting_index)
+        indices.extend(reversed(backward.path_to(meeting_index)[:-1]))
+        return best_distance, [Vertex(self._vertex_ids[i]) for i in self._unpacked(indices)]
+
+    def _index(self, vertex):
+        try:
+            return self._indices[vertex.id]
+        except KeyError:
+            raise KeyError(f"Vertex not found : {vertex.id}") from None
+
+    def _unpacked(self, indices):
+        # Replaces shortcut edges on the path with the paths they represent.
+        path = [indices[0]]
+        pending = list(zip(reversed(indices[:-1]), reversed(indices[1:])))
+
+        while len(pending) > 0:
+            source, destination = pending.pop()
+            middle = self._shortcuts.get((source, destination))
+
+            if middle is None:
+                path.append(destination)
+            else:
+                pending.append((middle, destination))
+                pending.append((source, middle))
+
+        return path
+
+    def _contract(self, graph):
+        outgoing, incoming = self._adjacency(graph)
+        # Number of contracted neighbours and level in the hierarchy for each vertex
+        contracted_neighbours = [0] * len(self._vertex_ids)
+        levels = [0] * len(self._vertex_ids)
+        priorities = [(self._priority(i, outgoing, incoming, contracted_neighbours, levels), i)
+                      for i in range(len(self._vertex_ids))]
+        heapify(priorities)
+
+        while len(priorities) > 0:
+            _, index = heappop(priorities)
+            priority = self._priority(index, outgoing, incoming, contracted_neighbours, levels)
+
+            # Priorities are updated lazily, so the vertex is postponed if it became worse.
+            if len(priorities) > 0 and priority > priorities[0][0]:
+                heappush(priorities, (priority, index))
+                continue
+
+            shortcuts = list(self._find_shortcuts(index, outgoing, incoming,
+                                                  self._WITNESS_SETTLED_LIMIT))
+
+            for destination, weight in outgoing[index].items():
+                self._upward[index].append((destination, weight))
+                del incoming[destination][index]
+                contracted_neighbours[destination] += 1
+                levels[destination] = max(levels[destination], levels[index] + 1)
+
+            for source, weight in incoming[index].items():
+                self._downward[index].append((source, weight))
+                del outgoing[source][index]
+                contracted_neighbours[source] += 1
+                levels[source] = max(levels[source], levels[index] + 1)
+
+            for source, destination, weight in shortcuts:
+                outgoing[source][destination] = weight
+                incoming[destination][source] = weight
+                self._shortcuts[(source, destination)] = index
+
+            # Remaining edges of the contracted vertex are no longer needed.
+            outgoing[index] = {}
+            incoming[index] = {}
+
+    def _adjacency(self, graph):
+        # Builds dictionaries of the lightest outgoing and incoming edge between each pair of
+        # vertices, which are updated while contracting.
+        weights = graph.edge_column("weight")
+
+        if min(weights.values, default=0.0) < 0.0:
+            raise ValueError("Graph contains an edge with negative weight")
+
+        outgoing = [{} for _ in self._vertex_ids]
+        incoming = [{} for _ in self._vertex_ids]
+        arcs = [(edge.source, edge.destination, weight)
+                for edge, weight in zip(weights.edges, weights.values)]
+
+        if not isinstance(graph, DirectedGraph):
+            arcs.extend([(destination, source, weight) for source, destination, weight in arcs])
+
+        for source, destination, weight in arcs:
+            source_index = self._indices[source.id]
+            destination_index = self._indices[destination.id]
+
+            if source_index != destination_index \
+                    and weight < outgoing[source_index].get(destination_index, Paths.INFINITY):
+                outgoing[source_index][destination_index] = weight
+                incoming[destination_index][source_index] = weight
+
+        return outgoing, incoming
+
+    def _priority(self, index, outgoing, incoming, contracted_neighbours, levels):
+        # Edge difference with the number of contracted neighbours and the level, so vertices
+        # are contracted uniformly in the whole graph. Most evaluated vertices are postponed, so
+        # shortcuts are only estimated with shorter witness searches.
+        shortcuts_count = sum(1 for _ in self._find_shortcuts(index, outgoing, incoming,
+                                                              self._ESTIMATE_SETTLED_LIMIT))
+        return shortcuts_count - len(outgoing[index]) - len(incoming[index]) \
+            + contracted_neighbours[index] + levels[index]
+
+    def _find_shortcuts(self, index, outgoing, incoming, limit):
+        # Yields edges needed to preserve distances when the vertex is removed, i.e. paths through
+        # the vertex with no witness path which is not longer and avoids the vertex.
+        for source, source_weight in incoming[index].items():
+            targets = set(outgoing[index])
+            targets.discard(source)
+
+            if len(targets) == 0:
+                continue
+
+            max_distance = source_weight + max(outgoing[index][target] for target in targets)
+            witness_distances = self._witness_search(source, index, targets, max_distance,
+                                                     outgoing, limit)
+
+            for destination, destination_weight in outgoing[index].items():
+                distance = source_weight + destination_weight
+
+                if destination != source and witness_distances.get(destination,
+                                                                   Paths.INFINITY) > distance:
+                    yield source, destination, distance
+
+    def _witness_search(self, source, excluded, targets, max_distance, outgoing, limit):
+        distances = {source: 0.0}
+        vertex_heap = [(0.0, source)]
+        settled_count = 0
+
+        while len(vertex_heap) > 0 and settled_count < limit:
+            distance, vertex = heappop(vertex_heap)
+
+            if distance > distances[vertex]:
+                continue
+
+            settled_count += 1
+            targets.discard(vertex)
+
+            if len(targets) == 0:
+                break
+
+            for neighbour, weight in outgoing[vertex].items():
+                new_distance = distance + weight
+
+                if neighbour != excluded and new_distance <= max_distance \
+                        and new_distance < distances.get(neighbour, Paths.INFINITY):
+                    distances[neighbour] = new_distance
+                    heappush(vertex_heap, (new_distance, neighbour))
+
+        return distances
+
+
+class _HierarchySearch:
+    def __init__(self, start: int, edges: List[List[Tuple[int, Any]]],
+                 opposite_edges: List[List[Tuple[int, Any]]]):
+        self._edges = edges
+        self._opposite_edges = opposite_edges
+        # Distances are indexed by vertices, which is faster than a dictionary even though the
+        # search reaches only a small part of the hierarchy.
+        self.distances = [Paths.INFINITY] * len(edges)
+        self.distances[start] = 0.0
+        self._parents = {}
+        self._heap = [(0.0, start)]
+
+    def is_active(self, best_distance):
+        return len(self._heap) > 0 and self._heap[0][0] < best_distance
+
+    def settle_next(self):
+        distance, index = heappop(self._heap)
+        distances = self.distances
+
+        if distance > distances[index]:
+            return None, distance
+
+        # Stall-on-demand: the vertex is not expanded if a higher vertex gives a shorter path
+        # to it, since then no shortest path passes through it.
+        for neighbour, weight in self._opposite_edges[index]:
+            if distances[neighbour] + weight < distance:
+                return index, distance
+
+        for neighbour, weight in self._edges[index]:
+            new_distance = distance + weight
+
+            if new_distance < distances[neighbour]:
+                distances[neighbour] = new_distance
+                self._parents[neighbour] = index
+                heappush(self._heap, (new_distance, neighbour))
+
+        return index, distance
+
+    def path_to(self, index):
+        path = [index]
+
+        while path[-1] in self._parents:
+            path.append(self._parents[path[-1]])
+
+        path.reverse()
+        return path
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""Algorithm for single source shortest paths in a weighted graph using delta-stepping."""
+from multiprocessing import Pool
+from multiprocessing.sharedctypes import RawArray
+from typing import Dict, Optional
+
+from .shortest_paths import Paths
+from ..graph import Graph
+from ..vertex import Vertex
+
+_PARALLEL_MIN_FRONTIER = 1024
+
+
+def delta_stepping(graph: Graph, source: Vertex, *, delta: Optional[float] = None,
+                   processes: Optional[int] = None) -> Dict[Vertex, float]:
+    """Computes shortest paths in given graph from given vertex using delta-stepping algorithm.
+    Vertices are kept in buckets of distances of width delta. Light edges, not longer than delta,
+    are relaxed repeatedly until the current bucket becomes empty, then heavy edges are relaxed
+    once from all vertices removed from the bucket.
+
+    :param graph: the weighted graph with non-negative weights
+    :param source: the source vertex
+    :param delta: the width of buckets, or ``None`` to use the average weight of edges
+    :param processes: the number of worker processes relaxing edges from large buckets in
+        parallel over the graph exported to shared memory, or ``None`` to relax them in the
+        current process
+    :return: the dictionary of distances to each vertex
+    :raise ValueError: if the graph contains an edge with negative weight or delta is not
+        positive"""
+    csr = _SharedCsr(graph)
+
+    if min(csr.weights, default=0.0) < 0.0:
+        raise ValueError("Graph contains an edge with negative weight")
+
+    if delta is None:
+        delta = sum(csr.weights) / len(csr.weights) if len(csr.weights) > 0 else 0.0
+        delta = delta if delta > 0.0 else 1.0
+
+    if delta <= 0.0:
+        raise ValueError("Delta has to be positive")
+
+    if processes is None:
+        _run_buckets(csr, csr.indices[source], delta, None, processes)
+    else:
+        with Pool(processes, _init_worker, (csr,)) as pool:
+            _run_buckets(csr, csr.indices[source], delta, pool, processes)
+
+    return dict(zip(csr.vertices, csr.distances))
+
+
+class _SharedCsr:
+    # Adjacency of graph in compressed sparse row format stored in shared memory, with current
+    # distances of vertices, which are written only by the main process between relaxations.
+    def __init__(self, graph):
+        weights = graph.edge_column("weight")
+        self.vertices = list(graph.vertices)
+        self.indices = {vertex: i for i, vertex in enumerate(self.vertices)}
+        adjacency = [graph.adjacent_edges(vertex) for vertex in self.vertices]
+        self.offsets = RawArray("q", len(self.vertices) + 1)
+        self.targets = RawArray("q", sum(len(edges) for edges in adjacency))
+        self.weights = RawArray("d", len(self.targets))
+        self.distances = RawArray("d", [Paths.INFINITY] * len(self.vertices))
+        position = 0
+
+        for i, (vertex, edges) in enumerate(zip(self.vertices, adjacency)):
+            for edge in edges:
+                self.targets[position] = self.indices[edge.get_neighbour(vertex)]
+                self.weights[position] = weights[edge]
+                position += 1
+
+            self.offsets[i + 1] = position
+
+    def __getstate__(self):
+        # Vertices stay in the main process, workers need only shared arrays.
+        return self.offsets, self.targets, self.weights, self.distances
+
+    def __setstate__(self, state):
+        self.vertices = None
+        self.indices = None
+        self.offsets, self.targets, self.weights, self.distances = state
+
+
+def _run_buckets(csr, source, delta, pool, processes):
+    buckets = {}
+
+    def relax(vertex, distance):
+        if distance < csr.distances[vertex]:
+            if csr.distances[vertex] < Paths.INFINITY:
+                old_bucket = buckets.get(int(csr.distances[vertex] // delta))
+
+                if old_bucket is not None:
+                    old_bucket.discard(vertex)
+
+            csr.distances[vertex] = distance
+            buckets.setdefault(int(distance // delta), set()).add(vertex)
+
+    relax(source, 0.0)
+
+    while len(buckets) > 0:
+        index = min(buckets)
+        removed = []
+
+        while len(buckets.get(index, ())) > 0:
+            frontier = list(buckets.pop(index))
+            removed.extend(frontier)
+
+            for vertex, distance in _requests(csr, frontier, delta, True, pool, processes):
+                relax(vertex, distance)
+
+        buckets.pop(index, None)
+
+        for vertex, distance in _requests(csr, removed, delta, False, pool, processes):
+            relax(vertex, distance)
+
+
+def _requests(csr, frontier, delta, light, pool, processes):
+    # Collects improving relaxations of light or heavy edges from given vertices.
+    if pool is None or len(frontier) < _PARALLEL_MIN_FRONTIER:
+        return _relaxations(csr, frontier, delta, light)
+
+    chunk_size = -(-len(frontier) // (4 * processes))
+    chunks = [(frontier[i:i + chunk_size], delta, light)
+              for i in range(0, len(frontier), chunk_size)]
+    # All results are collected before relaxing, so distances do not change while being read.
+    return [request for requests in pool.map(_worker_relaxations, chunks)
+            for request in requests]
+
+
+def _relaxations(csr, frontier, delta, light):
+    offsets, targets, weights, distances = csr.offsets, csr.targets, csr.weights, csr.distances
+    requests = []
+
+    for vertex in frontier:
+        distance = distances[vertex]
+
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            weight = weights[position]
+
+            if (weight <= delta) == light:
+                target = targets[position]
+
+                if distance + weight < distances[target]:
+                    requests.append((target, distance + weight))
+
+    return requests
+
+
+_WORKER_CSR = None
+
+
+def _init_worker(csr):
+    global _WORKER_CSR  # pylint: disable=global-statement
+    _WORKER_CSR = csr
+
+
+def _worker_relaxations(task):
+    frontier, delta, light = task
+    return _relaxations(_WORKER_CSR, frontier, delta, light)
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Structure of strongly connected components maintained under insertions of edges."""
+from typing import Any
+
+from .strongly_connected_components import find_scc_ids
+from ..directed_graph import DirectedSimpleGraph
+from ..edge import Edge
+from ..vertex import Vertex
+from ...structures.disjoint_sets import DisjointSets
+
+
+class IncrementalSCC:
+    def __init__(self, graph: DirectedSimpleGraph):
+        """Computes strongly connected components of given directed graph, which are later updated
+        when edges are added through this structure.
+
+        :param graph: the directed graph, which does not need to keep incoming edges, since
+            predecessors of components are kept in this structure"""
+        self.graph = graph
+        vertices = list(graph.vertices)
+        scc_ids = find_scc_ids(graph)
+        represents = {}
+
+        for vertex, scc_id in zip(vertices, scc_ids):
+            represents.setdefault(scc_id, []).append(vertex)
+
+        self._components = DisjointSets(represents.values())
+        # Position of each component in topological order of components
+        self._order = {}
+        # Number of vertices in each component
+        self._sizes = {}
+        # Components with edges from or to each component, whose represents may be outdated
+        self._successors = {}
+        self._predecessors = {}
+
+        for scc_id, members in represents.items():
+            self._add_component(members, scc_id)
+
+        self._next_position = len(represents)
+
+        for edge in graph.edges:
+            source_component = self._components[edge.source]
+            destination_component = self._components[edge.destination]
+            self._successors[source_component].add(destination_component)
+            self._predecessors[destination_component].add(source_component)
+
+    @property
+    def components_count(self) -> int:
+        """Gets the number of strongly connected components.
+
+        :return: the number of components"""
+        return len(self._components)
+
+    def component_of(self, vertex: Vertex) -> Vertex:
+        """Searches for the represent of strongly connected component containing given vertex.
+
+        :param vertex: the vertex
+        :return: the represent of the component, which changes only when components are merged
+        :raise KeyError: if the vertex does not belong to the graph"""
+        return self._components[vertex]
+
+    def same_component(self, vertex1: Vertex, vertex2: Vertex) -> bool:
+        """Checks whether given vertices belong to the same strongly connected component.
+
+        :param vertex1: the first vertex
+        :param vertex2: the second vertex
+        :return: ``True`` if the vertices are in the same component, otherwise ``False``
+        :raise KeyError: if either vertex does not belong to the graph"""
+        return self._components.is_same_set(vertex1, vertex2)
+
+    def add_edge_between(self, source: Vertex, destination: Vertex, property_: Any = None) -> Edge:
+        """Adds new edge between given vertices to the graph and merges all components on cycles
+        closed by this edge. Only components between the endpoints in topological order of
+        components are searched.
+
+        :param source: the source vertex
+        :param destination: the destination vertex
+        :param property_: the edge property
+        :return: the created edge
+        :raise ValueError: if the edge already exists"""
+        edge = self.graph.add_edge_between(source, destination, property_)
+
+        for vertex in (source, destination):
+            if vertex not in self._components:
+                self._components.add([vertex])
+                self._add_component([vertex], self._next_position)
+                self._next_position += 1
+
+        source_component = self._components[source]
+        destination_component = self._components[destination]
+        self._successors[source_component].add(destination_component)
+        self._predecessors[destination_component].add(source_component)
+
+        if self._order[destination_component] < self._order[source_component]:
+            self._restore_order(source_component, destination_component)
+
+        return edge
+
+    def _add_component(self, members, position):
+        represent = self._components[members[0]]
+        self._order[represent] = position
+        self._sizes[represent] = len(members)
+        self._successors[represent] = set()
+        self._predecessors[represent] = set()
+
+    def _restore_order(self, source, destination):
+        # Only components between the endpoints in current order may have to be moved.
+        bounds = (self._order[destination], self._order[source])
+        forward = self._search(destination, self._successors, bounds)
+        backward = self._search(source, self._predecessors, bounds)
+        positions = sorted(self._order[c] for c in forward | backward)
+        cycle = forward & backward
+        # Components only reaching the source move down and those only reachable from the
+        # destination move up, while the merged component takes any position between them.
+        lower = sorted(backward - cycle, key=self._order.get)
+        upper = sorted(forward - cycle, key=self._order.get)
+
+        if len(cycle) > 0:
+            lower.append(self._merge(cycle))
+
+        for component, position in zip(lower, positions):
+            self._order[component] = position
+
+        for component, position in zip(upper, positions[len(positions) - len(upper):]):
+            self._order[component] = position
+
+    def _search(self, start, neighbours, bounds):
+        lower, upper = bounds
+        reached = {start}
+        component_stack = [start]
+
+        while len(component_stack) > 0:
+            component = component_stack.pop()
+
+            for next_component in self._adjacent_components(component, neighbours):
+                if next_component not in reached \
+                        and lower <= self._order[next_component] <= upper:
+                    reached.add(next_component)
+                    component_stack.append(next_component)
+
+        return reached
+
+    def _adjacent_components(self, component, neighbours):
+        # Outdated represents of merged components are replaced, so edges inside components and
+        # parallel edges between components are dropped.
+        adjacent = {self._components[represent] for represent in neighbours[component]}
+        adjacent.discard(component)
+        neighbours[component] = adjacent
+        return adjacent
+
+    def _merge(self, cycle):
+        # The largest component becomes the represent, so trees of disjoint sets stay shallow.
+        cycle = sorted(cycle, key=self._sizes.get, reverse=True)
+        represent = cycle[0]
+
+        for component in cycle[1:]:
+            self._components.union_set(represent, component)
+            self._sizes[represent] += self._sizes.pop(component)
+            del self._order[component]
+
+            for adjacency in (self._successors, self._predecessors):
+                smaller, larger = sorted((adjacency.pop(component), adjacency[represent]), key=len)
+                larger |= smaller
+                adjacency[represent] = larger
+
+        return represent
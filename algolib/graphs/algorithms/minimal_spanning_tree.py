@@ -16,8 +16,10 @@ def kruskal(graph: UndirectedGraph) -> UndirectedGraph:
     edge_queue = PriorityQueue()
     vertex_sets = DisjointSets((v,) for v in graph.vertices)
 
-    for edge in graph.edges:
-        edge_queue.put((graph.properties[edge].weight, edge))
+    weights = graph.edge_column("weight")
+
+    for edge, weight in zip(weights.edges, weights.values):
+        edge_queue.put((weight, edge))
 
     while len(vertex_sets) > 1 and not edge_queue.empty():
         _, edge = edge_queue.get()
@@ -36,6 +38,7 @@ def prim(graph: UndirectedGraph, source: Vertex) -> UndirectedGraph:
     :param source: the starting vertex
     :return: the minimal spanning tree"""
     mst = UndirectedSimpleGraph([v.id for v in graph.vertices])
+    weights = graph.edge_column("weight")
     visited = {source}
     edge_queue = PriorityQueue()
 
@@ -43,7 +46,7 @@ def prim(graph: UndirectedGraph, source: Vertex) -> UndirectedGraph:
         neighbour = adjacent_edge.get_neighbour(source)
 
         if neighbour != source:
-            edge_queue.put((graph.properties[adjacent_edge].weight, adjacent_edge, neighbour))
+            edge_queue.put((weights[adjacent_edge], adjacent_edge, neighbour))
 
     while not edge_queue.empty():
         _, edge, vertex = edge_queue.get()
@@ -56,7 +59,6 @@ def prim(graph: UndirectedGraph, source: Vertex) -> UndirectedGraph:
                 neighbour = adjacent_edge.get_neighbour(vertex)
 
                 if neighbour not in visited:
-                    edge_queue.put(
-                        (graph.properties[adjacent_edge].weight, adjacent_edge, neighbour))
+                    edge_queue.put((weights[adjacent_edge], adjacent_edge, neighbour))
 
     return mst
@@ -1,12 +1,20 @@
 # -*- coding: utf-8 -*-
 """Algorithms for graph searching."""
+from array import array
 from collections import deque
-from typing import Iterable
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .searching_strategy import BFSStrategy, DFSStrategy
+from ..csr_graph import CsrGraph, DirectedCsrGraph, UndirectedCsrGraph
+from ..directed_graph import DirectedGraph
 from ..graph import Graph
 from ..vertex import Vertex
 
+# Default switching thresholds of direction-optimizing BFS: bottom-up is used when edges from the
+# frontier exceed 1/ALPHA of unexplored edges, until the frontier falls below 1/BETA of vertices.
+_BOTTOM_UP_ALPHA = 14
+_BOTTOM_UP_BETA = 24
+
 
 def bfs(graph: Graph, strategy: BFSStrategy, roots: Iterable[Vertex]) -> Iterable[Vertex]:
     """Breadth-first-search algorithm.
@@ -14,29 +22,277 @@ def bfs(graph: Graph, strategy: BFSStrategy, roots: Iterable[Vertex]) -> Iterabl
     :param graph: the graph
     :param strategy: the searching strategy
     :param roots: the starting vertices
-    :return: the visited vertices"""
+    :return: the visited vertices in order of visiting"""
+    for_root, on_entry, on_next_vertex, on_exit = _callbacks(
+        strategy, "for_root", "on_entry", "on_next_vertex", "on_exit")
+
+    if for_root is on_entry is on_next_vertex is on_exit is None:
+        return iter(_bfs_visited(graph, roots))
+
     reached = set()
+    visited = []
     vertex_queue = deque()
 
     for root in roots:
         if root not in reached:
-            strategy.for_root(root)
+            if for_root is not None:
+                for_root(root)
+
             vertex_queue.append(root)
             reached.add(root)
 
             while len(vertex_queue) > 0:
                 vertex = vertex_queue.popleft()
-                strategy.on_entry(vertex)
+                visited.append(vertex)
+
+                if on_entry is not None:
+                    on_entry(vertex)
 
                 for neighbour in graph.neighbours(vertex):
                     if neighbour not in reached:
-                        strategy.on_next_vertex(vertex, neighbour)
+                        if on_next_vertex is not None:
+                            on_next_vertex(vertex, neighbour)
+
                         reached.add(neighbour)
                         vertex_queue.append(neighbour)
 
-                strategy.on_exit(vertex)
+                if on_exit is not None:
+                    on_exit(vertex)
+
+    return iter(visited)
+
+
+def reachable(graph: Graph, roots: Iterable[Vertex]) -> Set[Vertex]:
+    """Searches for all vertices reachable from given vertices, without any strategy.
+
+    :param graph: the graph
+    :param roots: the starting vertices
+    :return: the reachable vertices"""
+    reached = set()
+
+    for root in roots:
+        if root not in reached:
+            reached.add(root)
+            vertex_stack = [root]
+
+            while len(vertex_stack) > 0:
+                vertex = vertex_stack.pop()
+
+                for edge in graph.adjacent_edges(vertex):
+                    neighbour = edge.get_neighbour(vertex)
 
-    return iter(reached)
+                    if neighbour not in reached:
+                        reached.add(neighbour)
+                        vertex_stack.append(neighbour)
+
+    return reached
+
+
+def bfs_order(graph: Graph, roots: Iterable[Vertex]) -> List[Vertex]:
+    """Breadth-first-search algorithm without any strategy, which returns the visiting order.
+
+    :param graph: the graph
+    :param roots: the starting vertices
+    :return: the visited vertices in order of visiting"""
+    order = []
+    reached = set()
+
+    for root in roots:
+        if root not in reached:
+            reached.add(root)
+            begin = len(order)
+            order.append(root)
+
+            # Visited vertices are appended to the order, which serves as the queue.
+            while begin < len(order):
+                vertex = order[begin]
+                begin += 1
+
+                for edge in graph.adjacent_edges(vertex):
+                    neighbour = edge.get_neighbour(vertex)
+
+                    if neighbour not in reached:
+                        reached.add(neighbour)
+                        order.append(neighbour)
+
+    return order
+
+
+def bfs_distances(graph: Graph, roots: Iterable[Vertex]) -> Dict[Vertex, int]:
+    """Breadth-first-search algorithm without any strategy, which counts numbers of edges on
+    shortest paths from the closest of starting vertices.
+
+    :param graph: the graph
+    :param roots: the starting vertices
+    :return: the dictionary of distances to each reachable vertex"""
+    distances = dict.fromkeys(roots, 0)
+    frontier = list(distances)
+    level = 0
+
+    while len(frontier) > 0:
+        level += 1
+        next_frontier = []
+
+        for vertex in frontier:
+            for edge in graph.adjacent_edges(vertex):
+                neighbour = edge.get_neighbour(vertex)
+
+                if neighbour not in distances:
+                    distances[neighbour] = level
+                    next_frontier.append(neighbour)
+
+        frontier = next_frontier
+
+    return distances
+
+
+def multi_source_bfs(graph: Graph, sources: Iterable[Vertex]) -> Dict[Vertex, Tuple[Vertex, int]]:
+    """Breadth-first-search algorithm started from all given vertices at once, which finds the
+    nearest of them for each vertex. Ties are resolved in favour of the source given earlier.
+
+    :param graph: the graph
+    :param sources: the source vertices
+    :return: the dictionary of the nearest source and the number of edges on a shortest path from
+        it to each reachable vertex"""
+    nearest = {source: (source, 0) for source in sources}
+    frontier = list(nearest)
+    level = 0
+
+    while len(frontier) > 0:
+        level += 1
+        next_frontier = []
+
+        for vertex in frontier:
+            source = nearest[vertex][0]
+
+            for edge in graph.adjacent_edges(vertex):
+                neighbour = edge.get_neighbour(vertex)
+
+                if neighbour not in nearest:
+                    nearest[neighbour] = (source, level)
+                    next_frontier.append(neighbour)
+
+        frontier = next_frontier
+
+    return nearest
+
+
+def iter_bfs(graph: Graph, roots: Iterable[Vertex]) \
+        -> Iterator[Tuple[Vertex, int, Optional[Vertex]]]:
+    """Lazy breadth-first-search algorithm, which yields vertices as soon as they are discovered,
+    so searching may be stopped early. Apart from the set of reached vertices, only the queue of
+    discovered and not yet expanded vertices is kept.
+
+    :param graph: the graph
+    :param roots: the starting vertices
+    :return: the generator of discovered vertices with numbers of edges on paths from their roots
+        and their parents in the search tree (``None`` for the roots)"""
+    reached = set()
+
+    for root in roots:
+        if root not in reached:
+            reached.add(root)
+            yield root, 0, None
+            vertex_queue = deque([(root, 0)])
+
+            while len(vertex_queue) > 0:
+                vertex, depth = vertex_queue.popleft()
+
+                for edge in graph.adjacent_edges(vertex):
+                    neighbour = edge.get_neighbour(vertex)
+
+                    if neighbour not in reached:
+                        reached.add(neighbour)
+                        yield neighbour, depth + 1, vertex
+                        vertex_queue.append((neighbour, depth + 1))
+
+
+def iter_dfs(graph: Graph, roots: Iterable[Vertex]) \
+        -> Iterator[Tuple[Vertex, int, Optional[Vertex]]]:
+    """Lazy depth-first-search algorithm, which yields vertices in preorder as soon as they are
+    entered, so searching may be stopped early. Apart from the set of reached vertices, only the
+    current path with iterators over remaining edges is kept.
+
+    :param graph: the graph
+    :param roots: the starting vertices
+    :return: the generator of entered vertices with their depths in the search tree and their
+        parents (``None`` for the roots)"""
+    reached = set()
+
+    for root in roots:
+        if root not in reached:
+            reached.add(root)
+            yield root, 0, None
+            vertex_stack = [(root, iter(graph.adjacent_edges(root)))]
+
+            while len(vertex_stack) > 0:
+                vertex, edges = vertex_stack[-1]
+
+                for edge in edges:
+                    neighbour = edge.get_neighbour(vertex)
+
+                    if neighbour not in reached:
+                        reached.add(neighbour)
+                        yield neighbour, len(vertex_stack), vertex
+                        vertex_stack.append((neighbour, iter(graph.adjacent_edges(neighbour))))
+                        break
+                else:
+                    vertex_stack.pop()
+
+
+def direction_optimizing_bfs(graph: Graph, root: Vertex, *, alpha: float = _BOTTOM_UP_ALPHA,
+                             beta: float = _BOTTOM_UP_BETA) -> Tuple[array, array]:
+    """Level-synchronous breadth-first search over indices of vertices, which expands small
+    frontiers top-down over outgoing edges and large frontiers bottom-up, by looking for
+    frontier vertices among sources of incoming edges of unreached vertices. Graphs not in
+    compressed sparse row format are converted first.
+
+    :param graph: the graph
+    :param root: the starting vertex
+    :param alpha: the threshold of switching to bottom-up, which happens when edges from the
+        frontier exceed 1/alpha of unexplored edges, so zero keeps searching top-down
+    :param beta: the threshold of switching back to top-down, which happens when the frontier
+        falls below 1/beta of vertices
+    :return: the distances from the root and the parents in the search tree, both indexed by
+        positions of vertices in the graph, with -1 for unreached vertices and the root parent"""
+    if not isinstance(graph, CsrGraph):
+        graph = _as_csr_graph(graph)
+
+    offsets, targets = graph.compressed_rows()
+    incoming_rows = graph.compressed_incoming_rows()
+    distances = array("q", [-1]) * graph.vertices_count
+    parents = array("q", [-1]) * graph.vertices_count
+    root_index = graph.vertex_index(root)
+    distances[root_index] = 0
+    frontier = [root_index]
+    unexplored_edges = len(targets) - (offsets[root_index + 1] - offsets[root_index])
+    unreached = None
+    bottom_up = False
+    level = 0
+
+    while len(frontier) > 0:
+        level += 1
+
+        if bottom_up:
+            bottom_up = len(frontier) * beta >= len(distances)
+        else:
+            bottom_up = sum(offsets[v + 1] - offsets[v] for v in frontier) * alpha \
+                > unexplored_edges
+
+        if bottom_up:
+            if unreached is None:
+                unreached = [v for v in range(len(distances)) if distances[v] < 0]
+
+            frontier = _bottom_up_step(incoming_rows, frontier, unreached, distances, parents,
+                                       level)
+            unreached = [v for v in unreached if distances[v] < 0]
+        else:
+            frontier = _top_down_step((offsets, targets), frontier, distances, parents, level)
+            unreached = None
+
+        unexplored_edges -= sum(offsets[v + 1] - offsets[v] for v in frontier)
+
+    return distances, parents
 
 
 def dfs_iterative(graph: Graph, strategy: DFSStrategy, roots: Iterable[Vertex]) -> Iterable[Vertex]:
@@ -45,14 +301,22 @@ def dfs_iterative(graph: Graph, strategy: DFSStrategy, roots: Iterable[Vertex])
     :param graph: the graph
     :param strategy: the searching strategy
     :param roots: the starting vertices
-    :return: the visited vertices"""
+    :return: the visited vertices in order of visiting"""
+    for_root, on_entry, on_next_vertex, on_exit, on_edge_to_visited = _callbacks(
+        strategy, "for_root", "on_entry", "on_next_vertex", "on_exit", "on_edge_to_visited")
+
+    if for_root is on_entry is on_next_vertex is on_exit is on_edge_to_visited is None:
+        return iter(_dfs_iterative_visited(graph, roots))
+
     reached = {}
     vertex_stack = deque()
     iteration = 1
 
     for root in roots:
         if root not in reached:
-            strategy.for_root(root)
+            if for_root is not None:
+                for_root(root)
+
             vertex_stack.append(root)
 
             while len(vertex_stack) > 0:
@@ -60,16 +324,22 @@ def dfs_iterative(graph: Graph, strategy: DFSStrategy, roots: Iterable[Vertex])
 
                 if vertex not in reached:
                     reached[vertex] = iteration
-                    strategy.on_entry(vertex)
+
+                    if on_entry is not None:
+                        on_entry(vertex)
 
                     for neighbour in graph.neighbours(vertex):
                         if neighbour not in reached:
-                            strategy.on_next_vertex(vertex, neighbour)
+                            if on_next_vertex is not None:
+                                on_next_vertex(vertex, neighbour)
+
                             vertex_stack.append(neighbour)
-                        elif reached[neighbour] == iteration:
-                            strategy.on_edge_to_visited(vertex, neighbour)
+                        elif reached[neighbour] == iteration and on_edge_to_visited is not None:
+                            on_edge_to_visited(vertex, neighbour)
+
+                    if on_exit is not None:
+                        on_exit(vertex)
 
-                    strategy.on_exit(vertex)
                     reached[vertex] = -iteration
 
             iteration += 1
@@ -78,50 +348,177 @@ def dfs_iterative(graph: Graph, strategy: DFSStrategy, roots: Iterable[Vertex])
 
 
 def dfs_recursive(graph: Graph, strategy: DFSStrategy, roots: Iterable[Vertex]) -> Iterable[Vertex]:
-    """Recursive depth-first search algorithm.
+    """Recursive depth-first search algorithm. Recursion is simulated with an explicit stack, so
+    the depth of search is not limited by the interpreter recursion limit.
 
     :param graph: the graph
     :param strategy: the searching strategy
     :param roots: the starting vertices
-    :return: the visited vertices"""
-    state = _DfsRecursiveState()
+    :return: the visited vertices in order of visiting"""
+    for_root, on_entry, on_next_vertex, on_exit, on_edge_to_visited = _callbacks(
+        strategy, "for_root", "on_entry", "on_next_vertex", "on_exit", "on_edge_to_visited")
+
+    if for_root is on_entry is on_next_vertex is on_exit is on_edge_to_visited is None:
+        return iter(_dfs_recursive_visited(graph, roots))
+
+    reached = {}
+    iteration = 1
+
+    for root in roots:
+        if root not in reached:
+            if for_root is not None:
+                for_root(root)
+
+            reached[root] = iteration
+
+            if on_entry is not None:
+                on_entry(root)
+
+            # Each frame holds a vertex with iterator over its remaining neighbours.
+            vertex_stack = [(root, iter(graph.neighbours(root)))]
+
+            while len(vertex_stack) > 0:
+                vertex, neighbours = vertex_stack[-1]
+
+                for neighbour in neighbours:
+                    if neighbour not in reached:
+                        if on_next_vertex is not None:
+                            on_next_vertex(vertex, neighbour)
+
+                        reached[neighbour] = iteration
+
+                        if on_entry is not None:
+                            on_entry(neighbour)
+
+                        vertex_stack.append((neighbour, iter(graph.neighbours(neighbour))))
+                        break
+
+                    if reached[neighbour] == iteration and on_edge_to_visited is not None:
+                        on_edge_to_visited(vertex, neighbour)
+                else:
+                    vertex_stack.pop()
+
+                    if on_exit is not None:
+                        on_exit(vertex)
+
+                    reached[vertex] = -iteration
+
+            iteration += 1
+
+    return iter(reached.keys())
+
+
+def _bfs_visited(graph, roots):
+    # Visits vertices in the same order as BFS with strategy, but without calling any callbacks.
+    reached = set()
+    visited = []
 
     for root in roots:
-        if root not in state.reached:
-            strategy.for_root(root)
-            state.vertex = root
-            _dfs_recursive_step(graph, strategy, state)
-            state.iteration += 1
+        if root not in reached:
+            reached.add(root)
+            begin = len(visited)
+            visited.append(root)
+
+            while begin < len(visited):
+                vertex = visited[begin]
+                begin += 1
+
+                for neighbour in graph.neighbours(vertex):
+                    if neighbour not in reached:
+                        reached.add(neighbour)
+                        visited.append(neighbour)
+
+    return visited
+
+
+def _dfs_iterative_visited(graph, roots):
+    # Visits vertices in the same order as iterative DFS with strategy, but without calling any
+    # callbacks.
+    reached = {}
+
+    for root in roots:
+        if root not in reached:
+            vertex_stack = [root]
+
+            while len(vertex_stack) > 0:
+                vertex = vertex_stack.pop()
+
+                if vertex not in reached:
+                    reached[vertex] = None
+                    vertex_stack.extend(neighbour for neighbour in graph.neighbours(vertex)
+                                        if neighbour not in reached)
+
+    return reached.keys()
+
+
+def _dfs_recursive_visited(graph, roots):
+    # Visits vertices in the same order as recursive DFS with strategy, but without calling any
+    # callbacks.
+    reached = {}
+
+    for root in roots:
+        if root not in reached:
+            reached[root] = None
+            vertex_stack = [(root, iter(graph.neighbours(root)))]
+
+            while len(vertex_stack) > 0:
+                _, neighbours = vertex_stack[-1]
+
+                for neighbour in neighbours:
+                    if neighbour not in reached:
+                        reached[neighbour] = None
+                        vertex_stack.append((neighbour, iter(graph.neighbours(neighbour))))
+                        break
+                else:
+                    vertex_stack.pop()
+
+    return reached.keys()
+
+
+def _as_csr_graph(graph):
+    graph_type = DirectedCsrGraph if isinstance(graph, DirectedGraph) else UndirectedCsrGraph
+    return graph_type((v.id for v in graph.vertices),
+                      ((e.source.id, e.destination.id) for e in graph.edges))
+
+
+def _top_down_step(rows, frontier, distances, parents, level):
+    # Visits unreached destinations of edges outgoing from frontier vertices.
+    offsets, targets = rows
+    next_frontier = []
 
-    return iter(state.reached.keys())
+    for vertex in frontier:
+        for neighbour in targets[offsets[vertex]:offsets[vertex + 1]]:
+            if distances[neighbour] < 0:
+                distances[neighbour] = level
+                parents[neighbour] = vertex
+                next_frontier.append(neighbour)
 
+    return next_frontier
 
-def _dfs_recursive_step(graph, strategy, state):
-    # Single step of recursive DFS.
-    vertex = state.vertex
-    state.on_entry(vertex)
-    strategy.on_entry(vertex)
 
-    for neighbour in graph.neighbours(vertex):
-        if neighbour not in state.reached:
-            strategy.on_next_vertex(vertex, neighbour)
-            state.vertex = neighbour
-            _dfs_recursive_step(graph, strategy, state)
-        elif state.reached[neighbour] == state.iteration:
-            strategy.on_edge_to_visited(vertex, neighbour)
+def _bottom_up_step(incoming_rows, frontier, unreached, distances, parents, level):
+    # Visits unreached vertices with any source of incoming edges among frontier vertices.
+    incoming_offsets, sources = incoming_rows
+    in_frontier = bytearray(len(distances))
+    next_frontier = []
 
-    strategy.on_exit(vertex)
-    state.on_exit(vertex)
+    for vertex in frontier:
+        in_frontier[vertex] = 1
 
+    for vertex in unreached:
+        for source in sources[incoming_offsets[vertex]:incoming_offsets[vertex + 1]]:
+            if in_frontier[source]:
+                distances[vertex] = level
+                parents[vertex] = source
+                next_frontier.append(vertex)
+                break
 
-class _DfsRecursiveState:
-    def __init__(self):
-        self.vertex = None
-        self.iteration = 1
-        self.reached = {}
+    return next_frontier
 
-    def on_entry(self, vertex_):
-        self.reached[vertex_] = self.iteration
 
-    def on_exit(self, vertex_):
-        self.reached[vertex_] = -self.iteration
+def _callbacks(strategy, *names):
+    # Gets callbacks of the strategy with given names, or None for those not declared in its
+    # hooks, so searching does not call them.
+    hooks = getattr(strategy, "hooks", None)
+    return tuple(getattr(strategy, name) if hooks is None or name in hooks else None
+                 for name in names)
@@ -6,6 +6,9 @@ from ..vertex import Vertex
 
 
 class BFSStrategy(metaclass=ABCMeta):
+    # Names of callbacks implemented by the strategy, others are never called by searching
+    hooks = frozenset({"for_root", "on_entry", "on_next_vertex", "on_exit"})
+
     @abstractmethod
     def for_root(self, root: Vertex):
         pass
@@ -24,12 +27,23 @@ class BFSStrategy(metaclass=ABCMeta):
 
 
 class DFSStrategy(BFSStrategy, metaclass=ABCMeta):
+    hooks = BFSStrategy.hooks | {"on_edge_to_visited"}
+
     @abstractmethod
     def on_edge_to_visited(self, vertex: Vertex, neighbour: Vertex):
         pass
 
 
 class EmptyStrategy(DFSStrategy):
+    @property
+    def hooks(self):
+        # Only callbacks overridden in subclasses or instances do anything, so searching skips
+        # all the others.
+        return frozenset(
+            name for name in DFSStrategy.hooks
+            if getattr(type(self), name) is not getattr(EmptyStrategy, name)
+            or name in getattr(self, "__dict__", {}))
+
     def for_root(self, root: Vertex):
         pass
 
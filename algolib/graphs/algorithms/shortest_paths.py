@@ -1,9 +1,20 @@
 # -*- coding: utf-8 -*-
 """Algorithms for shortest paths in a weighted graph."""
+from array import array
 from collections import deque
+from collections.abc import Mapping
+from heapq import heappop, heappush
+from itertools import count
 import math
-from typing import Dict, Tuple
+from multiprocessing import Pool
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ...geometry import dim2, dim3
 from ..directed_graph import DirectedGraph
 from ..graph import Graph
 from ..vertex import Vertex
@@ -13,80 +24,592 @@ class Paths:
     INFINITY = math.inf
 
 
-def bellman_ford(graph: DirectedGraph, source: Vertex) -> Dict[Vertex, float]:
+class NegativeCycleError(ValueError):
+    def __init__(self, cycle: List[Vertex]):
+        super().__init__(f"Graph contains a negative cycle: {cycle}")
+        self.cycle = cycle
+
+
+def bellman_ford(graph: DirectedGraph, source: Vertex, *,
+                 predecessors: Optional[Dict[Vertex, Vertex]] = None) -> Dict[Vertex, float]:
     """Computes shortest paths in given directed graph from given vertex using Bellman-Ford
-    algorithm.
+    algorithm with a queue of vertices, whose distances have changed.
 
     :param graph: the directed weighted graph
     :param source: the source vertex
-    :return: the dictionary of distances to each vertex"""
+    :param predecessors: the dictionary to fill with predecessors of reached vertices on their
+        shortest paths, or ``None`` if not needed
+    :return: the dictionary of distances to each vertex
+    :raise NegativeCycleError: if the graph contains a negative cycle reachable from the source"""
     distances = {v: Paths.INFINITY for v in graph.vertices}
     distances[source] = 0.0
+    parents = _relax_from(graph, graph.edge_column("weight"), distances, [source])
 
-    for _ in range(graph.vertices_count - 1):
-        for edge in graph.edges:
-            distances[edge.destination] = \
-                min(distances[edge.destination],
-                    distances[edge.source] + graph.properties[edge].weight)
-
-    for edge in graph.edges:
-        if distances[edge.source] < Paths.INFINITY \
-                and distances[edge.source] + graph.properties[edge].weight \
-                < distances[edge.destination]:
-            raise ValueError("Graph contains a negative cycle")
+    if predecessors is not None:
+        predecessors.update(parents)
 
     return distances
 
 
-def dijkstra(graph: Graph, source: Vertex) -> Dict[Vertex, float]:
+def dijkstra(graph: Graph, source: Vertex, *, targets: Optional[Iterable[Vertex]] = None,
+             max_distance: float = Paths.INFINITY,
+             predecessors: Optional[Dict[Vertex, Vertex]] = None) -> Dict[Vertex, float]:
     """Computes shortest paths in given graph from given vertex using Dijkstra algorithm.
 
     :param graph: the weighted graph with non-negative weights
     :param source: the source vertex
-    :return: The dictionary of distances to each vertex
+    :param targets: the vertices which end searching once all are reached, or ``None`` to search
+        the whole graph
+    :param max_distance: the maximal distance, vertices further from the source are not reached
+    :param predecessors: the dictionary to fill with predecessors of reached vertices on their
+        shortest paths, or ``None`` if not needed
+    :return: The dictionary of distances to each vertex, infinite for vertices not reached
+    :raise ValueError: if an edge with negative weight is reached"""
+    remaining = None if targets is None else set(targets)
+    distances = dict.fromkeys(graph.vertices, Paths.INFINITY)
+
+    for vertex, distance, parent in _dijkstra_settled(graph, source, max_distance):
+        distances[vertex] = distance
+
+        if predecessors is not None and parent is not None:
+            predecessors[vertex] = parent
+
+        if remaining is not None:
+            remaining.discard(vertex)
+
+            if len(remaining) == 0:
+                break
+
+    return distances
+
+
+def multi_source_dijkstra(graph: Graph, sources: Iterable[Vertex]) \
+        -> Dict[Vertex, Tuple[Vertex, float]]:
+    """Computes shortest paths in given graph from the nearest of given vertices using Dijkstra
+    algorithm started from all of them at once. Ties are resolved in favour of the source given
+    earlier.
+
+    :param graph: the weighted graph with non-negative weights
+    :param sources: the source vertices
+    :return: the dictionary of the nearest source and the distance from it to each reachable
+        vertex
     :raise ValueError: if the graph contains an edge with negative weight"""
-    if any(graph.properties[edge].weight < 0.0 for edge in graph.edges):
+    weights = graph.edge_column("weight")
+
+    if min(weights.values, default=0.0) < 0.0:
         raise ValueError("Graph contains an edge with negative weight")
 
-    vertex_queue = deque()
-    vertex_queue.append((0.0, source))
-    visited = set()
-    distances = {v: Paths.INFINITY for v in graph.vertices}
-    distances[source] = 0.0
+    nearest = {}
+    # Best distance with rank of its source found so far for each vertex
+    reached = {}
+    ranked_sources = []
+    counter = count()
+    vertex_heap = []
 
-    while len(vertex_queue) > 0:
-        vertex = vertex_queue.popleft()[1]
+    for source in sources:
+        if source not in reached:
+            reached[source] = (0.0, len(ranked_sources))
+            vertex_heap.append((0.0, len(ranked_sources), next(counter), source))
+            ranked_sources.append(source)
 
-        if vertex not in visited:
-            visited.add(vertex)
+    while len(vertex_heap) > 0:
+        distance, rank, _, vertex = heappop(vertex_heap)
 
-            for edge in graph.adjacent_edges(vertex):
-                neighbour = edge.get_neighbour(vertex)
+        if vertex in nearest:
+            continue
 
-                if distances[vertex] + graph.properties[edge].weight < distances[neighbour]:
-                    distances[neighbour] = distances[vertex] + graph.properties[edge].weight
-                    vertex_queue.append((distances[neighbour], neighbour))
+        nearest[vertex] = (ranked_sources[rank], distance)
 
-    return distances
+        for edge in graph.adjacent_edges(vertex):
+            neighbour = edge.get_neighbour(vertex)
+            label = (distance + weights[edge], rank)
+
+            if label < reached.get(neighbour, (Paths.INFINITY, rank)):
+                reached[neighbour] = label
+                heappush(vertex_heap, (*label, next(counter), neighbour))
+
+    return nearest
+
+
+def bidirectional_dijkstra(graph: Graph, source: Vertex, target: Vertex) \
+        -> Tuple[float, List[Vertex]]:
+    """Computes the shortest path in given graph between given vertices using Dijkstra algorithm
+    simultaneously forwards from the source and backwards from the target.
+
+    :param graph: the weighted graph with non-negative weights; a directed simple graph should keep
+        incoming edges (``incoming=True``), otherwise each backward step scans all edges
+    :param source: the source vertex
+    :param target: the target vertex
+    :return: the distance and the vertices on the path from the source to the target, or infinite
+        distance and empty list if the target is not reachable
+    :raise ValueError: if an edge with negative weight is reached"""
+    if source == target:
+        return 0.0, [source]
+
+    weight = _weight_reader(graph)
+    # Backward search follows edges incoming to vertices, i.e. it searches the transposed graph.
+    backward_edges = graph.incoming_edges if isinstance(graph, DirectedGraph) \
+        else graph.adjacent_edges
+    forward = _SearchFront(source, graph.adjacent_edges, weight)
+    backward = _SearchFront(target, backward_edges, weight)
+    best_distance = Paths.INFINITY
+    meeting_vertex = None
+
+    while len(forward.heap) > 0 and len(backward.heap) > 0:
+        if forward.heap[0][0] + backward.heap[0][0] >= best_distance:
+            break
+
+        front, other = (forward, backward) if forward.heap[0][0] <= backward.heap[0][0] \
+            else (backward, forward)
+
+        for neighbour, distance in front.settle_next():
+            if neighbour in other.distances \
+                    and distance + other.distances[neighbour] < best_distance:
+                best_distance = distance + other.distances[neighbour]
+                meeting_vertex = neighbour
+
+    if meeting_vertex is None:
+        return Paths.INFINITY, []
+
+    path = reconstruct_path(forward.parents, source, meeting_vertex)
+    path.extend(reversed(reconstruct_path(backward.parents, target, meeting_vertex)[:-1]))
+    return best_distance, path
+
+
+def a_star(graph: Graph, source: Vertex, target: Vertex,
+           heuristic: Callable[[Vertex, Vertex], float]) -> Tuple[float, List[Vertex]]:
+    """Computes the shortest path in given graph between given vertices using A* algorithm.
+
+    :param graph: the weighted graph with non-negative weights
+    :param source: the source vertex
+    :param target: the target vertex
+    :param heuristic: the function estimating the distance from a vertex to the target, which
+        must never overestimate it
+    :return: the distance and the vertices on the path from the source to the target, or infinite
+        distance and empty list if the target is not reachable
+    :raise ValueError: if an edge with negative weight is reached"""
+    weight = _weight_reader(graph)
+    distances = {source: 0.0}
+    predecessors = {}
+    estimates = {source: heuristic(source, target)}
+    counter = count()
+    vertex_heap = [(estimates[source], next(counter), 0.0, source)]
+
+    while len(vertex_heap) > 0:
+        _, _, distance, vertex = heappop(vertex_heap)
 
+        if distance > distances[vertex]:
+            continue
 
-def floyd_warshall(graph: DirectedGraph) -> Dict[Tuple[Vertex, Vertex], float]:
+        if vertex == target:
+            return distance, reconstruct_path(predecessors, source, target)
+
+        for edge in graph.adjacent_edges(vertex):
+            neighbour = edge.get_neighbour(vertex)
+            new_distance = distance + weight(edge)
+
+            if new_distance < distances.get(neighbour, Paths.INFINITY):
+                if neighbour not in estimates:
+                    estimates[neighbour] = heuristic(neighbour, target)
+
+                distances[neighbour] = new_distance
+                predecessors[neighbour] = vertex
+                heappush(vertex_heap,
+                         (new_distance + estimates[neighbour], next(counter), new_distance,
+                          neighbour))
+
+    return Paths.INFINITY, []
+
+
+def euclidean_heuristic_2d(graph: Graph) -> Callable[[Vertex, Vertex], float]:
+    """Creates A* heuristic of Euclidean distance between points in the plane stored as
+    properties of vertices in given graph.
+
+    :param graph: the graph with ``Point2D`` vertex properties
+    :return: the heuristic function"""
+    return lambda vertex, target: dim2.distance(graph.properties[vertex],
+                                                graph.properties[target])
+
+
+def euclidean_heuristic_3d(graph: Graph) -> Callable[[Vertex, Vertex], float]:
+    """Creates A* heuristic of Euclidean distance between points in the space stored as
+    properties of vertices in given graph.
+
+    :param graph: the graph with ``Point3D`` vertex properties
+    :return: the heuristic function"""
+    return lambda vertex, target: dim3.distance(graph.properties[vertex],
+                                                graph.properties[target])
+
+
+def floyd_warshall(graph: DirectedGraph, *,
+                   next_hops: Optional[Dict[Tuple[Vertex, Vertex], Vertex]] = None) \
+        -> "DistanceMatrix":
     """Computes shortest paths in given directed graph between all vertices using Floyd-Warshall
-    algorithm.
+    algorithm. Relaxation runs on whole rows of a dense matrix, using NumPy if it is installed.
+
+    :param graph: the directed weighted graph
+    :param next_hops: the dictionary to fill with the vertex following the first vertex of each
+        pair on their shortest path, or ``None`` if not needed
+    :return: the matrix of distances between each pair of vertices"""
+    vertices = list(graph.vertices)
+    indices = {vertex: i for i, vertex in enumerate(vertices)}
+    size = len(vertices)
+    matrix = [[Paths.INFINITY] * size for _ in range(size)]
+    hops = None if next_hops is None else [[-1] * size for _ in range(size)]
+
+    for i in range(size):
+        matrix[i][i] = 0.0
+
+    weights = graph.edge_column("weight")
+
+    for edge, weight in zip(weights.edges, weights.values):
+        source, destination = indices[edge.source], indices[edge.destination]
+        matrix[source][destination] = weight
+
+        if hops is not None:
+            hops[source][destination] = destination
+
+    if numpy is not None:
+        values = _relax_rows_numpy(matrix, hops)
+    else:
+        _relax_rows(matrix, hops)
+        values = array("d", [distance for row in matrix for distance in row])
+
+    if hops is not None:
+        next_hops.update(((vertices[i], vertices[j]), vertices[hop])
+                         for i, row in enumerate(hops) for j, hop in enumerate(row) if hop >= 0)
+
+    return DistanceMatrix(vertices, values)
+
+
+class DistanceMatrix(Mapping):
+    def __init__(self, vertices: List[Vertex], values: array):
+        if len(values) != len(vertices) * len(vertices):
+            raise ValueError("Number of values is not the square of number of vertices")
+
+        self.vertices = vertices  # Vertices in order of their indices
+        self.values = values  # Distances by rows in contiguous buffer
+        self._indices = {vertex: i for i, vertex in enumerate(vertices)}
+
+    def __getitem__(self, pair: Tuple[Vertex, Vertex]) -> float:
+        """Gets the distance between given pair of vertices.
+
+        :param pair: the source vertex and the destination vertex
+        :return: the distance from the source to the destination
+        :raise KeyError: if any of the vertices does not exist in this matrix"""
+        source, destination = pair
+        return self.values[self._indices[source] * len(self.vertices)
+                           + self._indices[destination]]
+
+    def __iter__(self):
+        return ((source, destination) for source in self.vertices
+                for destination in self.vertices)
+
+    def __len__(self):
+        return len(self.values)
+
+    def row(self, source: Vertex) -> Dict[Vertex, float]:
+        """Gets distances from given vertex to each vertex.
+
+        :param source: the source vertex
+        :return: the dictionary of distances to each vertex
+        :raise KeyError: if the vertex does not exist in this matrix"""
+        begin = self._indices[source] * len(self.vertices)
+        return dict(zip(self.vertices, self.values[begin:begin + len(self.vertices)]))
+
+
+def johnson(graph: DirectedGraph, *, processes: Optional[int] = None) \
+        -> Iterator[Tuple[Vertex, Dict[Vertex, float]]]:
+    """Computes shortest paths in given directed graph between all vertices using Johnson
+    algorithm. Edges are reweighted to non-negative weights using Bellman-Ford algorithm, then
+    Dijkstra algorithm is run from each vertex.
 
     :param graph: the directed weighted graph
-    :return: the dictionary of distances between each pair of vertices"""
-    distances = {(v, u): 0.0 if v == u else Paths.INFINITY for v in graph.vertices
-                 for u in graph.vertices}
+    :param processes: the number of worker processes to run Dijkstra algorithm in parallel, or
+        ``None`` to run it in the current process
+    :return: the generator of each source vertex with the dictionary of distances to each vertex
+    :raise NegativeCycleError: if the graph contains a negative cycle"""
+    weights = graph.edge_column("weight")
+    vertices = list(graph.vertices)
+    potentials = dict.fromkeys(vertices, 0.0)
+    _relax_from(graph, weights, potentials, vertices)
+
+    indices = {vertex: i for i, vertex in enumerate(vertices)}
+    adjacency = [[] for _ in vertices]
+
+    for edge, weight in zip(weights.edges, weights.values):
+        # Reweighted edges are non-negative, up to rounding errors.
+        adjacency[indices[edge.source]].append(
+            (indices[edge.destination],
+             max(0.0, weight + potentials[edge.source] - potentials[edge.destination])))
+
+    return _johnson_results(vertices, [potentials[v] for v in vertices], adjacency, processes)
+
+
+def reconstruct_path(predecessors: Dict[Vertex, Vertex], source: Vertex, target: Vertex) \
+        -> List[Vertex]:
+    """Reconstructs the shortest path between given vertices from predecessors computed by a
+    single source algorithm.
+
+    :param predecessors: the predecessors of vertices on shortest paths from the source
+    :param source: the source vertex
+    :param target: the target vertex
+    :return: the vertices on the path from the source to the target, or empty list if the target
+        is not reachable"""
+    if target != source and target not in predecessors:
+        return []
+
+    path = [target]
+
+    while path[-1] != source:
+        path.append(predecessors[path[-1]])
+
+    path.reverse()
+    return path
+
+
+def reconstruct_path_from_hops(next_hops: Dict[Tuple[Vertex, Vertex], Vertex], source: Vertex,
+                               target: Vertex) -> List[Vertex]:
+    """Reconstructs the shortest path between given vertices from next hops computed by an
+    all-pairs algorithm.
+
+    :param next_hops: the next vertices on shortest paths between pairs of vertices
+    :param source: the source vertex
+    :param target: the target vertex
+    :return: the vertices on the path from the source to the target, or empty list if the target
+        is not reachable"""
+    if target != source and (source, target) not in next_hops:
+        return []
+
+    path = [source]
+
+    while path[-1] != target:
+        path.append(next_hops[(path[-1], target)])
+
+    return path
+
+
+def _weight_reader(graph):
+    # Extracts weights once into a column and checks them when edges are relaxed, so negative
+    # weights in parts of the graph that are not reached do not fail searching.
+    weights = graph.edge_column("weight")
+    values = dict(zip(weights.edges, weights.values))
+
+    def weight(edge):
+        value = values[edge]
+
+        if value < 0.0:
+            raise ValueError("Graph contains an edge with negative weight")
+
+        return value
+
+    return weight
+
+
+def _dijkstra_settled(graph, source, max_distance):
+    # Yields vertices in order of settling with their distances and parents on shortest paths.
+    weight = _weight_reader(graph)
+    reached_distances = {source: 0.0}
+    counter = count()
+    vertex_heap = [(0.0, next(counter), source, None)]
+
+    while len(vertex_heap) > 0:
+        distance, _, vertex, parent = heappop(vertex_heap)
+
+        if distance > reached_distances[vertex]:
+            continue
+
+        yield vertex, distance, parent
+
+        for edge in graph.adjacent_edges(vertex):
+            neighbour = edge.get_neighbour(vertex)
+            new_distance = distance + weight(edge)
+
+            if new_distance <= max_distance \
+                    and new_distance < reached_distances.get(neighbour, Paths.INFINITY):
+                reached_distances[neighbour] = new_distance
+                heappush(vertex_heap, (new_distance, next(counter), neighbour, vertex))
+
+
+class _SearchFront:
+    def __init__(self, start, next_edges, weight):
+        self._next_edges = next_edges
+        self._weight = weight
+        self._counter = count()
+        self.distances = {start: 0.0}
+        self.parents = {}
+        self.heap = [(0.0, next(self._counter), start)]
+
+    def settle_next(self):
+        # Settles the nearest vertex and yields its neighbours with improved distances.
+        distance, _, vertex = heappop(self.heap)
+
+        if distance > self.distances[vertex]:
+            return
+
+        for edge in self._next_edges(vertex):
+            neighbour = edge.get_neighbour(vertex)
+            new_distance = distance + self._weight(edge)
+
+            if new_distance < self.distances.get(neighbour, Paths.INFINITY):
+                self.distances[neighbour] = new_distance
+                self.parents[neighbour] = vertex
+                heappush(self.heap, (new_distance, next(self._counter), neighbour))
+                yield neighbour, new_distance
+
+
+def _find_cycle(parents, vertex):
+    # Follows predecessors from given vertex and returns the first cycle found in their order on
+    # the cycle, or None if no cycle is reachable.
+    visited = set()
+
+    while vertex not in visited:
+        visited.add(vertex)
+        vertex = parents.get(vertex)
+
+        if vertex is None:
+            return None
+
+    cycle = [vertex]
+
+    while parents[cycle[-1]] != vertex:
+        cycle.append(parents[cycle[-1]])
+
+    cycle.reverse()
+    return cycle
 
-    for edge in graph.edges:
-        distances[(edge.source, edge.destination)] = graph.properties[edge].weight
 
-    for vertex0 in graph.vertices:
-        for vertex1 in graph.vertices:
-            for vertex2 in graph.vertices:
-                distances[(vertex1, vertex2)] = \
-                    min(distances[(vertex1, vertex2)],
-                        distances[(vertex1, vertex0)] + distances[(vertex0, vertex2)])
+def _relax_from(graph, weights, distances, sources):
+    # Relaxes edges going out of vertices with changed distances, starting from given vertices,
+    # until no distance changes. Returns the predecessors of vertices with changed distances.
+    parents = {}
+    # Numbers of edges on current paths, reaching number of vertices only with a negative cycle
+    path_lengths = dict.fromkeys(sources, 0)
+    vertex_queue = deque(sources)
+    queued = set(sources)
+
+    while len(vertex_queue) > 0:
+        vertex = vertex_queue.popleft()
+        queued.discard(vertex)
+
+        for edge in graph.adjacent_edges(vertex):
+            neighbour = edge.get_neighbour(vertex)
+            new_distance = distances[vertex] + weights[edge]
+
+            if new_distance < distances[neighbour]:
+                distances[neighbour] = new_distance
+                parents[neighbour] = vertex
+                path_lengths[neighbour] = path_lengths[vertex] + 1
+
+                if path_lengths[neighbour] >= graph.vertices_count:
+                    cycle = _find_cycle(parents, neighbour)
+
+                    if cycle is not None:
+                        raise NegativeCycleError(cycle)
+
+                if neighbour not in queued:
+                    vertex_queue.append(neighbour)
+                    queued.add(neighbour)
+
+    return parents
+
+
+def _johnson_results(vertices, potentials, adjacency, processes):
+    if processes is None:
+        yield from _restored_distances(
+            vertices, potentials, (_indexed_dijkstra(adjacency, i) for i in range(len(vertices))))
+    else:
+        # Workers are terminated when results are exhausted or the generator is closed.
+        with Pool(processes, _init_johnson_worker, (adjacency,)) as pool:
+            yield from _restored_distances(
+                vertices, potentials,
+                pool.imap(_johnson_worker, range(len(vertices)),
+                          chunksize=max(1, len(vertices) // (4 * processes))))
+
+
+def _restored_distances(vertices, potentials, all_distances):
+    for source, distances in enumerate(all_distances):
+        # Distances are restored to original weights, which is exact for unreachable vertices,
+        # since infinity is not changed by adding potentials.
+        yield vertices[source], {vertex: distances[i] - potentials[source] + potentials[i]
+                                 for i, vertex in enumerate(vertices)}
+
+
+def _indexed_dijkstra(adjacency, source):
+    # Computes distances from given vertex in graph of vertex indices with non-negative weights.
+    distances = array("d", [Paths.INFINITY]) * len(adjacency)
+    distances[source] = 0.0
+    vertex_heap = [(0.0, source)]
+
+    while len(vertex_heap) > 0:
+        distance, vertex = heappop(vertex_heap)
+
+        if distance > distances[vertex]:
+            continue
+
+        for neighbour, weight in adjacency[vertex]:
+            new_distance = distance + weight
+
+            if new_distance < distances[neighbour]:
+                distances[neighbour] = new_distance
+                heappush(vertex_heap, (new_distance, neighbour))
 
     return distances
+
+
+_WORKER_ADJACENCY = None
+
+
+def _init_johnson_worker(adjacency):
+    global _WORKER_ADJACENCY  # pylint: disable=global-statement
+    _WORKER_ADJACENCY = adjacency
+
+
+def _johnson_worker(source):
+    return _indexed_dijkstra(_WORKER_ADJACENCY, source)
+
+
+def _relax_rows(matrix, hops):
+    # Relaxes distances through each vertex, replacing each row as a whole.
+    for k in range(len(matrix)):
+        for i, row_i in enumerate(matrix):
+            distance_ik = row_i[k]
+
+            if distance_ik == Paths.INFINITY:
+                continue
+
+            candidates = [distance_ik + distance for distance in matrix[k]]
+
+            if hops is None:
+                matrix[i] = [distance if distance <= candidate else candidate
+                             for distance, candidate in zip(row_i, candidates)]
+            else:
+                hop_ik = hops[i][k]
+
+                for j, candidate in enumerate(candidates):
+                    if candidate < row_i[j]:
+                        row_i[j] = candidate
+                        hops[i][j] = hop_ik
+
+
+def _relax_rows_numpy(matrix, hops):
+    # Relaxes distances through each vertex with operations on whole matrix.
+    distances = numpy.array(matrix, dtype=numpy.float64).reshape(len(matrix), len(matrix))
+    hop_indices = None if hops is None else numpy.array(hops, dtype=numpy.int64).reshape(
+        distances.shape)
+
+    for k in range(len(matrix)):
+        candidates = distances[:, k, None] + distances[None, k, :]
+
+        if hop_indices is not None:
+            hop_indices = numpy.where(candidates < distances, hop_indices[:, k, None],
+                                      hop_indices)
+
+        numpy.minimum(distances, candidates, out=distances)
+
+    if hop_indices is not None:
+        hops[:] = hop_indices.tolist()
+
+    values = array("d")
+    values.frombytes(distances.tobytes())
+    return values
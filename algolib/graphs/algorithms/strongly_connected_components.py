@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 """Algorithm for strongly connected components."""
+from array import array
 from typing import Iterable, Set
 
-from .searching import dfs_recursive
-from .searching_strategy import DFSStrategy
-from ..directed_graph import DirectedGraph
+from ..csr_graph import CsrGraph
+from ..directed_graph import DirectedGraph, DirectedSimpleGraph
 from ..vertex import Vertex
 
 
@@ -13,53 +13,106 @@ def find_scc(graph: DirectedGraph) -> Iterable[Set[Vertex]]:
 
     :param graph: the directed graph
     :return: the vertices in strongly connected components"""
-    post_order_strategy = _PostOrderStrategy()
-    dfs_recursive(graph, post_order_strategy, graph.vertices)
-    vertices = [vertex for vertex, _ in sorted(post_order_strategy.post_times.items(),
-                                               key=lambda item: item[1], reverse=True)]
-    reversed_graph = graph.reversed_copy()
-    scc_strategy = _SCCStrategy()
-    dfs_recursive(reversed_graph, scc_strategy, vertices)
-    return iter(scc_strategy.components)
+    scc_ids = find_scc_ids(graph)
+    components = [set() for _ in range(max(scc_ids, default=-1) + 1)]
 
+    for vertex, scc_id in zip(graph.vertices, scc_ids):
+        components[scc_id].add(vertex)
 
-class _PostOrderStrategy(DFSStrategy):
-    def __init__(self):
-        self.post_times = {}
-        self._timer = 0
+    return iter(components)
 
-    def for_root(self, root):
-        pass
 
-    def on_entry(self, vertex):
-        pass
+def find_scc_ids(graph: DirectedGraph) -> array:
+    """Computes strongly connected components in given directed graph using non-recursive Tarjan
+    algorithm. Components are numbered in topological order of the condensation of the graph, so
+    each edge between different components leads to a component with greater identifier.
 
-    def on_next_vertex(self, vertex, neighbour):
-        pass
+    :param graph: the directed graph
+    :return: the identifiers of components indexed by positions of vertices in the graph"""
+    neighbours = _indexed_neighbours(graph)
+    vertices_count = graph.vertices_count
+    pre_times = array("q", [-1]) * vertices_count
+    low_times = array("q", [0]) * vertices_count
+    scc_ids = array("q", [-1]) * vertices_count
+    # Vertices visited and not yet assigned to any component.
+    vertex_stack = []
+    timer = 0
+    scc_count = 0
+
+    for root in range(vertices_count):
+        if pre_times[root] >= 0:
+            continue
+
+        pre_times[root] = low_times[root] = timer
+        timer += 1
+        vertex_stack.append(root)
+        # Each frame holds a vertex with iterator over its remaining neighbours.
+        path_stack = [(root, neighbours(root))]
+
+        while len(path_stack) > 0:
+            vertex, remaining = path_stack[-1]
+
+            for neighbour in remaining:
+                if pre_times[neighbour] < 0:
+                    pre_times[neighbour] = low_times[neighbour] = timer
+                    timer += 1
+                    vertex_stack.append(neighbour)
+                    path_stack.append((neighbour, neighbours(neighbour)))
+                    break
+
+                if scc_ids[neighbour] < 0 and pre_times[neighbour] < low_times[vertex]:
+                    low_times[vertex] = pre_times[neighbour]
+            else:
+                path_stack.pop()
+
+                if len(path_stack) > 0:
+                    parent = path_stack[-1][0]
+                    low_times[parent] = min(low_times[parent], low_times[vertex])
+
+                if low_times[vertex] == pre_times[vertex]:
+                    _pop_component(vertex_stack, vertex, scc_ids, scc_count)
+                    scc_count += 1
+
+    # Tarjan algorithm finds components in reversed topological order.
+    return array("q", (scc_count - 1 - scc_id for scc_id in scc_ids))
+
+
+def condensation(graph: DirectedGraph, scc_ids: array) -> DirectedSimpleGraph:
+    """Builds the condensation of given directed graph, which is the acyclic graph of its strongly
+    connected components with an edge wherever any edge joins vertices of different components.
 
-    def on_exit(self, vertex):
-        self.post_times[vertex] = self._timer
-        self._timer += 1
+    :param graph: the directed graph
+    :param scc_ids: the identifiers of components indexed by positions of vertices in the graph
+    :return: the graph with vertices identified by identifiers of components"""
+    indices = {vertex: i for i, vertex in enumerate(graph.vertices)}
+    edges = {(scc_ids[indices[edge.source]], scc_ids[indices[edge.destination]])
+             for edge in graph.edges}
+    return DirectedSimpleGraph.from_edges(sorted(edge for edge in edges if edge[0] != edge[1]),
+                                          range(max(scc_ids, default=-1) + 1))
 
-    def on_edge_to_visited(self, vertex, neighbour):
-        pass
 
+def _indexed_neighbours(graph):
+    # Creates function of iterator over positions of neighbours of the vertex at given position.
+    if isinstance(graph, CsrGraph):
+        offsets, targets = graph.compressed_rows()
 
-class _SCCStrategy(DFSStrategy):
-    def __init__(self):
-        self.components = []
+        def neighbours(index):
+            return iter(targets[offsets[index]:offsets[index + 1]])
+    else:
+        vertices = list(graph.vertices)
+        indices = {vertex: i for i, vertex in enumerate(vertices)}
 
-    def for_root(self, root):
-        self.components.append(set())
+        def neighbours(index):
+            vertex = vertices[index]
+            return (indices[edge.get_neighbour(vertex)] for edge in graph.adjacent_edges(vertex))
 
-    def on_entry(self, vertex):
-        self.components[-1].add(vertex)
+    return neighbours
 
-    def on_next_vertex(self, vertex, neighbour):
-        pass
 
-    def on_exit(self, vertex):
-        pass
+def _pop_component(vertex_stack, vertex, scc_ids, scc_id):
+    # Assigns the component to all vertices on the stack down to its root vertex.
+    member = None
 
-    def on_edge_to_visited(self, vertex, neighbour):
-        pass
+    while member != vertex:
+        member = vertex_stack.pop()
+        scc_ids[member] = scc_id
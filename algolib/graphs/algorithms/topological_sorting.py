@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 """Algorithms for topological sorting of a directed acyclic graph."""
 from queue import PriorityQueue
-from typing import List
+from typing import Any, List
 
 from .searching import dfs_recursive
 from .searching_strategy import DFSStrategy
 from ..directed_graph import DirectedGraph
+from ..edge import Edge
 from ..vertex import Vertex
 
 
@@ -61,6 +62,97 @@ def dfs_topological_sort(graph: DirectedGraph) -> List[Vertex]:
     return list(reversed(strategy.order))
 
 
+class DynamicTopologicalOrder:
+    def __init__(self, graph: DirectedGraph):
+        """Topologically sorts the vertices of given directed acyclic graph, whose order is later
+        updated when edges are added through this structure.
+
+        :param graph: the directed acyclic graph; a directed simple graph should keep incoming
+            edges (``incoming=True``), otherwise each backward step scans all edges
+        :raise DirectedCyclicGraphError: if the graph contains a cycle"""
+        self.graph = graph
+        self._vertices = dfs_topological_sort(graph)
+        self._positions = {vertex: i for i, vertex in enumerate(self._vertices)}
+
+    @property
+    def order(self) -> List[Vertex]:
+        """Gets the current topological order of vertices.
+
+        :return: the topological order of vertices"""
+        return list(self._vertices)
+
+    def comes_before(self, vertex1: Vertex, vertex2: Vertex) -> bool:
+        """Checks whether given vertex comes before another one in current topological order.
+
+        :param vertex1: the first vertex
+        :param vertex2: the second vertex
+        :return: ``True`` if the first vertex is earlier in the order, otherwise ``False``
+        :raise KeyError: if either vertex does not belong to the graph"""
+        return self._positions[vertex1] < self._positions[vertex2]
+
+    def add_edge_between(self, source: Vertex, destination: Vertex, property_: Any = None) -> Edge:
+        """Adds new edge between given vertices to the graph and updates the order using
+        Pearce-Kelly algorithm. Only vertices between the endpoints in current order are searched
+        and moved.
+
+        :param source: the source vertex
+        :param destination: the destination vertex
+        :param property_: the edge property
+        :return: the created edge
+        :raise DirectedCyclicGraphError: if the edge closes a cycle, then the graph is unchanged
+        :raise ValueError: if the edge already exists or either vertex does not belong to the
+            graph"""
+        for vertex in (source, destination):
+            if vertex not in self._positions:
+                try:
+                    self.graph.get_vertex(vertex.id)
+                except KeyError:
+                    raise ValueError(f"Vertex {vertex} does not belong to the graph") from None
+
+                self._positions[vertex] = len(self._vertices)
+                self._vertices.append(vertex)
+
+        if source == destination:
+            raise DirectedCyclicGraphError("The edge closes a cycle")
+
+        lower, upper = self._positions[destination], self._positions[source]
+
+        if upper < lower:
+            return self.graph.add_edge_between(source, destination, property_)
+
+        forward = self._search(destination, self.graph.neighbours, lower, upper)
+
+        if source in forward:
+            raise DirectedCyclicGraphError("The edge closes a cycle")
+
+        edge = self.graph.add_edge_between(source, destination, property_)
+        backward = self._search(source, self.graph.predecessors, lower, upper)
+        # Vertices reaching the source move before vertices reachable from the destination.
+        moved = sorted(backward, key=self._positions.get)
+        moved.extend(sorted(forward, key=self._positions.get))
+        positions = sorted(self._positions[vertex] for vertex in moved)
+
+        for vertex, position in zip(moved, positions):
+            self._positions[vertex] = position
+            self._vertices[position] = vertex
+
+        return edge
+
+    def _search(self, start, neighbours, lower, upper):
+        reached = {start}
+        vertex_stack = [start]
+
+        while len(vertex_stack) > 0:
+            vertex = vertex_stack.pop()
+
+            for neighbour in neighbours(vertex):
+                if neighbour not in reached and lower <= self._positions[neighbour] <= upper:
+                    reached.add(neighbour)
+                    vertex_stack.append(neighbour)
+
+        return reached
+
+
 class _TopologicalStrategy(DFSStrategy):
     def __init__(self):
         self.order = []
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 """Algorithm for computing diameter of a tree."""
-from typing import Tuple
-
+from ..edge_column import EdgeColumn
 from ..tree_graph import TreeGraph
 from ..vertex import Vertex
 
@@ -13,23 +12,52 @@ def count_diameter(tree: TreeGraph) -> float:
     :return: the length of the tree diameter"""
     root = max(tree.vertices, key=tree.output_degree, default=None)
 
-    return 0.0 if root is None else _dfs(tree, root, root)[1]
+    return 0.0 if root is None else _dfs(tree, tree.edge_column("weight"), root)
+
+
+def _dfs(tree: TreeGraph, weights: EdgeColumn, root: Vertex) -> float:
+    # Computes longest paths for subtrees in reversed depth-first preorder, so children are
+    # always computed before their parents.
+    order, parents = _preorder(tree, root)
+    # Longest path from vertex down into its subtree and longest path inside its subtree
+    paths_from = {}
+    paths_subtree = {}
+
+    for vertex in reversed(order):
+        path_from = 0.0
+        path_subtree = 0.0
+        path_through = 0.0
+
+        for edge in tree.adjacent_edges(vertex):
+            neighbour = edge.get_neighbour(vertex)
+
+            if neighbour != parents[vertex]:
+                result_from = paths_from.pop(neighbour) + weights[edge]
+                result_subtree = paths_subtree.pop(neighbour)
+
+                path_through = max(path_through, path_from + result_from)
+                path_subtree = max(path_subtree, result_subtree)
+                path_from = max(path_from, result_from)
+
+        paths_from[vertex] = path_from
+        paths_subtree[vertex] = max(path_through, path_subtree)
 
+    return paths_subtree[root]
 
-def _dfs(tree: TreeGraph, vertex: Vertex, parent: Vertex) -> Tuple[float, float]:
-    path_from = 0.0
-    path_subtree = 0.0
-    path_through = 0.0
 
-    for edge in tree.adjacent_edges(vertex):
-        neighbour = edge.get_neighbour(vertex)
+def _preorder(tree, root):
+    # Visits vertices in depth-first preorder with explicit stack.
+    parents = {root: root}
+    order = []
+    vertex_stack = [root]
 
-        if neighbour != parent:
-            weight = tree.properties[edge].weight
-            result_from, result_subtree = _dfs(tree, neighbour, vertex)
+    while len(vertex_stack) > 0:
+        vertex = vertex_stack.pop()
+        order.append(vertex)
 
-            path_through = max(path_through, path_from + result_from + weight)
-            path_subtree = max(path_subtree, result_subtree)
-            path_from = max(path_from, result_from + weight)
+        for neighbour in tree.neighbours(vertex):
+            if neighbour != parents[vertex]:
+                parents[neighbour] = vertex
+                vertex_stack.append(neighbour)
 
-    return path_from, max(path_through, path_subtree)
+    return order, parents
@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+"""Structure of frozen graph in compressed sparse row format."""
+from abc import ABCMeta, abstractmethod
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterable, Tuple
+
+from .directed_graph import DirectedGraph
+from .edge import Edge
+from .edge_column import EdgeColumn
+from .graph import Graph, _column_values
+from .undirected_graph import UndirectedGraph
+from .vertex import Vertex
+
+
+def _index_array(size, values=()):
+    # Creates array of indices with the smallest item type able to store given size.
+    return array("i" if size < 2 ** 31 else "q", values)
+
+
+class _CompressedRows:
+    def __init__(self, offsets, targets, edge_ids):
+        self.offsets = offsets  # Starting position of each row
+        self.targets = targets  # Vertex indices sorted inside each row
+        self.edge_ids = edge_ids  # Edge identifiers aligned with targets
+
+    def degree(self, index):
+        return self.offsets[index + 1] - self.offsets[index]
+
+    def row(self, index):
+        return range(self.offsets[index], self.offsets[index + 1])
+
+    def find(self, source, destination):
+        begin, end = self.offsets[source], self.offsets[source + 1]
+        position = bisect_left(self.targets, destination, begin, end)
+
+        if position < end and self.targets[position] == destination:
+            return self.edge_ids[position]
+
+        return None
+
+    @staticmethod
+    def build(vertices, sources, destinations, slot_edge_ids=None):
+        # Groups slots by source with counting sort, then sorts each row by destination.
+        vertices_count = len(vertices)
+        slots_count = len(sources)
+        offsets = _index_array(slots_count, [0]) * (vertices_count + 1)
+
+        for source in sources:
+            offsets[source + 1] += 1
+
+        for i in range(vertices_count):
+            offsets[i + 1] += offsets[i]
+
+        slots = _index_array(slots_count, [0]) * slots_count
+        positions = offsets[:-1]
+
+        for slot, source in enumerate(sources):
+            slots[positions[source]] = slot
+            positions[source] += 1
+
+        _CompressedRows._sort_rows(vertices, offsets, slots, destinations)
+        targets = _index_array(vertices_count, map(destinations.__getitem__, slots))
+        edge_ids = slots if slot_edge_ids is None \
+            else _index_array(slots_count, map(slot_edge_ids.__getitem__, slots))
+        return _CompressedRows(offsets, targets, edge_ids)
+
+    @staticmethod
+    def _sort_rows(vertices, offsets, slots, destinations):
+        # Sorts slots in each row by destination and checks for duplicated edges.
+        destination_of = destinations.__getitem__
+
+        for i, vertex in enumerate(vertices):
+            begin, end = offsets[i], offsets[i + 1]
+
+            if end - begin > 1:
+                row = sorted(slots[begin:end], key=destination_of)
+                row_targets = [destinations[slot] for slot in row]
+
+                if len(set(row_targets)) != len(row_targets):
+                    duplicate = next(t for t, u in zip(row_targets, row_targets[1:]) if t == u)
+                    raise ValueError(f"Edge between {vertex} and {vertices[duplicate]} "
+                                     "already exists")
+
+                slots[begin:end] = _index_array(len(slots), row)
+
+
+class CsrGraph(Graph, metaclass=ABCMeta):
+    def __init__(self, vertex_ids: Iterable[Any] = (), edges: Iterable[Tuple] = ()):
+        self._vertices = [Vertex(vertex_id) for vertex_id in vertex_ids]
+        self._indices = {vertex.id: i for i, vertex in enumerate(self._vertices)}
+
+        if len(self._indices) != len(self._vertices):
+            raise ValueError("Vertex identifiers are not unique")
+
+        self._vertex_properties = {}
+        self._edge_properties = {}
+        self._edge_sources = _index_array(0)
+        self._edge_destinations = _index_array(0)
+
+        for edge_id, edge in enumerate(edges):
+            self._edge_sources.append(self._index_or_add(edge[0]))
+            self._edge_destinations.append(self._index_or_add(edge[1]))
+
+            if len(edge) > 2 and edge[2] is not None:
+                self._edge_properties[edge_id] = edge[2]
+
+        self._rows = self._build_rows()
+        # Edge objects by identifiers, created once when edges are first requested
+        self._edge_objects = None
+        self._properties = self._GraphPropertiesImpl(self)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "CsrGraph":
+        """Creates the frozen copy of given graph with the same vertices, edges and properties.
+
+        :param graph: the graph
+        :return: the compressed copy of the graph"""
+        csr_graph = cls((v.id for v in graph.vertices),
+                        ((e.source.id, e.destination.id, graph.properties[e])
+                         for e in graph.edges))
+
+        for i, vertex in enumerate(csr_graph._vertices):
+            property_ = graph.properties[vertex]
+
+            if property_ is not None:
+                csr_graph._vertex_properties[i] = property_
+
+        return csr_graph
+
+    @classmethod
+    def _from_arrays(cls, vertices, edge_arrays, properties, rows=None):
+        # Creates graph sharing given vertices and arrays of edge endpoints, which are never
+        # modified, with copies of given dictionaries of vertex and edge properties.
+        graph = cls.__new__(cls)
+        graph._vertices = vertices
+        graph._indices = {vertex.id: i for i, vertex in enumerate(vertices)}
+        graph._edge_sources, graph._edge_destinations = edge_arrays
+        graph._vertex_properties, graph._edge_properties = (dict(p) for p in properties)
+        graph._rows = graph._build_rows() if rows is None else rows
+        graph._edge_objects = None
+        graph._properties = cls._GraphPropertiesImpl(graph)
+        return graph
+
+    @property
+    def properties(self):
+        return self._properties
+
+    @property
+    def vertices_count(self):
+        return len(self._vertices)
+
+    @property
+    def edges_count(self):
+        return len(self._edge_sources)
+
+    @property
+    def vertices(self):
+        return iter(self._vertices)
+
+    @property
+    def edges(self):
+        return iter(self._edge_list())
+
+    def get_vertex(self, vertex_id):
+        try:
+            return self._vertices[self._indices[vertex_id]]
+        except KeyError:
+            raise KeyError(f"Vertex not found : {vertex_id}") from None
+
+    def get_edge(self, source, destination):
+        source_id = source.id if isinstance(source, Vertex) else source
+        destination_id = destination.id if isinstance(destination, Vertex) else destination
+        edge_id = self._find_edge_id(source_id, destination_id)
+
+        if edge_id is None:
+            raise KeyError(f"Edge not found: {source_id}, {destination_id}")
+
+        return self._edge(edge_id)
+
+    def neighbours(self, vertex):
+        rows = self._rows
+        return [self._vertices[rows.targets[i]] for i in rows.row(self._index(vertex))]
+
+    def adjacent_edges(self, vertex):
+        return self._row_edges(self._rows, self._index(vertex))
+
+    def output_degree(self, vertex):
+        return self._rows.degree(self._index(vertex))
+
+    def vertex_index(self, vertex: Vertex) -> int:
+        """Gets the index of given vertex, which is its position in vertices of this graph.
+
+        :param vertex: the vertex
+        :return: the index of the vertex
+        :raise ValueError: if the vertex does not belong to this graph"""
+        return self._index(vertex)
+
+    def compressed_rows(self) -> Tuple[array, array]:
+        """Gets the adjacency of this graph as arrays of vertex indices. Neighbours of vertex with
+        index i are stored in the second array between positions given by the first array at
+        indices i and i + 1.
+
+        :return: the offsets of rows and the indices of neighbours"""
+        return self._rows.offsets, self._rows.targets
+
+    @abstractmethod
+    def compressed_incoming_rows(self) -> Tuple[array, array]:
+        """Gets the incoming adjacency of this graph as arrays of vertex indices, in the same
+        format as the adjacency.
+
+        :return: the offsets of rows and the indices of vertices with edges to given vertex"""
+
+    def edge_column(self, name="weight", typecode="d", default=None):
+        edges_count = len(self._edge_sources)
+        return EdgeColumn(list(self._edge_list()), _column_values(
+            map(self._edge_properties.get, range(edges_count)), name, typecode, default))
+
+    @abstractmethod
+    def _build_rows(self):
+        pass
+
+    def _edge(self, edge_id):
+        if self._edge_objects is not None:
+            return self._edge_objects[edge_id]
+
+        return Edge(self._vertices[self._edge_sources[edge_id]],
+                    self._vertices[self._edge_destinations[edge_id]])
+
+    def _edge_list(self):
+        # Traversals get the same edge objects on each call instead of creating new ones. They
+        # are created only when first requested, so graphs queried by indices never store them.
+        if self._edge_objects is None:
+            vertices = self._vertices
+            self._edge_objects = [Edge(vertices[source], vertices[destination]) for
+                                  source, destination in zip(self._edge_sources,
+                                                             self._edge_destinations)]
+
+        return self._edge_objects
+
+    def _row_edges(self, rows, index):
+        return list(map(self._edge_list().__getitem__,
+                        rows.edge_ids[rows.offsets[index]:rows.offsets[index + 1]]))
+
+    def _find_edge_id(self, source_id, destination_id):
+        try:
+            return self._rows.find(self._indices[source_id], self._indices[destination_id])
+        except KeyError:
+            return None
+
+    def _index(self, vertex):
+        try:
+            return self._indices[vertex.id]
+        except KeyError:
+            raise ValueError(f"Vertex {vertex} does not belong to the graph") from None
+
+    def _index_or_add(self, vertex_id):
+        index = self._indices.get(vertex_id)
+
+        if index is None:
+            index = len(self._vertices)
+            self._vertices.append(Vertex(vertex_id))
+            self._indices[vertex_id] = index
+
+        return index
+
+    def _locate(self, item):
+        # Finds the properties dictionary and the key for given vertex or edge.
+        if isinstance(item, Edge):
+            edge_id = self._find_edge_id(item.source.id, item.destination.id)
+
+            if edge_id is None or self._edge(edge_id) != item:
+                raise ValueError(f"Edge {item} does not belong to the graph")
+
+            return self._edge_properties, edge_id
+
+        return self._vertex_properties, self._index(item)
+
+    class _GraphPropertiesImpl(Graph.GraphProperties):
+        def __init__(self, graph: "CsrGraph"):
+            self._graph = graph
+
+        def __getitem__(self, item):
+            properties, key = self._graph._locate(item)
+            return properties.get(key, None)
+
+        def __setitem__(self, item, property_):
+            properties, key = self._graph._locate(item)
+            properties[key] = property_
+
+        def __delitem__(self, item):
+            properties, key = self._graph._locate(item)
+            properties.pop(key, None)
+
+
+class DirectedCsrGraph(CsrGraph, DirectedGraph):
+    def __init__(self, vertex_ids: Iterable[Any] = (), edges: Iterable[Tuple] = ()):
+        self._transposed_rows = None
+        super().__init__(vertex_ids, edges)
+
+    @classmethod
+    def _from_arrays(cls, vertices, edge_arrays, properties, rows=None):
+        # Rows are given with transposed rows, so neither has to be built again.
+        graph = super()._from_arrays(vertices, edge_arrays, properties,
+                                     None if rows is None else rows[0])
+        graph._transposed_rows = None if rows is None else rows[1]
+        return graph
+
+    def input_degree(self, vertex):
+        return self._transposed().degree(self._index(vertex))
+
+    def compressed_incoming_rows(self):
+        rows = self._transposed()
+        return rows.offsets, rows.targets
+
+    def predecessors(self, vertex):
+        rows = self._transposed()
+        return [self._vertices[rows.targets[i]] for i in rows.row(self._index(vertex))]
+
+    def incoming_edges(self, vertex):
+        return self._row_edges(self._transposed(), self._index(vertex))
+
+    def reverse(self):
+        self._rows, self._transposed_rows = self._transposed(), self._rows
+        self._edge_sources, self._edge_destinations = \
+            self._edge_destinations, self._edge_sources
+        self._edge_objects = None
+
+    def reversed_copy(self) -> "DirectedCsrGraph":
+        return self._from_arrays(self._vertices, (self._edge_destinations, self._edge_sources),
+                                 (self._vertex_properties, self._edge_properties),
+                                 (self._transposed(), self._rows))
+
+    def _build_rows(self):
+        return _CompressedRows.build(self._vertices, self._edge_sources, self._edge_destinations)
+
+    def _transposed(self):
+        if self._transposed_rows is None:
+            self._transposed_rows = _CompressedRows.build(
+                self._vertices, self._edge_destinations, self._edge_sources)
+
+        return self._transposed_rows
+
+
+class UndirectedCsrGraph(CsrGraph, UndirectedGraph):
+    def input_degree(self, vertex):
+        return self.output_degree(vertex)
+
+    def compressed_incoming_rows(self):
+        return self.compressed_rows()
+
+    def as_directed(self) -> DirectedCsrGraph:
+        graph = DirectedCsrGraph((v.id for v in self._vertices), self._directed_edges())
+
+        for index, property_ in self._vertex_properties.items():
+            graph.properties[self._vertices[index]] = property_
+
+        return graph
+
+    def _build_rows(self):
+        # Each edge is stored in rows of both its vertices, except loops stored only once.
+        edges_count = len(self._edge_sources)
+        reversed_ids = [i for i, (s, d) in
+                        enumerate(zip(self._edge_sources, self._edge_destinations)) if s != d]
+        sources = self._edge_sources + _index_array(
+            len(self._vertices), (self._edge_destinations[i] for i in reversed_ids))
+        destinations = self._edge_destinations + _index_array(
+            len(self._vertices), (self._edge_sources[i] for i in reversed_ids))
+        slot_edge_ids = _index_array(edges_count, range(edges_count)) \
+            + _index_array(edges_count, reversed_ids)
+        return _CompressedRows.build(self._vertices, sources, destinations, slot_edge_ids)
+
+    def _directed_edges(self):
+        for i, (source, destination) in enumerate(zip(self._edge_sources,
+                                                      self._edge_destinations)):
+            property_ = self._edge_properties.get(i)
+            yield self._vertices[source].id, self._vertices[destination].id, property_
+
+            if source != destination:
+                yield self._vertices[destination].id, self._vertices[source].id, property_
@@ -1,13 +1,30 @@
 # -*- coding: utf-8 -*-
 """Structure of directed graph."""
 from abc import ABCMeta, abstractmethod
+from itertools import chain
 from typing import Any, Iterable, Optional
 
+from .edge import Edge
 from .graph import Graph
-from .simple_graph import SimpleGraph, _GraphRepresentation
+from .simple_graph import SimpleGraph
+from .vertex import Vertex
 
 
 class DirectedGraph(Graph, metaclass=ABCMeta):
+    @abstractmethod
+    def predecessors(self, vertex: Vertex) -> Iterable[Vertex]:
+        """Gets the predecessors of given vertex.
+
+        :param vertex: the vertex from this graph
+        :return: the source vertices of edges incoming to the vertex"""
+
+    @abstractmethod
+    def incoming_edges(self, vertex: Vertex) -> Iterable[Edge]:
+        """Gets the incoming edges of given vertex.
+
+        :param vertex: the vertex from this graph
+        :return: the edges incoming to the vertex"""
+
     @abstractmethod
     def reverse(self):
         """Reverses directions of all edges in this graph."""
@@ -18,59 +35,160 @@ class DirectedGraph(Graph, metaclass=ABCMeta):
 
         :return: the copy of this graph with reversed directions of all edges"""
 
+    def reversed_view(self) -> "DirectedGraph":
+        """Returns reversed view of this graph, which shares vertices, edges and properties with
+        this graph without copying them.
+
+        :return: the view of this graph with reversed directions of all edges"""
+        return _ReversedGraphView(self)
+
 
 class DirectedSimpleGraph(SimpleGraph, DirectedGraph):
-    def __init__(self, vertex_ids: Optional[Iterable[Any]] = None):
-        super().__init__(vertex_ids)
+    def __init__(self, vertex_ids: Optional[Iterable[Any]] = None, *, incoming: bool = False):
+        """Creates new directed graph with vertices of given identifiers.
+
+        :param vertex_ids: the identifiers of vertices
+        :param incoming: whether to keep incoming edges of each vertex, which makes predecessors,
+            incoming edges and input degree fast for the cost of memory, otherwise they scan all
+            edges of the graph"""
+        super().__init__(vertex_ids, incoming=incoming)
 
     @property
     def edges_count(self):
-        return len(self._representation.edges)
+        return self._representation.edges_count
 
     @property
     def edges(self):
-        return iter(self._representation.edges)
+        return chain.from_iterable(self._representation.edges_set)
 
     def output_degree(self, vertex):
         return len(self._representation.get_adjacent_edges(vertex))
 
     def input_degree(self, vertex):
-        return len([edge for edges in self._representation.edges_set for edge in edges if
-                    edge.destination == vertex])
+        return len(self._representation.get_incoming_edges(vertex))
+
+    def predecessors(self, vertex):
+        return set(edge.source for edge in self._representation.get_incoming_edges(vertex))
+
+    def incoming_edges(self, vertex):
+        return self._representation.get_incoming_edges(vertex)
 
     def add_edge(self, edge, property_=None):
         try:
             existing_edge = self.get_edge(edge.source, edge.destination)
         except KeyError:
-            self._representation.add_edge_to_source(edge)
+            new_edge = self._representation.add_edge_to_source(edge)
 
             if property_ is not None:
-                self._representation.set_property(edge, property_)
+                self._representation.set_property(new_edge, property_)
 
-            return edge
+            return new_edge
 
         raise ValueError(f"Edge {existing_edge} already exists")
 
+    def add_edges(self, edges):
+        self._representation.add_edges(edges, to_destination=False)
+
     def reverse(self):
-        new_representation = _GraphRepresentation((v.id for v in self.vertices))
+        self._representation = self._representation.reversed()
 
-        for vertex in self.vertices:
-            new_representation.set_property(vertex, self._representation.get_property(vertex))
+    def reversed_copy(self) -> "DirectedSimpleGraph":
+        reversed_graph = DirectedSimpleGraph()
+        reversed_graph._representation = self._representation.reversed()
+        return reversed_graph
 
-        for edge in self.edges:
-            new_edge = edge.reversed()
-            new_representation.add_edge_to_source(new_edge)
-            new_representation.set_property(new_edge, self._representation.get_property(edge))
 
-        self._representation = new_representation
+class _ReversedGraphView(DirectedGraph):
+    def __init__(self, graph: DirectedGraph):
+        self._graph = graph
+        self._properties = self._GraphPropertiesImpl(graph)
+        # Reversed edges by original edges, created once when first requested
+        self._reversed_edges = {}
 
-    def reversed_copy(self) -> "DirectedSimpleGraph":
-        reversed_graph = DirectedSimpleGraph((v.id for v in self.vertices))
+    @property
+    def properties(self):
+        return self._properties
+
+    @property
+    def vertices_count(self):
+        return self._graph.vertices_count
+
+    @property
+    def edges_count(self):
+        return self._graph.edges_count
+
+    @property
+    def vertices(self):
+        return self._graph.vertices
+
+    @property
+    def edges(self):
+        return map(self._reversed, self._graph.edges)
+
+    def get_vertex(self, vertex_id):
+        return self._graph.get_vertex(vertex_id)
+
+    def get_edge(self, source, destination):
+        return self._reversed(self._graph.get_edge(destination, source))
+
+    def neighbours(self, vertex):
+        return self._graph.predecessors(vertex)
+
+    def adjacent_edges(self, vertex):
+        return list(map(self._reversed, self._graph.incoming_edges(vertex)))
+
+    def output_degree(self, vertex):
+        return self._graph.input_degree(vertex)
+
+    def input_degree(self, vertex):
+        return self._graph.output_degree(vertex)
+
+    def predecessors(self, vertex):
+        return self._graph.neighbours(vertex)
+
+    def incoming_edges(self, vertex):
+        return list(map(self._reversed, self._graph.adjacent_edges(vertex)))
+
+    def reverse(self):
+        self._graph.reverse()
+
+    def reversed_copy(self):
+        graph = DirectedSimpleGraph.from_edges(
+            ((edge.source.id, edge.destination.id, self._graph.properties[edge])
+             for edge in self._graph.edges), (vertex.id for vertex in self.vertices))
 
         for vertex in self.vertices:
-            reversed_graph.properties[vertex] = self.properties[vertex]
+            property_ = self.properties[vertex]
 
-        for edge in self.edges:
-            reversed_graph.add_edge(edge.reversed(), self.properties[edge])
+            if property_ is not None:
+                graph.properties[vertex] = property_
 
-        return reversed_graph
+        return graph
+
+    def reversed_view(self):
+        return self._graph
+
+    def _reversed(self, edge):
+        # Gets the reversed edge, so that traversing the view again does not create new edges.
+        try:
+            return self._reversed_edges[edge]
+        except KeyError:
+            reversed_edge = self._reversed_edges[edge] = edge.reversed()
+            return reversed_edge
+
+    class _GraphPropertiesImpl(Graph.GraphProperties):
+        def __init__(self, graph: DirectedGraph):
+            self._graph = graph
+
+        def __getitem__(self, item):
+            return self._graph.properties[self._original(item)]
+
+        def __setitem__(self, item, property_):
+            self._graph.properties[self._original(item)] = property_
+
+        def __delitem__(self, item):
+            del self._graph.properties[self._original(item)]
+
+        @staticmethod
+        def _original(item):
+            return item.reversed() if isinstance(item, Edge) else item
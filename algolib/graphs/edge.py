@@ -4,12 +4,27 @@ from .vertex import Vertex
 
 
 class Edge:
+    __slots__ = ("source", "destination", "_hash")
+    source: Vertex
+    destination: Vertex
+    _hash: int
+
     def __init__(self, source: Vertex, destination: Vertex):
-        self.source = source
-        self.destination = destination
+        object.__setattr__(self, "source", source)
+        object.__setattr__(self, "destination", destination)
+        object.__setattr__(self, "_hash", hash((source, destination)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Edge {self} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Edge {self} is immutable")
+
+    def __reduce__(self):
+        return Edge, (self.source, self.destination)
 
     def __hash__(self):
-        return hash((self.source, self.destination))
+        return self._hash
 
     def __repr__(self):
         return f"Edge({self.source!r}, {self.destination!r})"
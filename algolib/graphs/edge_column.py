@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Structure of typed column of edge property values."""
+from array import array
+from collections.abc import Mapping
+from typing import Any, List
+
+from .edge import Edge
+
+
+class EdgeColumn(Mapping):
+    def __init__(self, edges: List[Edge], values: array):
+        if len(edges) != len(values):
+            raise ValueError("Numbers of edges and values differ")
+
+        self.edges = edges  # Edges in order of their identifiers
+        self.values = values  # Values in contiguous buffer indexed by edge identifiers
+        self._ids = {edge: i for i, edge in enumerate(edges)}
+
+    def __getitem__(self, edge: Edge) -> Any:
+        """Gets the value for given edge.
+
+        :param edge: the edge
+        :return: the value for the edge
+        :raise KeyError: if the edge does not exist in this column"""
+        return self.values[self._ids[edge]]
+
+    def __iter__(self):
+        return iter(self.edges)
+
+    def __len__(self):
+        return len(self.edges)
+
+    def edge_id(self, edge: Edge) -> int:
+        """Gets the identifier of given edge, which is its index in the values buffer.
+
+        :param edge: the edge
+        :return: the edge identifier
+        :raise KeyError: if the edge does not exist in this column"""
+        return self._ids[edge]
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 """Structure of basic graph."""
 from abc import ABCMeta, abstractmethod
+from array import array
 from typing import Any, Iterable, Union
 
 from .edge import Edge
+from .edge_column import EdgeColumn
 from .vertex import Vertex
 
 
@@ -86,6 +88,21 @@ class Graph(metaclass=ABCMeta):
         :param vertex: the vertex from the graph
         :return: the input degree of the vertex"""
 
+    def edge_column(self, name: str = "weight", typecode: str = "d",
+                    default: Any = None) -> EdgeColumn:
+        """Gets given attribute of all edge properties as a typed column indexed by edge
+        identifiers, so that algorithms can read values without validating each access.
+
+        :param name: the attribute name of edge properties
+        :param typecode: the type code of values array
+        :param default: the value for edges whose property has no such attribute, or ``None`` to
+            raise an error
+        :return: the column of attribute values
+        :raise AttributeError: if any edge property has no such attribute and no default is given"""
+        edges = list(self.edges)
+        return EdgeColumn(edges, _column_values(
+            (self.properties[edge] for edge in edges), name, typecode, default))
+
     class GraphProperties(metaclass=ABCMeta):
         @abstractmethod
         def __getitem__(self, item: Union[Vertex, Edge]):
@@ -105,3 +122,11 @@ class Graph(metaclass=ABCMeta):
         def __delitem__(self, item: Union[Vertex, Edge]):
             """Deletes property for given vertex or edge.
             :param item: the vertex or the edge from this graph"""
+
+
+def _column_values(properties, name, typecode, default):
+    # Extracts attribute values of properties into typed array.
+    if default is None:
+        return array(typecode, (getattr(property_, name) for property_ in properties))
+
+    return array(typecode, (getattr(property_, name, default) for property_ in properties))
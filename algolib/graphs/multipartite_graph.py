@@ -69,6 +69,9 @@ class MultipartiteGraph(UndirectedGraph):
     def input_degree(self, vertex):
         return self._graph.input_degree(vertex)
 
+    def edge_column(self, name="weight", typecode="d", default=None):
+        return self._graph.edge_column(name, typecode, default)
+
     def as_directed(self):
         return self._graph.as_directed()
 
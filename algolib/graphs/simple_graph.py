@@ -1,21 +1,30 @@
 # -*- coding: utf-8 -*-
 """Structure of simple graph."""
 from abc import ABCMeta, abstractmethod
-from typing import Any, Iterable, Optional, Union
+from itertools import islice
+from typing import Any, Iterable, Optional, Tuple, Union
 
 from .edge import Edge
-from .graph import Graph
+from .edge_column import EdgeColumn
+from .graph import Graph, _column_values
 from .vertex import Vertex
 
 
 class _GraphRepresentation:
-    def __init__(self, vertex_ids=None):
+    def __init__(self, vertex_ids=None, *, incoming=False):
         self._properties = {}
+        self._edges_count = 0
 
         if vertex_ids is not None:
-            self._graph_dict = {Vertex(vertex_id): set() for vertex_id in vertex_ids}
+            self._vertex_dict = {vertex_id: Vertex(vertex_id) for vertex_id in vertex_ids}
         else:
-            self._graph_dict = {}
+            self._vertex_dict = {}
+
+        # Adjacent edges of each vertex by identifiers of its neighbours
+        self._graph_dict = {vertex: {} for vertex in self._vertex_dict.values()}
+        # Incoming edges of each vertex by identifiers of their sources, maintained only when
+        # requested
+        self._incoming_dict = {vertex: {} for vertex in self._graph_dict} if incoming else None
 
     @property
     def vertices(self):
@@ -23,37 +32,48 @@ class _GraphRepresentation:
 
     @property
     def edges(self):
-        result = []
-
-        for edges_set in self._graph_dict.values():
-            result += edges_set
+        # Each edge is yielded once, from the adjacency of its source vertex.
+        return (edge for vertex, edges in self._graph_dict.items() for edge in edges.values()
+                if edge.source is vertex)
 
-        return result
+    @property
+    def edges_count(self):
+        return self._edges_count
 
     @property
     def edges_set(self):
-        return self._graph_dict.values()
+        return (edges.values() for edges in self._graph_dict.values())
 
     def __len__(self):
         return len(self._graph_dict)
 
     def get_vertex(self, vertex_id):
         try:
-            return next(v for v in self._graph_dict.keys() if v.id == vertex_id)
-        except StopIteration:
+            return self._vertex_dict[vertex_id]
+        except KeyError:
             raise KeyError(f"Vertex not found : {vertex_id}") from None
 
     def get_edge(self, source_id, destination_id):
         try:
-            source, edges = next(
-                (v, edges) for v, edges in self._graph_dict.items() if v.id == source_id)
-            return next(edge for edge in edges if edge.get_neighbour(source).id == destination_id)
-        except StopIteration:
+            return self._graph_dict[self._vertex_dict[source_id]][destination_id]
+        except KeyError:
             raise KeyError(f"Edge not found: {source_id}, {destination_id}") from None
 
     def get_adjacent_edges(self, vertex):
         self._validate(vertex)
-        return self._graph_dict[vertex]
+        return self._graph_dict[vertex].values()
+
+    def get_incoming_edges(self, vertex):
+        self._validate(vertex)
+
+        if self._incoming_dict is None:
+            return [edge for edge in self.edges if edge.destination == vertex]
+
+        return self._incoming_dict[vertex].values()
+
+    def get_properties(self, items):
+        # Gets properties of given items without validation.
+        return map(self._properties.get, items)
 
     def get_property(self, item):
         self._validate(item, existing_edge=True)
@@ -71,35 +91,159 @@ class _GraphRepresentation:
         if vertex in self._graph_dict:
             return False
 
-        self._graph_dict[vertex] = set()
+        self._vertex_dict[vertex.id] = vertex
+        self._graph_dict[vertex] = {}
+
+        if self._incoming_dict is not None:
+            self._incoming_dict[vertex] = {}
+
         return True
 
     def add_edge_to_source(self, edge):
         self._validate(edge, existing_edge=False)
-        self._graph_dict[edge.source].add(edge)
+        edge = self._interned(edge)
+        self._graph_dict[edge.source][edge.destination.id] = edge
+        self._edges_count += 1
+
+        if self._incoming_dict is not None:
+            self._incoming_dict[edge.destination][edge.source.id] = edge
+
+        return edge
 
     def add_edge_to_destination(self, edge):
         self._validate(edge, existing_edge=False)
-        self._graph_dict[edge.destination].add(edge)
+        edge = self._interned(edge)
+        self._graph_dict[edge.destination][edge.source.id] = edge
+        return edge
+
+    def add_edges(self, edges, *, to_destination):
+        vertex_dict = self._vertex_dict
+        graph_dict = self._graph_dict
+        incoming_dict = self._incoming_dict
+        vertices_count = len(graph_dict)
+        added_edges = []
+
+        try:
+            for source_id, destination_id, *property_ in edges:
+                source = vertex_dict.get(source_id) or self._new_vertex(source_id)
+                source_edges = graph_dict[source]
+
+                if destination_id in source_edges:
+                    raise ValueError(f"Edge {source_edges[destination_id]} already exists")
+
+                destination = vertex_dict.get(destination_id) or self._new_vertex(destination_id)
+                edge = Edge(source, destination)
+                source_edges[destination_id] = edge
+                added_edges.append(edge)
+
+                if to_destination:
+                    graph_dict[destination][source_id] = edge
+
+                if incoming_dict is not None:
+                    incoming_dict[destination][source_id] = edge
+
+                if property_ and property_[0] is not None:
+                    self._properties[edge] = property_[0]
+        except Exception:
+            self._remove_added(added_edges, vertices_count, from_destination=to_destination)
+            raise
+
+        self._edges_count += len(added_edges)
+
+    def reversed(self):
+        # Creates representation of directed graph with reversed edges over the same vertices.
+        representation = _GraphRepresentation(incoming=self._incoming_dict is not None)
+        representation._vertex_dict = dict(self._vertex_dict)
+        representation._edges_count = self._edges_count
+        representation._graph_dict = {vertex: {} for vertex in self._graph_dict}
+        representation._properties = {item: property_ for item, property_
+                                      in self._properties.items() if isinstance(item, Vertex)}
+
+        if representation._incoming_dict is not None:
+            representation._incoming_dict = {vertex: {} for vertex in self._graph_dict}
+
+        for edges in self._graph_dict.values():
+            for edge in edges.values():
+                new_edge = edge.reversed()
+                representation._graph_dict[new_edge.source][new_edge.destination.id] = new_edge
+
+                if representation._incoming_dict is not None:
+                    representation._incoming_dict[new_edge.destination][new_edge.source.id] = \
+                        new_edge
+
+                if edge in self._properties:
+                    representation._properties[new_edge] = self._properties[edge]
+
+        return representation
+
+    def _remove_added(self, edges, vertices_count, *, from_destination):
+        # Removes given edges and vertices added after the first given number of vertices, so
+        # a failed batch of edges leaves the graph unchanged.
+        for edge in edges:
+            del self._graph_dict[edge.source][edge.destination.id]
+            self._properties.pop(edge, None)
+
+            if from_destination:
+                self._graph_dict[edge.destination].pop(edge.source.id, None)
+
+            if self._incoming_dict is not None:
+                del self._incoming_dict[edge.destination][edge.source.id]
+
+        for vertex in list(islice(self._graph_dict, vertices_count, None)):
+            del self._graph_dict[vertex]
+            del self._vertex_dict[vertex.id]
+            self._properties.pop(vertex, None)
+
+            if self._incoming_dict is not None:
+                del self._incoming_dict[vertex]
+
+    def _interned(self, edge):
+        # Makes the edge refer to the vertex objects stored in this graph.
+        source = self._vertex_dict[edge.source.id]
+        destination = self._vertex_dict[edge.destination.id]
+
+        if source is edge.source and destination is edge.destination:
+            return edge
+
+        return Edge(source, destination)
+
+    def _new_vertex(self, vertex_id):
+        vertex = Vertex(vertex_id)
+        self.add_vertex(vertex)
+        return vertex
 
     def _validate(self, item, *, existing_edge=None):
         if isinstance(item, Edge):
             if item.source not in self._graph_dict or item.destination not in self._graph_dict:
                 raise ValueError(f"Edge {item} does not belong to the graph")
 
-            if existing_edge and item not in self._graph_dict[item.source] \
-                    and item not in self._graph_dict[item.destination]:
-                raise ValueError(f"Edge {item} does not belong to the graph")
+            if existing_edge:
+                stored_edge = self._graph_dict[item.source].get(item.destination.id)
+
+                if stored_edge is None or stored_edge != item:
+                    raise ValueError(f"Edge {item} does not belong to the graph")
 
         elif item not in self._graph_dict:
             raise ValueError(f"Vertex {item} does not belong to the graph")
 
 
 class SimpleGraph(Graph, metaclass=ABCMeta):
-    def __init__(self, vertex_ids: Optional[Iterable[Any]]):
-        self._representation = _GraphRepresentation(vertex_ids)
+    def __init__(self, vertex_ids: Optional[Iterable[Any]], *, incoming: bool = False):
+        self._representation = _GraphRepresentation(vertex_ids, incoming=incoming)
         self._properties = self._GraphPropertiesImpl(self)
 
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple], vertex_ids: Optional[Iterable[Any]] = None):
+        """Creates new graph with given edges between vertices with given identifiers.
+
+        :param edges: the tuples of source identifier, destination identifier and optional property
+        :param vertex_ids: the identifiers of additional vertices
+        :return: the created graph
+        :raise ValueError: if any edge is duplicated"""
+        graph = cls(vertex_ids)
+        graph.add_edges(edges)
+        return graph
+
     @property
     def properties(self):
         return self._properties
@@ -127,6 +271,11 @@ class SimpleGraph(Graph, metaclass=ABCMeta):
         return set(edge.get_neighbour(vertex)
                    for edge in self._representation.get_adjacent_edges(vertex))
 
+    def edge_column(self, name="weight", typecode="d", default=None):
+        edges = list(self.edges)
+        return EdgeColumn(edges, _column_values(self._representation.get_properties(edges), name,
+                                                typecode, default))
+
     def add_vertex(self, vertex: Union[Vertex, Any], property_: Any = None) -> Vertex:
         """Adds new vertex with given property to this graph.
 
@@ -164,6 +313,15 @@ class SimpleGraph(Graph, metaclass=ABCMeta):
         :return: the created edge
         :raise ValueError: if the edge already exists"""
 
+    @abstractmethod
+    def add_edges(self, edges: Iterable[Tuple]):
+        """Adds new edges between vertices with given identifiers in a single pass.
+        Vertices that do not exist in this graph are created.
+
+        :param edges: the tuples of source identifier, destination identifier and optional property
+        :raise ValueError: if any edge already exists, in which case no edges nor vertices are
+            added"""
+
     class _GraphPropertiesImpl(Graph.GraphProperties):
         def __init__(self, graph: "SimpleGraph"):
             self._graph = graph
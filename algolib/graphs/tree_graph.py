@@ -50,6 +50,9 @@ class TreeGraph(UndirectedGraph):
     def input_degree(self, vertex):
         return self._graph.input_degree(vertex)
 
+    def edge_column(self, name="weight", typecode="d", default=None):
+        return self._graph.edge_column(name, typecode, default)
+
     def as_directed(self):
         return self._graph.as_directed()
 
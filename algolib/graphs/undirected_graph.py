@@ -22,11 +22,11 @@ class UndirectedSimpleGraph(SimpleGraph, UndirectedGraph):
 
     @property
     def edges_count(self):
-        return len(set(self._representation.edges))
+        return self._representation.edges_count
 
     @property
     def edges(self):
-        return iter(set(self._representation.edges))
+        return self._representation.edges
 
     def output_degree(self, vertex):
         return len(self._representation.get_adjacent_edges(vertex))
@@ -38,16 +38,19 @@ class UndirectedSimpleGraph(SimpleGraph, UndirectedGraph):
         try:
             existing_edge = self.get_edge(edge.source, edge.destination)
         except KeyError:
-            self._representation.add_edge_to_source(edge)
-            self._representation.add_edge_to_destination(edge)
+            new_edge = self._representation.add_edge_to_source(edge)
+            self._representation.add_edge_to_destination(new_edge)
 
             if property_ is not None:
-                self._representation.set_property(edge, property_)
+                self._representation.set_property(new_edge, property_)
 
-            return edge
+            return new_edge
 
         raise ValueError(f"Edge {existing_edge} already exists")
 
+    def add_edges(self, edges):
+        self._representation.add_edges(edges, to_destination=True)
+
     def as_directed(self) -> DirectedSimpleGraph:
         graph = DirectedSimpleGraph((v.id for v in self.vertices))
 
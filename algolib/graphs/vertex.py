@@ -4,11 +4,25 @@ from typing import Any
 
 
 class Vertex:
+    __slots__ = ("id", "_hash")
+    id: Any
+    _hash: int
+
     def __init__(self, id_: Any):
-        self.id = id_
+        object.__setattr__(self, "id", id_)
+        object.__setattr__(self, "_hash", hash(id_))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Vertex {self} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Vertex {self} is immutable")
+
+    def __reduce__(self):
+        return Vertex, (self.id,)
 
     def __hash__(self):
-        return hash(self.id)
+        return self._hash
 
     def __repr__(self):
         return f"Vertex({self.id!r})"
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: all-pairs shortest paths algorithms on random sparse directed graphs.
+
+Run with ``python -m benchmarks.all_pairs_shortest_paths --vertices 2000``. Floyd-Warshall is
+compared with the previous implementation relaxing distances in dictionary keyed by pairs of
+vertices, which is run only for small graphs. With NumPy installed the speedup is expected to be
+at least 50 times."""
+from argparse import ArgumentParser
+from unittest.mock import patch
+import random
+import time
+
+from algolib.graphs import DirectedSimpleGraph
+from algolib.graphs.algorithms import Paths, floyd_warshall, johnson
+from algolib.graphs.algorithms import shortest_paths
+
+
+class _Weight:
+    __slots__ = ("weight",)
+
+    def __init__(self, weight):
+        self.weight = weight
+
+
+def _dictionary_floyd_warshall(graph):
+    distances = {(v, u): 0.0 if v == u else Paths.INFINITY for v in graph.vertices
+                 for u in graph.vertices}
+
+    for edge in graph.edges:
+        distances[(edge.source, edge.destination)] = graph.properties[edge].weight
+
+    for vertex0 in graph.vertices:
+        for vertex1 in graph.vertices:
+            for vertex2 in graph.vertices:
+                new_distance = distances[(vertex1, vertex0)] + distances[(vertex0, vertex2)]
+
+                if new_distance < distances[(vertex1, vertex2)]:
+                    distances[(vertex1, vertex2)] = new_distance
+
+    return distances
+
+
+def _measure(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--vertices", type=int, default=500)
+    parser.add_argument("--degree", type=int, default=4, help="average output degree")
+    parser.add_argument("--dictionary-limit", type=int, default=300,
+                        help="largest number of vertices to run dictionary implementation")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generator = random.Random(args.seed)
+    edges = {(generator.randrange(args.vertices), generator.randrange(args.vertices))
+             for _ in range(args.vertices * args.degree)}
+    graph = DirectedSimpleGraph.from_edges(
+        [(s, d, _Weight(generator.uniform(1.0, 10.0))) for s, d in edges], range(args.vertices))
+    print(f"{graph.vertices_count} vertices, {graph.edges_count} edges")
+
+    if args.vertices <= args.dictionary_limit:
+        print(f"{'floyd_warshall on dictionary':>40}: "
+              f"{_measure(lambda: _dictionary_floyd_warshall(graph)):9.3f} s")
+
+    with patch.object(shortest_paths, "numpy", None):
+        print(f"{'floyd_warshall on rows':>40}: "
+              f"{_measure(lambda: floyd_warshall(graph)):9.3f} s")
+
+    if shortest_paths.numpy is not None:
+        print(f"{'floyd_warshall with numpy':>40}: "
+              f"{_measure(lambda: floyd_warshall(graph)):9.3f} s")
+
+    print(f"{'johnson':>40}: {_measure(lambda: sum(1 for _ in johnson(graph))):9.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: memory and traversal throughput of compressed graph against simple graph.
+
+Run with ``python -m benchmarks.csr_graph --edges 10000000``."""
+from argparse import ArgumentParser
+import random
+import time
+import tracemalloc
+
+from algolib.graphs import DirectedCsrGraph, DirectedSimpleGraph
+from algolib.graphs.algorithms import BFSStrategy, bfs
+
+
+def _random_edges(vertices_count, edges_count, seed):
+    generator = random.Random(seed)
+    edges = set()
+
+    while len(edges) < edges_count:
+        edges.add((generator.randrange(vertices_count), generator.randrange(vertices_count)))
+
+    return list(edges)
+
+
+class _CallingStrategy(BFSStrategy):
+    # Implements all callbacks, so searching calls each of them like any real strategy.
+    def for_root(self, root):
+        pass
+
+    def on_entry(self, vertex):
+        pass
+
+    def on_next_vertex(self, vertex, neighbour):
+        pass
+
+    def on_exit(self, vertex):
+        pass
+
+
+def _measure(name, build, edges_count):
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph = build()
+    build_time = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    bfs(graph, _CallingStrategy(), graph.vertices)
+    bfs_time = time.perf_counter() - start
+
+    print(f"{name:>8}: {edges_count} edges, {memory / edges_count:8.1f} B/edge, "
+          f"build {build_time:7.2f} s, bfs {edges_count / bfs_time:12.0f} edges/s")
+
+
+def _build_simple(vertices_count, edges):
+    graph = DirectedSimpleGraph(range(vertices_count))
+
+    for source, destination in edges:
+        graph.add_edge_between(graph.get_vertex(source), graph.get_vertex(destination))
+
+    return graph
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--simple-edges", type=int, default=20_000,
+                        help="number of edges for simple graph, which is much slower to build")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    simple_edges = _random_edges(args.simple_edges // 10, args.simple_edges, args.seed)
+    _measure("simple", lambda: _build_simple(args.simple_edges // 10, simple_edges),
+             args.simple_edges)
+    _measure("csr", lambda: DirectedCsrGraph(range(args.simple_edges // 10), simple_edges),
+             args.simple_edges)
+    del simple_edges
+
+    edges = _random_edges(args.edges // 10, args.edges, args.seed)
+    _measure("csr", lambda: DirectedCsrGraph(range(args.edges // 10), edges), args.edges)
+
+
+if __name__ == "__main__":
+    main()
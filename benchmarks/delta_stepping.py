@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: scaling of parallel delta-stepping with number of worker processes.
+
+Run with ``python -m benchmarks.delta_stepping --size 300 --processes 8``."""
+from argparse import ArgumentParser
+import os
+import random
+import time
+
+from algolib.graphs.algorithms import delta_stepping, dijkstra
+from benchmarks.shortest_paths import grid_graph
+
+
+def _measure(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200, help="side of grid")
+    parser.add_argument("--delta", type=float, default=None)
+    parser.add_argument("--processes", type=int, default=os.cpu_count(),
+                        help="largest number of worker processes")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generator = random.Random(args.seed)
+    graph = grid_graph(args.size, generator)
+    source = graph.get_vertex((0, 0))
+    print(f"grid: {graph.vertices_count} vertices, {graph.edges_count} edges")
+    print(f"{'dijkstra':>30}: {_measure(lambda: dijkstra(graph, source)):9.3f} s")
+    print(f"{'delta_stepping':>30}: "
+          f"{_measure(lambda: delta_stepping(graph, source, delta=args.delta)):9.3f} s")
+    processes = 1
+
+    while processes <= args.processes:
+        elapsed = _measure(lambda: delta_stepping(graph, source, delta=args.delta,
+                                                  processes=processes))
+        print(f"{f'delta_stepping on {processes} processes':>30}: {elapsed:9.3f} s")
+        processes *= 2
+
+
+if __name__ == "__main__":
+    main()
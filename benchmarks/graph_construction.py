@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: time of building simple graphs for growing number of edges.
+
+Run with ``python -m benchmarks.graph_construction``; time per edge should stay constant.
+Bulk construction with ``from_edges`` is expected to reach at least 100 000 edges per second."""
+from argparse import ArgumentParser
+import random
+import time
+
+from algolib.graphs import DirectedSimpleGraph, UndirectedSimpleGraph
+
+
+def _build(graph_type, vertices_count, edges):
+    graph = graph_type(range(vertices_count))
+
+    for source, destination in edges:
+        graph.add_edge_between(graph.get_vertex(source), graph.get_vertex(destination))
+
+    return graph
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--edges", type=int, default=50_000, help="smallest number of edges")
+    parser.add_argument("--steps", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generator = random.Random(args.seed)
+
+    for step in range(args.steps):
+        edges_count = args.edges * 2 ** step
+        vertices_count = edges_count // 10
+        edges = {(generator.randrange(vertices_count), generator.randrange(vertices_count))
+                 for _ in range(edges_count)}
+        edges = [(s, d) for s, d in edges if (d, s) not in edges or s <= d]
+
+        for graph_type in (DirectedSimpleGraph, UndirectedSimpleGraph):
+            start = time.perf_counter()
+            _build(graph_type, vertices_count, edges)
+            elapsed = time.perf_counter() - start
+            print(f"{graph_type.__name__:>22}: {len(edges):9} edges, {elapsed:7.2f} s, "
+                  f"{elapsed / len(edges) * 1e6:6.2f} us/edge")
+
+            start = time.perf_counter()
+            graph_type.from_edges(edges, range(vertices_count))
+            elapsed = time.perf_counter() - start
+            print(f"{'from_edges':>22}: {len(edges):9} edges, {elapsed:7.2f} s, "
+                  f"{len(edges) / elapsed:9.0f} edges/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: memory used by simple graphs per vertex and per edge, and speed of searching.
+
+Run with ``python -m benchmarks.graph_memory``."""
+from argparse import ArgumentParser
+import random
+import sys
+import time
+import tracemalloc
+
+from algolib.graphs import DirectedSimpleGraph, Edge, UndirectedSimpleGraph, Vertex
+from algolib.graphs.algorithms import DFSStrategy, bfs, dfs_iterative
+
+
+class _CallingStrategy(DFSStrategy):
+    # Implements all callbacks, so searching calls each of them like any real strategy.
+    def for_root(self, root):
+        pass
+
+    def on_entry(self, vertex):
+        pass
+
+    def on_next_vertex(self, vertex, neighbour):
+        pass
+
+    def on_exit(self, vertex):
+        pass
+
+    def on_edge_to_visited(self, vertex, neighbour):
+        pass
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--edges", type=int, default=500_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generator = random.Random(args.seed)
+    vertices_count = args.edges // 10
+    edges = list({tuple(sorted((generator.randrange(vertices_count),
+                                generator.randrange(vertices_count))))
+                  for _ in range(args.edges)})
+
+    print(f"Vertex object: {sys.getsizeof(Vertex(0))} B, "
+          f"Edge object: {sys.getsizeof(Edge(Vertex(0), Vertex(1)))} B")
+
+    for graph_type in (DirectedSimpleGraph, UndirectedSimpleGraph):
+        tracemalloc.start()
+        graph = graph_type(range(vertices_count))
+        vertices_memory, _ = tracemalloc.get_traced_memory()
+        graph.add_edges(edges)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        edges_count = graph.edges_count
+
+        print(f"{graph_type.__name__:>22}: {vertices_memory / vertices_count:6.1f} B/vertex, "
+              f"{(memory - vertices_memory) / edges_count:6.1f} B/edge")
+
+        for search in (bfs, dfs_iterative):
+            start = time.perf_counter()
+            search(graph, _CallingStrategy(), graph.vertices)
+            elapsed = time.perf_counter() - start
+            print(f"{search.__name__:>22}: {edges_count / elapsed:12.0f} edges/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: breadth-first search on power-law graphs similar to social networks.
+
+Run with ``python -m benchmarks.power_law_bfs --vertices 200000``. Graphs are generated with
+preferential attachment, so they have hubs of high degree and low diameter."""
+from argparse import ArgumentParser
+import random
+import time
+
+from algolib.graphs import UndirectedCsrGraph, UndirectedSimpleGraph
+from algolib.graphs.algorithms import BFSStrategy, EmptyStrategy, bfs, bfs_distances, \
+    direction_optimizing_bfs
+
+
+def power_law_edges(vertices_count, degree, generator):
+    """Generates edges of graph with preferential attachment, where each new vertex is joined
+    with given number of vertices chosen proportionally to their degrees."""
+    endpoints = list(range(degree))
+    edges = set()
+
+    for vertex in range(degree, vertices_count):
+        neighbours = {generator.choice(endpoints) for _ in range(degree)}
+
+        for neighbour in neighbours:
+            edges.add((neighbour, vertex))
+            endpoints.extend((neighbour, vertex))
+
+    return list(edges)
+
+
+class _CallingStrategy(BFSStrategy):
+    # Implements all callbacks, so searching calls each of them.
+    def for_root(self, root):
+        pass
+
+    def on_entry(self, vertex):
+        pass
+
+    def on_next_vertex(self, vertex, neighbour):
+        pass
+
+    def on_exit(self, vertex):
+        pass
+
+
+def _measure(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--vertices", type=int, default=100_000)
+    parser.add_argument("--degree", type=int, default=8, help="edges of each new vertex")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generator = random.Random(args.seed)
+    edges = power_law_edges(args.vertices, args.degree, generator)
+    graph = UndirectedSimpleGraph.from_edges(edges, range(args.vertices))
+    csr_graph = UndirectedCsrGraph(range(args.vertices), edges)
+    root = graph.get_vertex(generator.randrange(args.vertices))
+    print(f"{graph.vertices_count} vertices, {graph.edges_count} edges")
+    print(f"{'bfs with all callbacks':>40}: "
+          f"{_measure(lambda: bfs(graph, _CallingStrategy(), [root])):9.3f} s")
+    print(f"{'bfs without callbacks':>40}: "
+          f"{_measure(lambda: bfs(graph, EmptyStrategy(), [root])):9.3f} s")
+    print(f"{'bfs_distances':>40}: {_measure(lambda: bfs_distances(graph, [root])):9.3f} s")
+
+    print(f"{'top-down bfs on compressed rows':>40}: "
+          f"{_measure(lambda: direction_optimizing_bfs(csr_graph, root, alpha=0)):9.3f} s")
+
+    print(f"{'direction optimizing bfs':>40}: "
+          f"{_measure(lambda: direction_optimizing_bfs(csr_graph, root)):9.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: shortest paths algorithms on grid graphs and road-like graphs.
+
+Run with ``python -m benchmarks.shortest_paths --size 300``."""
+from argparse import ArgumentParser
+import math
+import random
+import time
+
+from algolib.geometry.dim2 import Point2D
+from algolib.graphs import UndirectedSimpleGraph
+from algolib.graphs.algorithms import ContractionHierarchy, Paths, a_star, \
+    bidirectional_dijkstra, dijkstra, euclidean_heuristic_2d
+
+
+class _Weight:
+    __slots__ = ("weight",)
+
+    def __init__(self, weight):
+        self.weight = weight
+
+
+def grid_graph(size, generator):
+    """Creates square grid with random weights of edges between neighbouring cells."""
+    edges = []
+
+    for i in range(size):
+        for j in range(size):
+            if i + 1 < size:
+                edges.append(((i, j), (i + 1, j), _Weight(generator.uniform(1.0, 10.0))))
+
+            if j + 1 < size:
+                edges.append(((i, j), (i, j + 1), _Weight(generator.uniform(1.0, 10.0))))
+
+    return UndirectedSimpleGraph.from_edges(edges)
+
+
+def road_graph(size, generator):
+    """Creates sparse planar-like graph of jittered grid points with some streets removed and
+    Euclidean lengths as weights, similar to a road network."""
+    points = {(i, j): Point2D(i + generator.uniform(-0.3, 0.3), j + generator.uniform(-0.3, 0.3))
+              for i in range(size) for j in range(size)}
+    edges = []
+
+    for (i, j), point in points.items():
+        for neighbour in ((i + 1, j), (i, j + 1), (i + 1, j + 1)):
+            if neighbour in points and generator.random() < 0.7:
+                other = points[neighbour]
+                edges.append(((i, j), neighbour,
+                              _Weight(math.hypot(point.x - other.x, point.y - other.y))))
+
+    graph = UndirectedSimpleGraph.from_edges(edges, points.keys())
+
+    for vertex_id, point in points.items():
+        graph.properties[graph.get_vertex(vertex_id)] = point
+
+    return graph
+
+
+def _run(name, function, pairs):
+    start = time.perf_counter()
+
+    for source, target in pairs:
+        function(source, target)
+
+    print(f"{name:>40}: {(time.perf_counter() - start) / len(pairs) * 1000:9.2f} ms")
+
+
+def _compare_settled(graph, pairs):
+    # Compares the average numbers of vertices settled by Dijkstra and by A* with Euclidean
+    # heuristic, counting vertices for which the heuristic was evaluated in A*.
+    euclidean = euclidean_heuristic_2d(graph)
+    dijkstra_settled = 0
+    a_star_reached = 0
+
+    for source, target in pairs:
+        distances = dijkstra(graph, source, targets=[target])
+        dijkstra_settled += sum(1 for d in distances.values() if d < Paths.INFINITY)
+        reached = set()
+
+        def heuristic(vertex, target_):
+            reached.add(vertex)
+            return euclidean(vertex, target_)
+
+        a_star(graph, source, target, heuristic)
+        a_star_reached += len(reached)
+
+    print(f"{'settled by dijkstra with target':>40}: {dijkstra_settled / len(pairs):9.1f}")
+    print(f"{'reached by a_star with euclidean':>40}: {a_star_reached / len(pairs):9.1f}")
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200, help="side of grid")
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generator = random.Random(args.seed)
+
+    for graph_name, graph in (("grid", grid_graph(args.size, generator)),
+                              ("road", road_graph(args.size, generator))):
+        vertices = list(graph.vertices)
+        pairs = [(generator.choice(vertices), generator.choice(vertices))
+                 for _ in range(args.queries)]
+        print(f"{graph_name}: {graph.vertices_count} vertices, {graph.edges_count} edges")
+        _run("dijkstra", lambda s, t: dijkstra(graph, s), pairs)
+        _run("dijkstra with target", lambda s, t: dijkstra(graph, s, targets=[t]), pairs)
+        _run("bidirectional dijkstra", lambda s, t: bidirectional_dijkstra(graph, s, t), pairs)
+
+        if graph_name == "road":
+            euclidean = euclidean_heuristic_2d(graph)
+            _run("a_star with euclidean", lambda s, t: a_star(graph, s, t, euclidean), pairs)
+            _compare_settled(graph, pairs)
+            start = time.perf_counter()
+            hierarchy = ContractionHierarchy(graph)
+            print(f"{'contraction hierarchy preprocessing':>40}: "
+                  f"{(time.perf_counter() - start) * 1000:9.2f} ms")
+            _run("contraction hierarchy query", hierarchy.find_path, pairs)
+
+        _run(f"dijkstra with max distance {args.size // 4}",
+             lambda s, t: dijkstra(graph, s, max_distance=args.size // 4), pairs)
+
+
+if __name__ == "__main__":
+    main()
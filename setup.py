@@ -14,6 +14,7 @@ setuptools.setup(name="AlgoLib",
                  long_description_content_type="text/markdown",
                  packages=setuptools.find_packages(),
                  python_requires=f">={PYTHON_MIN_VERSION}",
+                 extras_require={"numpy": ["numpy"]},
                  classifiers=["Programming Language :: Python :: 3",
                               "License :: OSI Approved :: Apache Software License",
                               "Operating System :: OS Independent",
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Tests: Algorithm for repeated shortest paths queries using contraction hierarchies."""
+from io import BytesIO
+import random
+import unittest
+
+from assertpy import assert_that
+
+from algolib.graphs import DirectedSimpleGraph, UndirectedSimpleGraph, Vertex
+from algolib.graphs.algorithms import ContractionHierarchy, Paths, dijkstra
+
+
+class ContractionHierarchyTest(unittest.TestCase):
+    class _Weight:
+        def __init__(self, weight):
+            self.weight = weight
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._directed_graph = None
+        self._undirected_graph = None
+
+    def setUp(self):
+        edges = [(0, 1, 4), (1, 4, 7), (1, 7, 12), (2, 4, 6), (2, 6, 8), (3, 0, 3), (3, 7, 5),
+                 (4, 5, 1), (4, 3, 10), (5, 6, 4), (5, 8, 2), (6, 5, 7), (7, 5, 2), (7, 8, 6),
+                 (8, 9, 10), (9, 6, 3)]
+        self._directed_graph = DirectedSimpleGraph.from_edges(
+            [(s, d, self._Weight(w)) for s, d, w in edges], range(10))
+        self._undirected_graph = UndirectedSimpleGraph.from_edges(
+            [(s, d, self._Weight(w)) for s, d, w in edges
+             if (d, s) not in {(e[0], e[1]) for e in edges}], range(12))
+
+    def _assert_same_as_dijkstra(self, graph, test_object, sources=None):
+        for source in graph.vertices if sources is None else sources:
+            expected = dijkstra(graph, source)
+
+            for target in graph.vertices:
+                with self.subTest(source=source, target=target):
+                    # when
+                    distance, path = test_object.find_path(source, target)
+
+                    # then
+                    assert_that(distance).is_equal_to(expected[target])
+
+                    if distance < Paths.INFINITY:
+                        assert_that(path[0]).is_equal_to(source)
+                        assert_that(path[-1]).is_equal_to(target)
+                        assert_that(sum(graph.properties[graph.get_edge(v, u)].weight
+                                        for v, u in zip(path, path[1:]))).is_equal_to(distance)
+                    else:
+                        assert_that(path).is_empty()
+
+    def test__find_path__when_directed_graph__then_same_as_dijkstra(self):
+        # when
+        test_object = ContractionHierarchy(self._directed_graph)
+
+        # then
+        self._assert_same_as_dijkstra(self._directed_graph, test_object)
+
+    def test__find_path__when_undirected_graph__then_same_as_dijkstra(self):
+        # when
+        test_object = ContractionHierarchy(self._undirected_graph)
+
+        # then
+        self._assert_same_as_dijkstra(self._undirected_graph, test_object)
+
+    def test__find_path__when_random_graph__then_same_as_dijkstra(self):
+        # given
+        generator = random.Random(0)
+        graph = DirectedSimpleGraph(range(300))
+        vertices = list(graph.vertices)
+
+        for source, destination in {tuple(generator.sample(vertices, 2)) for _ in range(1200)}:
+            graph.add_edge_between(source, destination, self._Weight(generator.randint(1, 20)))
+
+        # when
+        test_object = ContractionHierarchy(graph)
+
+        # then
+        self._assert_same_as_dijkstra(graph, test_object, generator.sample(vertices, 10))
+
+    def test__find_path__when_not_existing_vertex__then_key_error(self):
+        # given
+        test_object = ContractionHierarchy(self._directed_graph)
+
+        # then
+        assert_that(test_object.find_path).raises(KeyError).when_called_with(Vertex(1),
+                                                                             Vertex(20))
+
+    def test__load__when_saved__then_same_paths(self):
+        # given
+        test_object = ContractionHierarchy(self._directed_graph)
+        file = BytesIO()
+        test_object.save(file)
+        file.seek(0)
+
+        # when
+        result = ContractionHierarchy.load(file)
+
+        # then
+        self._assert_same_as_dijkstra(self._directed_graph, result)
+
+    def test__init__when_negative_edge__then_value_error(self):
+        # given
+        self._directed_graph.add_edge_between(self._directed_graph.get_vertex(2),
+                                              self._directed_graph.get_vertex(1),
+                                              self._Weight(-2))
+
+        # then
+        assert_that(ContractionHierarchy).raises(ValueError).when_called_with(
+            self._directed_graph)
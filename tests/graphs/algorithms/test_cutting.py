@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Tests: Algorithms for graph cutting."""
+import sys
 import unittest
 
 from assertpy import assert_that
@@ -103,3 +104,17 @@ class CuttingTest(unittest.TestCase):
 
         # then
         assert_that(list(result)).is_empty()
+
+    @staticmethod
+    def test__find_vertex_cut__when_path_longer_than_recursion_limit__then_inner_vertices():
+        # given
+        vertices_count = 5 * sys.getrecursionlimit()
+        graph = UndirectedSimpleGraph.from_edges(
+            [(i, i + 1) for i in range(vertices_count - 1)])
+
+        # when
+        result = find_vertex_cut(graph)
+
+        # then
+        assert_that(sorted(result)).is_equal_to(
+            [graph.get_vertex(i) for i in range(1, vertices_count - 1)])
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Tests: Algorithm for single source shortest paths using delta-stepping."""
+import unittest
+from unittest.mock import patch
+
+from assertpy import assert_that
+
+from algolib.graphs import DirectedSimpleGraph, UndirectedSimpleGraph
+from algolib.graphs.algorithms import Paths, delta_stepping
+
+
+def _from_list(graph, distances):
+    return {graph.get_vertex(i): d for i, d in enumerate(distances)}
+
+
+class DeltaSteppingTest(unittest.TestCase):
+    INF = Paths.INFINITY
+
+    class _Weight:
+        def __init__(self, weight):
+            self.weight = weight
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._directed_graph = None
+        self._undirected_graph = None
+
+    def setUp(self):
+        edges = [(0, 1, 4), (1, 4, 7), (1, 7, 12), (2, 4, 6), (2, 6, 8), (3, 0, 3), (3, 7, 5),
+                 (4, 5, 1), (4, 3, 10), (5, 6, 4), (5, 8, 2), (6, 5, 7), (7, 5, 2), (7, 8, 6),
+                 (8, 9, 10), (9, 6, 3)]
+        self._directed_graph = DirectedSimpleGraph.from_edges(
+            [(s, d, self._Weight(w)) for s, d, w in edges], range(10))
+        self._undirected_graph = UndirectedSimpleGraph.from_edges(
+            [(0, 1, self._Weight(4)), (1, 4, self._Weight(7)), (1, 7, self._Weight(12)),
+             (2, 6, self._Weight(8)), (3, 0, self._Weight(3)), (3, 7, self._Weight(5)),
+             (4, 5, self._Weight(1)), (4, 3, self._Weight(10)), (5, 8, self._Weight(2)),
+             (7, 5, self._Weight(2)), (7, 8, self._Weight(6)), (9, 6, self._Weight(3))],
+            range(10))
+
+    def test__delta_stepping__when_directed_graph__then_shortest_paths_lengths(self):
+        # given
+        expected = _from_list(self._directed_graph,
+                              [20, 0, self.INF, 17, 7, 8, 12, 12, 10, 20])
+
+        for delta in [None, 1.0, 5.0, 100.0]:
+            with self.subTest(delta=delta):
+                # when
+                result = delta_stepping(self._directed_graph, self._directed_graph.get_vertex(1),
+                                        delta=delta)
+
+                # then
+                assert_that(result).is_equal_to(expected)
+
+    def test__delta_stepping__when_undirected_graph__then_shortest_paths_lengths(self):
+        # given
+        expected = _from_list(self._undirected_graph,
+                              [4, 0, self.INF, 7, 7, 8, self.INF, 10, 10, self.INF])
+
+        # when
+        result = delta_stepping(self._undirected_graph, self._undirected_graph.get_vertex(1))
+
+        # then
+        assert_that(result).is_equal_to(expected)
+
+    @patch("algolib.graphs.algorithms.delta_stepping._PARALLEL_MIN_FRONTIER", 1)
+    def test__delta_stepping__when_processes__then_shortest_paths_lengths(self):
+        # given
+        expected = _from_list(self._directed_graph,
+                              [20, 0, self.INF, 17, 7, 8, 12, 12, 10, 20])
+
+        # when
+        result = delta_stepping(self._directed_graph, self._directed_graph.get_vertex(1),
+                                delta=3.0, processes=2)
+
+        # then
+        assert_that(result).is_equal_to(expected)
+
+    def test__delta_stepping__when_negative_edge__then_value_error(self):
+        # given
+        self._directed_graph.add_edge_between(self._directed_graph.get_vertex(2),
+                                              self._directed_graph.get_vertex(1),
+                                              self._Weight(-2))
+
+        # when
+        def function(graph):
+            delta_stepping(graph, graph.get_vertex(1))
+
+        # then
+        assert_that(function).raises(ValueError).when_called_with(self._directed_graph)
+
+    def test__delta_stepping__when_delta_not_positive__then_value_error(self):
+        # when
+        def function(graph):
+            delta_stepping(graph, graph.get_vertex(1), delta=0.0)
+
+        # then
+        assert_that(function).raises(ValueError).when_called_with(self._directed_graph)
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Tests: Structure of strongly connected components maintained under insertions of edges."""
+import random
+import unittest
+
+from assertpy import assert_that
+
+from algolib.graphs import DirectedSimpleGraph
+from algolib.graphs.algorithms import IncrementalSCC, find_scc_ids
+
+
+class IncrementalSCCTest(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._graph = None
+        self._test_object = None
+
+    def setUp(self):
+        self._graph = DirectedSimpleGraph.from_edges(
+            [(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (6, 7)], range(8))
+        self._test_object = IncrementalSCC(self._graph)
+
+    def _vertices(self, *vertex_ids):
+        return [self._graph.get_vertex(vertex_id) for vertex_id in vertex_ids]
+
+    def test__init__then_components_of_graph(self):
+        # when
+        result = self._test_object.components_count
+
+        # then
+        assert_that(result).is_equal_to(6)
+        assert_that(self._test_object.same_component(*self._vertices(0, 2))).is_true()
+        assert_that(self._test_object.same_component(*self._vertices(3, 4))).is_false()
+
+    def test__add_edge_between__when_no_cycle__then_components_unchanged(self):
+        # when
+        self._test_object.add_edge_between(*self._vertices(5, 0))
+
+        # then
+        assert_that(self._test_object.components_count).is_equal_to(6)
+        assert_that(self._test_object.same_component(*self._vertices(5, 0))).is_false()
+        assert_that(self._graph.get_edge(*self._vertices(5, 0))).is_not_none()
+
+    def test__add_edge_between__when_cycle_closed__then_components_merged(self):
+        # given
+        self._test_object.add_edge_between(*self._vertices(5, 6))
+
+        # when
+        self._test_object.add_edge_between(*self._vertices(7, 3))
+
+        # then
+        assert_that(self._test_object.components_count).is_equal_to(2)
+        assert_that({self._test_object.component_of(vertex)
+                     for vertex in self._vertices(3, 4, 5, 6, 7)}).is_length(1)
+        assert_that(self._test_object.same_component(*self._vertices(0, 3))).is_false()
+
+    def test__add_edge_between__when_existing_edge__then_value_error(self):
+        # when
+        def function(source, destination):
+            self._test_object.add_edge_between(source, destination)
+
+        # then
+        assert_that(function).raises(ValueError).when_called_with(*self._vertices(0, 1))
+
+    def test__add_edge_between__when_new_vertex__then_separate_component(self):
+        # given
+        vertex = self._graph.add_vertex(8)
+
+        # when
+        self._test_object.add_edge_between(self._graph.get_vertex(7), vertex)
+        self._test_object.add_edge_between(vertex, self._graph.get_vertex(6))
+
+        # then
+        assert_that(self._test_object.components_count).is_equal_to(5)
+        assert_that(self._test_object.same_component(vertex, self._graph.get_vertex(6))).is_true()
+
+    def test__add_edge_between__when_random_edges__then_same_as_find_scc_ids(self):
+        # given
+        generator = random.Random(0)
+        graph = DirectedSimpleGraph(range(40))
+        test_object = IncrementalSCC(graph)
+        vertices = list(graph.vertices)
+        edges = {tuple(generator.sample(vertices, 2)) for _ in range(120)}
+
+        for source, destination in edges:
+            # when
+            test_object.add_edge_between(source, destination)
+
+            # then
+            scc_ids = dict(zip(vertices, find_scc_ids(graph)))
+
+            for vertex in vertices:
+                assert_that(test_object.same_component(vertex, source)) \
+                    .is_equal_to(scc_ids[vertex] == scc_ids[source])
@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 """Tests: Algorithms for graph searching."""
+import sys
 import unittest
+from unittest.mock import patch
 
 from assertpy import assert_that
 
-from algolib.graphs import DirectedSimpleGraph, UndirectedSimpleGraph
-from algolib.graphs.algorithms import DFSStrategy, EmptyStrategy, bfs, dfs_iterative, dfs_recursive
+from algolib.graphs import DirectedCsrGraph, DirectedSimpleGraph, UndirectedSimpleGraph
+from algolib.graphs.algorithms import DFSStrategy, EmptyStrategy, bfs, bfs_distances, \
+    bfs_order, dfs_iterative, dfs_recursive, direction_optimizing_bfs, iter_bfs, iter_dfs, \
+    multi_source_bfs, reachable
 
 
 class SearchingTest(unittest.TestCase):
@@ -116,6 +120,270 @@ class SearchingTest(unittest.TestCase):
         assert_that(sorted(strategy.entries)).is_equal_to(sorted(self._undirected_graph.vertices))
         assert_that(sorted(strategy.exits)).is_equal_to(sorted(self._undirected_graph.vertices))
 
+    def test__bfs__when_strategy_declares_some_hooks__then_only_declared_called(self):
+        # given
+        strategy = self._TestingStrategy()
+        strategy.hooks = frozenset({"on_entry"})
+
+        # when
+        result = bfs(self._directed_graph, strategy, [self._directed_graph.get_vertex(1)])
+
+        # then
+        assert_that(sorted(strategy.entries)).is_equal_to(sorted(result))
+        assert_that(strategy.exits).is_empty()
+
+    def test__bfs__when_empty_strategy_subclass__then_overridden_callbacks_called(self):
+        # given
+        strategy = self._EntriesStrategy()
+
+        # when
+        result = bfs(self._directed_graph, strategy, [self._directed_graph.get_vertex(1)])
+
+        # then
+        assert_that(sorted(strategy.entries)).is_equal_to(sorted(result))
+        assert_that(strategy.entries[0]).is_equal_to(self._directed_graph.get_vertex(1))
+
+    def test__bfs__when_empty_strategy__then_same_order_as_with_callbacks(self):
+        # given
+        roots = [self._undirected_graph.get_vertex(0), self._undirected_graph.get_vertex(6)]
+        strategy = self._TestingStrategy()
+
+        # when
+        result = list(bfs(self._undirected_graph, EmptyStrategy(), roots))
+
+        # then
+        assert_that(result).is_equal_to(list(bfs(self._undirected_graph, strategy, roots)))
+        assert_that(result).is_equal_to(strategy.entries)
+
+    # endregion
+    # region reachable
+
+    def test__reachable__when_undirected_graph__then_same_as_bfs(self):
+        # given
+        roots = [self._undirected_graph.get_vertex(2), self._undirected_graph.get_vertex(5)]
+
+        # when
+        result = reachable(self._undirected_graph, roots)
+
+        # then
+        assert_that(sorted(result)).is_equal_to(
+            sorted(bfs(self._undirected_graph, self._TestingStrategy(), roots)))
+
+    def test__reachable__when_directed_graph__then_same_as_bfs(self):
+        # given
+        roots = [self._directed_graph.get_vertex(1)]
+
+        # when
+        result = reachable(self._directed_graph, roots)
+
+        # then
+        assert_that(sorted(result)).is_equal_to(
+            sorted(bfs(self._directed_graph, self._TestingStrategy(), roots)))
+
+    # endregion
+    # region bfs_order
+
+    def test__bfs_order__when_undirected_graph__then_vertices_by_levels(self):
+        # when
+        result = bfs_order(self._undirected_graph, [self._undirected_graph.get_vertex(0)])
+
+        # then
+        assert_that([vertex.id for vertex in result[:1]]).is_equal_to([0])
+        assert_that(sorted(vertex.id for vertex in result[1:3])).is_equal_to([1, 4])
+        assert_that(sorted(vertex.id for vertex in result[3:6])).is_equal_to([3, 5, 7])
+        assert_that([vertex.id for vertex in result[6:]]).is_equal_to([8])
+
+    def test__bfs_order__when_many_roots__then_each_root_before_its_search(self):
+        # when
+        result = bfs_order(self._directed_graph, [self._directed_graph.get_vertex(8),
+                                                  self._directed_graph.get_vertex(6)])
+
+        # then
+        assert_that([vertex.id for vertex in result[:3]]).is_equal_to([8, 5, 4])
+        assert_that(sorted(vertex.id for vertex in result[:7])).is_equal_to(
+            [0, 1, 3, 4, 5, 7, 8])
+        assert_that(result[7]).is_equal_to(self._directed_graph.get_vertex(6))
+        assert_that(sorted(result)).is_equal_to(sorted(self._directed_graph.vertices))
+
+    # endregion
+    # region bfs_distances
+
+    def test__bfs_distances__when_undirected_graph__then_distances_of_reachable(self):
+        # when
+        result = bfs_distances(self._undirected_graph, [self._undirected_graph.get_vertex(0)])
+
+        # then
+        assert_that({vertex.id: distance for vertex, distance in result.items()}).is_equal_to(
+            {0: 0, 1: 1, 3: 2, 4: 1, 5: 2, 7: 2, 8: 3})
+
+    def test__bfs_distances__when_directed_graph__then_distances_of_reachable(self):
+        # when
+        result = bfs_distances(self._directed_graph, [self._directed_graph.get_vertex(1)])
+
+        # then
+        assert_that({vertex.id: distance for vertex, distance in result.items()}).is_equal_to(
+            {0: 3, 1: 0, 3: 1, 4: 2, 7: 1})
+
+    def test__bfs_distances__when_many_roots__then_distances_from_closest(self):
+        # when
+        result = bfs_distances(self._undirected_graph, [self._undirected_graph.get_vertex(0),
+                                                        self._undirected_graph.get_vertex(8)])
+
+        # then
+        assert_that({vertex.id: distance for vertex, distance in result.items()}).is_equal_to(
+            {0: 0, 1: 1, 3: 2, 4: 1, 5: 1, 7: 2, 8: 0})
+
+    # endregion
+    # region multi_source_bfs
+
+    def test__multi_source_bfs__when_undirected_graph__then_nearest_sources(self):
+        # when
+        result = multi_source_bfs(self._undirected_graph, [self._undirected_graph.get_vertex(0),
+                                                           self._undirected_graph.get_vertex(8),
+                                                           self._undirected_graph.get_vertex(9)])
+
+        # then
+        assert_that({vertex.id: (source.id, distance)
+                     for vertex, (source, distance) in result.items()}).is_equal_to(
+            {0: (0, 0), 1: (0, 1), 2: (9, 2), 3: (0, 2), 4: (0, 1), 5: (8, 1), 6: (9, 1),
+             7: (0, 2), 8: (8, 0), 9: (9, 0)})
+
+    def test__multi_source_bfs__when_equally_near__then_earlier_source(self):
+        # when
+        result = multi_source_bfs(self._directed_graph, [self._directed_graph.get_vertex(3),
+                                                         self._directed_graph.get_vertex(5)])
+
+        # then
+        assert_that(result[self._directed_graph.get_vertex(4)]).is_equal_to(
+            (self._directed_graph.get_vertex(3), 1))
+        assert_that(result[self._directed_graph.get_vertex(8)]).is_equal_to(
+            (self._directed_graph.get_vertex(5), 1))
+        assert_that(result[self._directed_graph.get_vertex(0)]).is_equal_to(
+            (self._directed_graph.get_vertex(3), 2))
+
+    def test__multi_source_bfs__when_no_sources__then_empty(self):
+        # when
+        result = multi_source_bfs(self._undirected_graph, [])
+
+        # then
+        assert_that(result).is_empty()
+
+    # endregion
+    # region iter_bfs
+
+    def test__iter_bfs__when_undirected_graph__then_depths_and_parents(self):
+        # when
+        result = list(iter_bfs(self._undirected_graph, [self._undirected_graph.get_vertex(0)]))
+
+        # then
+        depths = {vertex: depth for vertex, depth, _ in result}
+        assert_that({vertex.id: depth for vertex, depth in depths.items()}).is_equal_to(
+            {0: 0, 1: 1, 3: 2, 4: 1, 5: 2, 7: 2, 8: 3})
+        assert_that([depth for _, depth, _ in result]).is_sorted()
+
+        for vertex, depth, parent in result[1:]:
+            assert_that(self._undirected_graph.neighbours(parent)).contains(vertex)
+            assert_that(depths[parent]).is_equal_to(depth - 1)
+
+    def test__iter_bfs__when_many_roots__then_roots_without_parents(self):
+        # when
+        result = list(iter_bfs(self._directed_graph, [self._directed_graph.get_vertex(8),
+                                                      self._directed_graph.get_vertex(6)]))
+
+        # then
+        assert_that(sorted(vertex for vertex, _, _ in result)).is_equal_to(
+            sorted(self._directed_graph.vertices))
+        assert_that([(vertex.id, depth) for vertex, depth, parent in result
+                     if parent is None]).is_equal_to([(8, 0), (6, 0)])
+
+    def test__iter_bfs__when_stopped_early__then_vertices_not_expanded(self):
+        # given
+        graph = self._directed_graph
+
+        with patch.object(graph, "adjacent_edges", wraps=graph.adjacent_edges) as mock:
+            # when
+            result = next((vertex for vertex, _, _ in iter_bfs(graph, [graph.get_vertex(1)])
+                           if vertex.id in (3, 7)))
+
+            # then
+            assert_that(result.id).is_in(3, 7)
+            assert_that(mock.call_count).is_equal_to(1)
+
+    # endregion
+    # region iter_dfs
+
+    def test__iter_dfs__when_directed_path__then_depths_along_path(self):
+        # given
+        graph = DirectedSimpleGraph.from_edges([(i, i + 1) for i in range(5)])
+
+        # when
+        result = list(iter_dfs(graph, [graph.get_vertex(0)]))
+
+        # then
+        assert_that([(vertex.id, depth, parent and parent.id)
+                     for vertex, depth, parent in result]).is_equal_to(
+            [(0, 0, None), (1, 1, 0), (2, 2, 1), (3, 3, 2), (4, 4, 3), (5, 5, 4)])
+
+    def test__iter_dfs__when_undirected_graph__then_same_vertices_as_dfs(self):
+        # given
+        roots = [self._undirected_graph.get_vertex(0), self._undirected_graph.get_vertex(6)]
+        strategy = self._TestingStrategy()
+        dfs_recursive(self._undirected_graph, strategy, roots)
+
+        # when
+        result = list(iter_dfs(self._undirected_graph, roots))
+
+        # then
+        assert_that(sorted(vertex for vertex, _, _ in result)).is_equal_to(
+            sorted(strategy.entries))
+
+        for vertex, _, parent in result:
+            if parent is not None:
+                assert_that(self._undirected_graph.neighbours(parent)).contains(vertex)
+
+    def test__iter_dfs__when_path_longer_than_recursion_limit__then_all_visited(self):
+        # given
+        vertices_count = 5 * sys.getrecursionlimit()
+        graph = DirectedSimpleGraph.from_edges([(i, i + 1) for i in range(vertices_count - 1)])
+
+        # when
+        result = iter_dfs(graph, [graph.get_vertex(0)])
+
+        # then
+        assert_that(max(depth for _, depth, _ in result)).is_equal_to(vertices_count - 1)
+
+    # endregion
+    # region direction_optimizing_bfs
+
+    def test__direction_optimizing_bfs__when_undirected_graph__then_distances_and_parents(self):
+        # when
+        distances, parents = direction_optimizing_bfs(self._undirected_graph,
+                                                      self._undirected_graph.get_vertex(0))
+
+        # then
+        assert_that(list(distances)).is_equal_to([0, 1, -1, 2, 1, 2, -1, 2, 3, -1])
+        assert_that(list(parents)).is_equal_to([-1, 0, -1, 1, 0, 4, -1, 1, 5, -1])
+
+    def test__direction_optimizing_bfs__when_directed_graph__then_distances_and_parents(self):
+        # when
+        distances, parents = direction_optimizing_bfs(self._directed_graph,
+                                                      self._directed_graph.get_vertex(1))
+
+        # then
+        assert_that(list(distances)).is_equal_to([3, 0, -1, 1, 2, -1, -1, 1, -1, -1])
+        assert_that(list(parents)).is_equal_to([4, -1, -1, 1, 3, -1, -1, 1, -1, -1])
+
+    def test__direction_optimizing_bfs__when_bottom_up__then_same_distances(self):
+        # given
+        graph = DirectedCsrGraph.from_graph(self._directed_graph)
+
+        # when
+        distances, parents = direction_optimizing_bfs(graph, graph.get_vertex(5), alpha=1)
+
+        # then
+        assert_that(list(distances)).is_equal_to([2, 3, -1, 4, 1, 0, -1, 4, 1, -1])
+        assert_that(list(parents)).is_equal_to([4, 0, -1, 1, 5, -1, -1, 1, 5, -1])
+
     # endregion
     # region dfs_iterative
 
@@ -177,6 +445,18 @@ class SearchingTest(unittest.TestCase):
         assert_that(sorted(strategy.entries)).is_equal_to(sorted(self._undirected_graph.vertices))
         assert_that(sorted(strategy.exits)).is_equal_to(sorted(self._undirected_graph.vertices))
 
+    def test__dfs_iterative__when_empty_strategy__then_same_order_as_with_callbacks(self):
+        # given
+        roots = [self._undirected_graph.get_vertex(0), self._undirected_graph.get_vertex(6)]
+        strategy = self._TestingStrategy()
+
+        # when
+        result = list(dfs_iterative(self._undirected_graph, EmptyStrategy(), roots))
+
+        # then
+        assert_that(result).is_equal_to(list(dfs_iterative(self._undirected_graph, strategy, roots)))
+        assert_that(result).is_equal_to(strategy.entries)
+
     # endregion
     # region dfs_recursive
 
@@ -238,6 +518,56 @@ class SearchingTest(unittest.TestCase):
         assert_that(sorted(strategy.entries)).is_equal_to(sorted(self._undirected_graph.vertices))
         assert_that(sorted(strategy.exits)).is_equal_to(sorted(self._undirected_graph.vertices))
 
+    def test__dfs_recursive__when_strategy_declares_some_hooks__then_only_declared_called(self):
+        # given
+        strategy = self._TestingStrategy()
+        strategy.hooks = frozenset({"on_exit"})
+
+        # when
+        result = dfs_recursive(self._undirected_graph, strategy,
+                               [self._undirected_graph.get_vertex(0)])
+
+        # then
+        assert_that(sorted(strategy.exits)).is_equal_to(sorted(result))
+        assert_that(strategy.entries).is_empty()
+
+    def test__dfs_recursive__when_empty_strategy_subclass__then_overridden_callbacks_called(self):
+        # given
+        strategy = self._EntriesStrategy()
+
+        # when
+        result = dfs_recursive(self._undirected_graph, strategy,
+                               [self._undirected_graph.get_vertex(0)])
+
+        # then
+        assert_that(strategy.entries).is_equal_to(list(result))
+        assert_that(strategy.hooks).is_equal_to({"on_entry"})
+
+    def test__dfs_recursive__when_path_longer_than_recursion_limit__then_all_visited(self):
+        # given
+        vertices_count = 5 * sys.getrecursionlimit()
+        graph = DirectedSimpleGraph.from_edges([(i, i + 1) for i in range(vertices_count - 1)])
+        strategy = self._TestingStrategy()
+
+        # when
+        result = dfs_recursive(graph, strategy, [graph.get_vertex(0)])
+
+        # then
+        assert_that(list(result)).is_length(vertices_count)
+        assert_that(strategy.exits).is_equal_to(list(reversed(strategy.entries)))
+
+    def test__dfs_recursive__when_empty_strategy__then_same_order_as_with_callbacks(self):
+        # given
+        roots = [self._undirected_graph.get_vertex(0), self._undirected_graph.get_vertex(6)]
+        strategy = self._TestingStrategy()
+
+        # when
+        result = list(dfs_recursive(self._undirected_graph, EmptyStrategy(), roots))
+
+        # then
+        assert_that(result).is_equal_to(list(dfs_recursive(self._undirected_graph, strategy, roots)))
+        assert_that(result).is_equal_to(strategy.entries)
+
     # endregion
 
     class _TestingStrategy(DFSStrategy):
@@ -259,3 +589,10 @@ class SearchingTest(unittest.TestCase):
 
         def on_edge_to_visited(self, vertex, neighbour):
             pass
+
+    class _EntriesStrategy(EmptyStrategy):
+        def __init__(self):
+            self.entries = []
+
+        def on_entry(self, vertex):
+            self.entries.append(vertex)
@@ -1,22 +1,36 @@
 # -*- coding: utf-8 -*-
 """Tests: Algorithms for shortest paths."""
 import unittest
+from unittest.mock import patch
 
 from assertpy import assert_that
 
+from algolib.geometry.dim2 import Point2D
+from algolib.geometry.dim3 import Point3D
 from algolib.graphs import DirectedSimpleGraph, UndirectedSimpleGraph
-from algolib.graphs.algorithms import Paths, bellman_ford, dijkstra, floyd_warshall
+from algolib.graphs.algorithms import NegativeCycleError, Paths, a_star, bellman_ford, \
+    bidirectional_dijkstra, dijkstra, euclidean_heuristic_2d, euclidean_heuristic_3d, \
+    floyd_warshall, johnson, multi_source_dijkstra, reconstruct_path, reconstruct_path_from_hops
 
 
 def _from_list(graph, distances):
     return {graph.get_vertex(i): d for i, d in enumerate(distances)}
 
 
+def _path(graph, vertex_ids):
+    return [graph.get_vertex(i) for i in vertex_ids]
+
+
 def _from_matrix(graph, distances):
     return {(graph.get_vertex(i), graph.get_vertex(j)): d for i, ds in enumerate(distances)
             for j, d in enumerate(ds)}
 
 
+def _from_sources(results):
+    return {(source, vertex): d for source, distances in results
+            for vertex, d in distances.items()}
+
+
 class PathsTest(unittest.TestCase):
     INF = Paths.INFINITY
 
@@ -137,6 +151,21 @@ class PathsTest(unittest.TestCase):
         # then
         assert_that(result).is_equal_to(expected)
 
+    def test__bellman_ford__when_predecessors__then_paths_reconstructed(self):
+        # given
+        predecessors = {}
+        source = self._directed_graph.get_vertex(1)
+
+        # when
+        bellman_ford(self._directed_graph, source, predecessors=predecessors)
+
+        # then
+        assert_that(reconstruct_path(predecessors, source, self._directed_graph.get_vertex(0))) \
+            .is_equal_to(_path(self._directed_graph, [1, 4, 3, 0]))
+        assert_that(reconstruct_path(predecessors, source, source)).is_equal_to([source])
+        assert_that(reconstruct_path(predecessors, source,
+                                     self._directed_graph.get_vertex(2))).is_empty()
+
     def test__bellman_ford__when_negative_cycle__then_value_error(self):
         # given
         self._directed_graph.add_edge_between(self._directed_graph.get_vertex(8),
@@ -149,6 +178,35 @@ class PathsTest(unittest.TestCase):
         # then
         assert_that(function).raises(ValueError).when_called_with(self._directed_graph)
 
+    def test__bellman_ford__when_negative_cycle__then_error_with_cycle(self):
+        # given
+        self._directed_graph.add_edge_between(self._directed_graph.get_vertex(8),
+                                              self._directed_graph.get_vertex(3), self._Weight(-20))
+
+        # when
+        with self.assertRaises(NegativeCycleError) as context:
+            bellman_ford(self._directed_graph, self._directed_graph.get_vertex(1))
+
+        # then
+        cycle = context.exception.cycle
+        assert_that(cycle).is_not_empty()
+        assert_that(sum(self._directed_graph.properties[
+                            self._directed_graph.get_edge(v, u)].weight
+                        for v, u in zip(cycle, cycle[1:] + cycle[:1]))).is_negative()
+
+    def test__bellman_ford__when_negative_cycle_not_reachable__then_shortest_paths_lengths(self):
+        # given
+        self._directed_graph.add_edge_between(self._directed_graph.get_vertex(2),
+                                              self._directed_graph.get_vertex(2), self._Weight(-1))
+        distances = [20, 0, self.INF, 17, 7, 8, 12, 12, 10, 20]
+        expected = _from_list(self._directed_graph, distances)
+
+        # when
+        result = bellman_ford(self._directed_graph, self._directed_graph.get_vertex(1))
+
+        # then
+        assert_that(result).is_equal_to(expected)
+
     # endregion
     # region dijkstra
 
@@ -175,14 +233,255 @@ class PathsTest(unittest.TestCase):
         assert_that(result).contains_only(*expected)
         assert_that(result).contains_entry(*({k: v} for k, v in expected.items()))
 
+    def test__dijkstra__when_targets__then_stops_after_targets_reached(self):
+        # given
+        distances = [self.INF, 0, self.INF, self.INF, 7, 8, self.INF, self.INF, self.INF,
+                     self.INF]
+        expected = _from_list(self._directed_graph, distances)
+
+        # when
+        result = dijkstra(self._directed_graph, self._directed_graph.get_vertex(1),
+                          targets=[self._directed_graph.get_vertex(5)])
+
+        # then
+        assert_that(result).is_equal_to(expected)
+
+    def test__dijkstra__when_max_distance__then_further_vertices_not_reached(self):
+        # given
+        distances = [self.INF, 0, self.INF, self.INF, 7, 8, self.INF, self.INF, 10, self.INF]
+        expected = _from_list(self._directed_graph, distances)
+
+        # when
+        result = dijkstra(self._directed_graph, self._directed_graph.get_vertex(1),
+                          max_distance=10)
+
+        # then
+        assert_that(result).is_equal_to(expected)
+
+    def test__dijkstra__when_predecessors__then_shortest_paths_tree(self):
+        # given
+        parents = {0: 3, 3: 4, 4: 1, 5: 4, 6: 5, 7: 1, 8: 5, 9: 8}
+        expected = {self._directed_graph.get_vertex(v): self._directed_graph.get_vertex(p)
+                    for v, p in parents.items()}
+        predecessors = {}
+
+        # when
+        dijkstra(self._directed_graph, self._directed_graph.get_vertex(1),
+                 predecessors=predecessors)
+
+        # then
+        assert_that(predecessors).is_equal_to(expected)
+
     def test__dijkstra__when_negative_edge__then_value_error(self):
+        # given
+        self._directed_graph.add_edge_between(self._directed_graph.get_vertex(1),
+                                              self._directed_graph.get_vertex(2), self._Weight(-2))
+
+        # when
+        def function(graph):
+            dijkstra(graph, graph.get_vertex(1))
+
+        # then
+        assert_that(function).raises(ValueError).when_called_with(self._directed_graph)
+
+    def test__dijkstra__when_negative_edge_not_reached__then_shortest_paths_lengths(self):
+        # given
+        self._directed_graph.add_edge_between(self._directed_graph.get_vertex(2),
+                                              self._directed_graph.get_vertex(1), self._Weight(-2))
+        distances = [20, 0, self.INF, 17, 7, 8, 12, 12, 10, 20]
+        expected = _from_list(self._directed_graph, distances)
+
+        # when
+        result = dijkstra(self._directed_graph, self._directed_graph.get_vertex(1))
+
+        # then
+        assert_that(result).is_equal_to(expected)
+
+    # endregion
+    # region multi_source_dijkstra
+
+    def test__multi_source_dijkstra__when_directed_graph__then_distances_from_nearest(self):
+        # given
+        sources = [self._directed_graph.get_vertex(2), self._directed_graph.get_vertex(3)]
+        single = {source: dijkstra(self._directed_graph, source) for source in sources}
+
+        # when
+        result = multi_source_dijkstra(self._directed_graph, sources)
+
+        # then
+        assert_that(sorted(result)).is_equal_to(sorted(self._directed_graph.vertices))
+
+        for vertex, (source, distance) in result.items():
+            assert_that(distance).is_equal_to(min(single[s][vertex] for s in sources))
+            assert_that(single[source][vertex]).is_equal_to(distance)
+
+    def test__multi_source_dijkstra__when_single_source__then_same_as_dijkstra(self):
+        # given
+        source = self._undirected_graph.get_vertex(1)
+        expected = {vertex: (source, distance) for vertex, distance in
+                    dijkstra(self._undirected_graph, source).items() if distance < self.INF}
+
+        # when
+        result = multi_source_dijkstra(self._undirected_graph, [source])
+
+        # then
+        assert_that(result).is_equal_to(expected)
+
+    def test__multi_source_dijkstra__when_undirected_graph__then_nearest_sources(self):
+        # given
+        sources = [self._undirected_graph.get_vertex(3), self._undirected_graph.get_vertex(1)]
+
+        # when
+        result = multi_source_dijkstra(self._undirected_graph, sources)
+
+        # then
+        assert_that(result[self._undirected_graph.get_vertex(0)]).is_equal_to(
+            (self._undirected_graph.get_vertex(3), 3))
+        assert_that(result[self._undirected_graph.get_vertex(4)]).is_equal_to(
+            (self._undirected_graph.get_vertex(1), 7))
+        assert_that(result[self._undirected_graph.get_vertex(5)]).is_equal_to(
+            (self._undirected_graph.get_vertex(3), 7))
+
+    def test__multi_source_dijkstra__when_equal_distances__then_source_given_earlier(self):
+        # given
+        graph = DirectedSimpleGraph(["A", "B", "X", "Y", "Z"])
+
+        for source, destination, weight in [("A", "Y", 4), ("Y", "X", 1), ("B", "Z", 3),
+                                            ("Z", "X", 2)]:
+            graph.add_edge_between(graph.get_vertex(source), graph.get_vertex(destination),
+                                   self._Weight(weight))
+
+        # when
+        result = multi_source_dijkstra(graph, [graph.get_vertex("A"), graph.get_vertex("B")])
+
+        # then
+        assert_that(result[graph.get_vertex("X")]).is_equal_to((graph.get_vertex("A"), 5))
+
+    def test__multi_source_dijkstra__when_negative_edge__then_value_error(self):
         # given
         self._directed_graph.add_edge_between(self._directed_graph.get_vertex(2),
                                               self._directed_graph.get_vertex(1), self._Weight(-2))
 
         # when
         def function(graph):
-            dijkstra(graph, graph.get_vertex(1))
+            multi_source_dijkstra(graph, [graph.get_vertex(1)])
+
+        # then
+        assert_that(function).raises(ValueError).when_called_with(self._directed_graph)
+
+    # endregion
+    # region bidirectional_dijkstra
+
+    def test__bidirectional_dijkstra__when_directed_graph__then_shortest_path(self):
+        # when
+        result = bidirectional_dijkstra(self._directed_graph, self._directed_graph.get_vertex(1),
+                                        self._directed_graph.get_vertex(0))
+
+        # then
+        assert_that(result).is_equal_to((20, _path(self._directed_graph, [1, 4, 3, 0])))
+
+    def test__bidirectional_dijkstra__when_undirected_graph__then_same_distances_as_dijkstra(self):
+        for source in self._undirected_graph.vertices:
+            expected = dijkstra(self._undirected_graph, source)
+
+            for target in self._undirected_graph.vertices:
+                with self.subTest(source=source, target=target):
+                    # when
+                    distance, path = bidirectional_dijkstra(self._undirected_graph, source, target)
+
+                    # then
+                    assert_that(distance).is_equal_to(expected[target])
+                    assert_that(sum((self._undirected_graph.properties[
+                                         self._undirected_graph.get_edge(v, u)].weight
+                                     for v, u in zip(path, path[1:])),
+                                    self.INF if len(path) == 0 else 0)).is_equal_to(distance)
+
+    def test__bidirectional_dijkstra__when_not_reachable__then_infinity_and_empty_path(self):
+        # when
+        result = bidirectional_dijkstra(self._directed_graph, self._directed_graph.get_vertex(1),
+                                        self._directed_graph.get_vertex(2))
+
+        # then
+        assert_that(result).is_equal_to((self.INF, []))
+
+    def test__bidirectional_dijkstra__when_negative_edge__then_value_error(self):
+        # given
+        self._directed_graph.add_edge_between(self._directed_graph.get_vertex(1),
+                                              self._directed_graph.get_vertex(2), self._Weight(-2))
+
+        # when
+        def function(graph):
+            bidirectional_dijkstra(graph, graph.get_vertex(1), graph.get_vertex(0))
+
+        # then
+        assert_that(function).raises(ValueError).when_called_with(self._directed_graph)
+
+    # endregion
+    # region a_star
+
+    def test__a_star__when_zero_heuristic__then_same_as_dijkstra(self):
+        # given
+        source = self._directed_graph.get_vertex(1)
+        expected = dijkstra(self._directed_graph, source)
+
+        for target in self._directed_graph.vertices:
+            with self.subTest(target=target):
+                # when
+                distance, _ = a_star(self._directed_graph, source, target, lambda v, t: 0.0)
+
+                # then
+                assert_that(distance).is_equal_to(expected[target])
+
+    def test__a_star__when_euclidean_heuristic_2d__then_shortest_path(self):
+        # given
+        points = [Point2D(0, 0), Point2D(3, 0), Point2D(3, 4), Point2D(0, 4), Point2D(1, 2)]
+        graph = UndirectedSimpleGraph.from_edges(
+            [(0, 1, self._Weight(3)), (1, 2, self._Weight(4)), (0, 3, self._Weight(4)),
+             (3, 2, self._Weight(3)), (0, 4, self._Weight(3)), (4, 2, self._Weight(3))])
+
+        for i, point in enumerate(points):
+            graph.properties[graph.get_vertex(i)] = point
+
+        # when
+        result = a_star(graph, graph.get_vertex(0), graph.get_vertex(2),
+                        euclidean_heuristic_2d(graph))
+
+        # then
+        assert_that(result).is_equal_to((6, _path(graph, [0, 4, 2])))
+
+    def test__a_star__when_euclidean_heuristic_3d__then_shortest_path(self):
+        # given
+        points = [Point3D(0, 0, 0), Point3D(1, 0, 0), Point3D(1, 1, 1), Point3D(0, 1, 1)]
+        graph = DirectedSimpleGraph.from_edges(
+            [(0, 1, self._Weight(1)), (1, 2, self._Weight(2)), (0, 3, self._Weight(2)),
+             (3, 2, self._Weight(2))])
+
+        for i, point in enumerate(points):
+            graph.properties[graph.get_vertex(i)] = point
+
+        # when
+        result = a_star(graph, graph.get_vertex(0), graph.get_vertex(2),
+                        euclidean_heuristic_3d(graph))
+
+        # then
+        assert_that(result).is_equal_to((3, _path(graph, [0, 1, 2])))
+
+    def test__a_star__when_not_reachable__then_infinity_and_empty_path(self):
+        # when
+        result = a_star(self._directed_graph, self._directed_graph.get_vertex(1),
+                        self._directed_graph.get_vertex(2), lambda v, t: 0.0)
+
+        # then
+        assert_that(result).is_equal_to((self.INF, []))
+
+    def test__a_star__when_negative_edge__then_value_error(self):
+        # given
+        self._directed_graph.add_edge_between(self._directed_graph.get_vertex(1),
+                                              self._directed_graph.get_vertex(2), self._Weight(-2))
+
+        # when
+        def function(graph):
+            a_star(graph, graph.get_vertex(1), graph.get_vertex(9), lambda v, t: 0.0)
 
         # then
         assert_that(function).raises(ValueError).when_called_with(self._directed_graph)
@@ -209,6 +508,20 @@ class PathsTest(unittest.TestCase):
         # then
         assert_that(result).is_equal_to(expected)
 
+    def test__floyd_warshall__when_next_hops__then_paths_reconstructed(self):
+        # given
+        next_hops = {}
+
+        # when
+        floyd_warshall(self._directed_graph, next_hops=next_hops)
+
+        # then
+        assert_that(reconstruct_path_from_hops(next_hops, self._directed_graph.get_vertex(2),
+                                               self._directed_graph.get_vertex(9))) \
+            .is_equal_to(_path(self._directed_graph, [2, 4, 5, 8, 9]))
+        assert_that(reconstruct_path_from_hops(next_hops, self._directed_graph.get_vertex(5),
+                                               self._directed_graph.get_vertex(0))).is_empty()
+
     def test__floyd_warshall__when_negative_edge__then_edge_included(self):
         # given
         distances = [[0, 4, self.INF, 9, 11, 12, 16, 14, 14, 24],
@@ -252,6 +565,80 @@ class PathsTest(unittest.TestCase):
         # then
         assert_that(result).is_equal_to(expected)
 
+    @patch("algolib.graphs.algorithms.shortest_paths.numpy", None)
+    def test__floyd_warshall__when_no_numpy__then_same_distances_and_next_hops(self):
+        # given
+        self._directed_graph.add_edge_between(self._directed_graph.get_vertex(8),
+                                              self._directed_graph.get_vertex(3), self._Weight(-5))
+        expected = dict(bellman_ford(self._directed_graph, self._directed_graph.get_vertex(6)))
+        next_hops = {}
+
+        # when
+        result = floyd_warshall(self._directed_graph, next_hops=next_hops)
+
+        # then
+        assert_that(result.row(self._directed_graph.get_vertex(6))).is_equal_to(expected)
+        assert_that(reconstruct_path_from_hops(next_hops, self._directed_graph.get_vertex(6),
+                                               self._directed_graph.get_vertex(3))) \
+            .is_equal_to(_path(self._directed_graph, [6, 5, 8, 3]))
+
+    def test__floyd_warshall__then_distance_matrix(self):
+        # given
+        source = self._directed_graph.get_vertex(2)
+
+        # when
+        result = floyd_warshall(self._directed_graph)
+
+        # then
+        assert_that(result).is_length(100)
+        assert_that(result[(source, self._directed_graph.get_vertex(9))]).is_equal_to(19)
+        assert_that(result.row(source)).is_equal_to(dijkstra(self._directed_graph, source))
+
+    # endregion
+    # region johnson
+
+    def test__johnson__when_directed_graph__then_same_as_floyd_warshall(self):
+        # given
+        expected = floyd_warshall(self._directed_graph)
+
+        # when
+        result = johnson(self._directed_graph)
+
+        # then
+        assert_that(_from_sources(result)).is_equal_to(expected)
+
+    def test__johnson__when_negative_edge__then_same_as_floyd_warshall(self):
+        # given
+        self._directed_graph.add_edge_between(self._directed_graph.get_vertex(8),
+                                              self._directed_graph.get_vertex(3), self._Weight(-5))
+        expected = floyd_warshall(self._directed_graph)
+
+        # when
+        result = johnson(self._directed_graph)
+
+        # then
+        assert_that(_from_sources(result)).is_equal_to(expected)
+
+    def test__johnson__when_processes__then_same_as_floyd_warshall(self):
+        # given
+        self._directed_graph.add_edge_between(self._directed_graph.get_vertex(8),
+                                              self._directed_graph.get_vertex(3), self._Weight(-5))
+        expected = floyd_warshall(self._directed_graph)
+
+        # when
+        result = johnson(self._directed_graph, processes=2)
+
+        # then
+        assert_that(_from_sources(result)).is_equal_to(expected)
+
+    def test__johnson__when_negative_cycle__then_negative_cycle_error(self):
+        # given
+        self._directed_graph.add_edge_between(self._directed_graph.get_vertex(8),
+                                              self._directed_graph.get_vertex(3), self._Weight(-20))
+
+        # then
+        assert_that(johnson).raises(NegativeCycleError).when_called_with(self._directed_graph)
+
     # endregion
 
     class _Weight:
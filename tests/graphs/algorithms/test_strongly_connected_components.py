@@ -1,11 +1,18 @@
 # -*- coding: utf-8 -*-
 """Tests: Strongly connected components algorithm."""
+import sys
 import unittest
 
 from assertpy import assert_that
 
-from algolib.graphs import DirectedSimpleGraph
-from algolib.graphs.algorithms import find_scc
+from algolib.graphs import DirectedCsrGraph, DirectedSimpleGraph
+from algolib.graphs.algorithms import condensation, find_scc, find_scc_ids
+
+
+def _many_components_graph():
+    return DirectedSimpleGraph.from_edges(
+        [(0, 4), (0, 5), (1, 0), (2, 3), (3, 1), (4, 1), (4, 3), (6, 5), (6, 9), (7, 4), (7, 6),
+         (8, 3), (8, 7), (9, 8)], range(10))
 
 
 class StronglyConnectedComponentsTest(unittest.TestCase):
@@ -76,3 +83,77 @@ class StronglyConnectedComponentsTest(unittest.TestCase):
         assert_that(result).is_length(4)
         assert_that(result).contains_only({graph.get_vertex(0)}, {graph.get_vertex(1)},
                                           {graph.get_vertex(2)}, {graph.get_vertex(3)})
+
+    @staticmethod
+    def test__find_scc__when_cycle_longer_than_recursion_limit__then_single_component():
+        # given
+        vertices_count = 5 * sys.getrecursionlimit()
+        graph = DirectedSimpleGraph.from_edges(
+            [(i, (i + 1) % vertices_count) for i in range(vertices_count)])
+
+        # when
+        result = list(find_scc(graph))
+
+        # then
+        assert_that(result).is_length(1)
+        assert_that(result[0]).is_equal_to(set(graph.vertices))
+
+    @staticmethod
+    def test__find_scc_ids__when_many_components__then_ids_in_topological_order():
+        # given
+        graph = _many_components_graph()
+
+        # when
+        result = find_scc_ids(graph)
+
+        # then
+        scc_ids = dict(zip((vertex.id for vertex in graph.vertices), result))
+        assert_that(sorted(set(result))).is_equal_to([0, 1, 2, 3])
+        assert_that({scc_ids[0], scc_ids[1], scc_ids[3], scc_ids[4]}).is_length(1)
+        assert_that({scc_ids[6], scc_ids[7], scc_ids[8], scc_ids[9]}).is_length(1)
+        assert_that({scc_ids[0], scc_ids[2], scc_ids[5], scc_ids[6]}).is_length(4)
+
+        for edge in graph.edges:
+            assert_that(scc_ids[edge.source.id]).is_less_than_or_equal_to(
+                scc_ids[edge.destination.id])
+
+    @staticmethod
+    def test__find_scc_ids__when_csr_graph__then_same_components():
+        # given
+        graph = _many_components_graph()
+        csr_graph = DirectedCsrGraph.from_graph(graph)
+
+        # when
+        result = find_scc_ids(csr_graph)
+
+        # then
+        assert_that(list(result)).is_equal_to(list(find_scc_ids(graph)))
+
+    @staticmethod
+    def test__find_scc_ids__when_path_longer_than_recursion_limit__then_each_vertex_separate():
+        # given
+        vertices_count = 5 * sys.getrecursionlimit()
+        graph = DirectedSimpleGraph.from_edges([(i, i + 1) for i in range(vertices_count - 1)])
+
+        # when
+        result = find_scc_ids(graph)
+
+        # then
+        assert_that(list(result)).is_equal_to(list(range(vertices_count)))
+
+    @staticmethod
+    def test__condensation__when_many_components__then_acyclic_graph_of_components():
+        # given
+        graph = _many_components_graph()
+        scc_ids = find_scc_ids(graph)
+        scc_of = dict(zip((vertex.id for vertex in graph.vertices), scc_ids))
+
+        # when
+        result = condensation(graph, scc_ids)
+
+        # then
+        assert_that(result.vertices_count).is_equal_to(4)
+        assert_that(sorted((edge.source.id, edge.destination.id) for edge in result.edges)) \
+            .is_equal_to(sorted({(scc_of[6], scc_of[5]), (scc_of[7], scc_of[4]),
+                                 (scc_of[8], scc_of[3]), (scc_of[0], scc_of[5]),
+                                 (scc_of[2], scc_of[3])}))
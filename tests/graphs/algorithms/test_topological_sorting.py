@@ -1,12 +1,21 @@
 # -*- coding: utf-8 -*-
 """Tests: Algorithms for topological sorting."""
+import random
 import unittest
 
 from assertpy import assert_that
 
 from algolib.graphs import DirectedSimpleGraph
-from algolib.graphs.algorithms import DirectedCyclicGraphError, dfs_topological_sort, \
-    inputs_topological_sort
+from algolib.graphs.algorithms import DirectedCyclicGraphError, DynamicTopologicalOrder, \
+    dfs_topological_sort, inputs_topological_sort, reachable
+
+
+def _assert_topological(graph, order):
+    positions = {vertex: i for i, vertex in enumerate(order)}
+    assert_that(sorted(order)).is_equal_to(sorted(graph.vertices))
+
+    for edge in graph.edges:
+        assert_that(positions[edge.source]).is_less_than(positions[edge.destination])
 
 
 class TopologicalSortingTest(unittest.TestCase):
@@ -160,3 +169,105 @@ class TopologicalSortingTest(unittest.TestCase):
         assert_that(result).is_equal_to(sorted(graph.vertices))
 
     # endregion
+    # region DynamicTopologicalOrder
+
+    @staticmethod
+    def test__dynamic_topological_order__when_cyclic_graph__then_directed_cyclic_graph_error():
+        # given
+        graph = DirectedSimpleGraph.from_edges([(0, 1), (1, 2), (2, 0)], range(4))
+
+        # when
+        def function(graph_):
+            DynamicTopologicalOrder(graph_)
+
+        # then
+        assert_that(function).raises(DirectedCyclicGraphError).when_called_with(graph)
+
+    @staticmethod
+    def test__dynamic_topological_order__when_edge_against_order__then_vertices_moved():
+        # given
+        graph = DirectedSimpleGraph.from_edges([(0, 1), (1, 2), (3, 4)], range(6))
+        test_object = DynamicTopologicalOrder(graph)
+        destination, source = sorted([graph.get_vertex(1), graph.get_vertex(4)],
+                                     key=test_object.order.index)
+
+        # when
+        test_object.add_edge_between(source, destination)
+
+        # then
+        assert_that(test_object.comes_before(source, destination)).is_true()
+        _assert_topological(graph, test_object.order)
+
+    @staticmethod
+    def test__dynamic_topological_order__when_edge_closes_cycle__then_error_and_graph_unchanged():
+        # given
+        graph = DirectedSimpleGraph.from_edges([(0, 1), (1, 2), (2, 3)], range(5))
+        test_object = DynamicTopologicalOrder(graph)
+        order = test_object.order
+
+        # when
+        def function(source, destination):
+            test_object.add_edge_between(source, destination)
+
+        # then
+        assert_that(function).raises(DirectedCyclicGraphError).when_called_with(
+            graph.get_vertex(3), graph.get_vertex(1))
+        assert_that(graph.edges_count).is_equal_to(3)
+        assert_that(test_object.order).is_equal_to(order)
+
+    @staticmethod
+    def test__dynamic_topological_order__when_loop__then_directed_cyclic_graph_error():
+        # given
+        graph = DirectedSimpleGraph(range(3))
+        test_object = DynamicTopologicalOrder(graph)
+
+        # when
+        def function(vertex):
+            test_object.add_edge_between(vertex, vertex)
+
+        # then
+        assert_that(function).raises(DirectedCyclicGraphError).when_called_with(
+            graph.get_vertex(1))
+
+    @staticmethod
+    def test__dynamic_topological_order__when_foreign_vertex__then_value_error():
+        # given
+        graph = DirectedSimpleGraph(range(3))
+        test_object = DynamicTopologicalOrder(graph)
+        order = test_object.order
+        vertex = DirectedSimpleGraph([7]).get_vertex(7)
+
+        # when
+        def function(source, destination):
+            test_object.add_edge_between(source, destination)
+
+        # then
+        assert_that(function).raises(ValueError).when_called_with(graph.get_vertex(1), vertex)
+        assert_that(graph.edges_count).is_equal_to(0)
+        assert_that(test_object.order).is_equal_to(order)
+
+    @staticmethod
+    def test__dynamic_topological_order__when_random_edges__then_topological_order():
+        # given
+        generator = random.Random(0)
+        graph = DirectedSimpleGraph(range(30))
+        test_object = DynamicTopologicalOrder(graph)
+        vertices = list(graph.vertices)
+        pairs = generator.sample([(source, destination) for source in vertices
+                                  for destination in vertices if source != destination], 200)
+
+        for source, destination in pairs:
+            order = test_object.order
+
+            # when
+            try:
+                test_object.add_edge_between(source, destination)
+            except DirectedCyclicGraphError:
+                # then
+                assert_that(reachable(graph, [destination])).contains(source)
+                assert_that(test_object.order).is_equal_to(order)
+            else:
+                # then
+                _assert_topological(graph, test_object.order)
+
+    # endregion
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import sys
 import unittest
 
 from assertpy import assert_that
@@ -54,6 +55,21 @@ class TreeDiameterTest(unittest.TestCase):
         # then
         assert_that(result).is_equal_to(1015)
 
+    def test__count_diameter__when_path_longer_than_recursion_limit__then_path_length(self):
+        # given
+        vertices_count = 5 * sys.getrecursionlimit()
+        weight = self._Weight(1)
+        tree = TreeGraph(0)
+
+        for i in range(1, vertices_count):
+            tree.add_vertex(i, tree.get_vertex(i - 1), None, weight)
+
+        # when
+        result = count_diameter(tree)
+
+        # then
+        assert_that(result).is_equal_to(vertices_count - 1)
+
     class _Weight:
         def __init__(self, weight):
             self.weight = weight
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""Tests: Structure of frozen graph in compressed sparse row format."""
+import unittest
+
+from assertpy import assert_that
+
+from algolib.graphs import DirectedCsrGraph, DirectedSimpleGraph, Edge, UndirectedCsrGraph, \
+    UndirectedSimpleGraph, Vertex
+
+
+class DirectedCsrGraphTest(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.test_object = None
+
+    def setUp(self):
+        self.test_object = DirectedCsrGraph(
+            range(10), [(7, 7), (1, 5, "x"), (2, 4), (8, 0), (6, 3), (3, 6), (9, 3), (1, 1),
+                        (1, 3), (1, 9)])
+
+    def test__from_graph__then_same_vertices_edges_and_properties(self):
+        # given
+        graph = DirectedSimpleGraph(range(5))
+        edge = graph.add_edge_between(Vertex(0), Vertex(3), "edge")
+        graph.add_edge_between(Vertex(3), Vertex(0))
+        graph.add_edge_between(Vertex(4), Vertex(4))
+        graph.properties[Vertex(2)] = "vertex"
+
+        # when
+        result = DirectedCsrGraph.from_graph(graph)
+
+        # then
+        assert_that(sorted(result.vertices)).is_equal_to(sorted(graph.vertices))
+        assert_that(sorted(result.edges)).is_equal_to(sorted(graph.edges))
+        assert_that(result.properties[edge]).is_equal_to("edge")
+        assert_that(result.properties[Vertex(2)]).is_equal_to("vertex")
+
+    def test__init__when_duplicated_edge__then_value_error(self):
+        # then
+        assert_that(DirectedCsrGraph).raises(ValueError).when_called_with(
+            range(3), [(0, 1), (1, 2), (0, 1)])
+
+    def test__properties_op_getitem__when_not_existing__then_value_error(self):
+        # when
+        def function(item):
+            return self.test_object.properties[item]
+
+        # then
+        assert_that(function).raises(ValueError).when_called_with(Vertex(14))
+        assert_that(function).raises(ValueError).when_called_with(Edge(Vertex(2), Vertex(8)))
+        assert_that(function).raises(ValueError).when_called_with(Edge(Vertex(5), Vertex(1)))
+
+    def test__edges_count__then_number_of_edges(self):
+        # when
+        result = self.test_object.edges_count
+
+        # then
+        assert_that(result).is_equal_to(10)
+
+    def test__edge_column__then_values_in_order_of_edges(self):
+        # given
+        graph = DirectedCsrGraph(range(3), [(0, 1, 1.5), (1, 2), (2, 0, -2.0)])
+
+        # when
+        result = graph.edge_column("real", default=0.0)
+
+        # then
+        assert_that(result.edges).is_equal_to(list(graph.edges))
+        assert_that(list(result.values)).is_equal_to([1.5, 0.0, -2.0])
+
+    def test__get_edge__when_in_direction__then_edge(self):
+        # when
+        result = self.test_object.get_edge(Vertex(1), 5)
+
+        # then
+        assert_that(result).is_equal_to(Edge(Vertex(1), Vertex(5)))
+        assert_that(self.test_object.properties[result]).is_equal_to("x")
+
+    def test__get_edge__when_reversed_direction__then_key_error(self):
+        # when
+        def function(source_, destination_):
+            return self.test_object.get_edge(source_, destination_)
+
+        # then
+        assert_that(function).raises(KeyError).when_called_with(Vertex(5), Vertex(1))
+
+    def test__neighbours__then_destination_vertices_of_outgoing_edges(self):
+        # when
+        result = self.test_object.neighbours(Vertex(1))
+
+        # then
+        assert_that(sorted(result)).is_equal_to([Vertex(1), Vertex(3), Vertex(5), Vertex(9)])
+
+    def test__input_degree__then_number_of_incoming_edges(self):
+        # when
+        result = self.test_object.input_degree(Vertex(3))
+
+        # then
+        assert_that(result).is_equal_to(3)
+
+    def test__predecessors__then_source_vertices_of_incoming_edges(self):
+        # when
+        result = self.test_object.predecessors(Vertex(3))
+
+        # then
+        assert_that(sorted(result)).is_equal_to([Vertex(1), Vertex(6), Vertex(9)])
+
+    def test__incoming_edges__then_edges_to_vertex(self):
+        # when
+        result = self.test_object.incoming_edges(Vertex(1))
+
+        # then
+        assert_that(result).is_equal_to([Edge(Vertex(1), Vertex(1))])
+
+    def test__compressed_incoming_rows__then_sources_of_incoming_edges(self):
+        # given
+        index = self.test_object.vertex_index(Vertex(3))
+
+        # when
+        offsets, sources = self.test_object.compressed_incoming_rows()
+
+        # then
+        assert_that(list(sources[offsets[index]:offsets[index + 1]])).is_equal_to([1, 6, 9])
+
+    def test__reverse__then_all_edges_have_reversed_direction(self):
+        # given
+        edge = self.test_object.get_edge(1, 5)
+
+        # when
+        self.test_object.reverse()
+
+        # then
+        assert_that(sorted(self.test_object.neighbours(Vertex(3)))).is_equal_to(
+            [Vertex(1), Vertex(6), Vertex(9)])
+        assert_that(self.test_object.properties[edge.reversed()]).is_equal_to("x")
+
+    def test__reverse__when_edges_traversed__then_reversed_edges(self):
+        # given
+        edges = list(self.test_object.adjacent_edges(Vertex(1)))
+
+        # when
+        self.test_object.reverse()
+
+        # then
+        assert_that(sorted(self.test_object.incoming_edges(Vertex(1)))).is_equal_to(
+            sorted(edge.reversed() for edge in edges))
+        assert_that(sorted(self.test_object.edges)).is_equal_to(
+            sorted(edge.reversed() for edge in self.test_object.reversed_copy().edges))
+
+    def test__adjacent_edges__when_called_again__then_same_edge_objects(self):
+        # given
+        edges = self.test_object.adjacent_edges(Vertex(1))
+
+        # when
+        result = self.test_object.adjacent_edges(Vertex(1))
+
+        # then
+        assert_that(result).is_length(len(edges))
+
+        for edge, result_edge in zip(edges, result):
+            assert_that(result_edge).is_same_as(edge)
+
+    def test__reversed_copy__then_original_unchanged(self):
+        # given
+        self.test_object.properties[Vertex(2)] = "vertex"
+
+        # when
+        result = self.test_object.reversed_copy()
+        result.properties[Vertex(2)] = "changed"
+
+        # then
+        assert_that(sorted(result.neighbours(Vertex(3)))).is_equal_to(
+            [Vertex(1), Vertex(6), Vertex(9)])
+        assert_that(result.properties[Edge(Vertex(5), Vertex(1))]).is_equal_to("x")
+        assert_that(sorted(self.test_object.neighbours(Vertex(3)))).is_equal_to([Vertex(6)])
+        assert_that(self.test_object.properties[Vertex(2)]).is_equal_to("vertex")
+
+
+class UndirectedCsrGraphTest(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.test_object = None
+
+    def setUp(self):
+        self.test_object = UndirectedCsrGraph(
+            range(10), [(7, 7), (1, 5, "x"), (2, 4), (8, 0), (6, 3), (9, 3), (1, 1), (3, 1)])
+
+    def test__from_graph__then_same_vertices_and_edges(self):
+        # given
+        graph = UndirectedSimpleGraph(range(5))
+        graph.add_edge_between(Vertex(0), Vertex(3))
+        graph.add_edge_between(Vertex(3), Vertex(1))
+        graph.add_edge_between(Vertex(4), Vertex(4))
+
+        # when
+        result = UndirectedCsrGraph.from_graph(graph)
+
+        # then
+        assert_that(sorted(result.edges)).is_equal_to(sorted(graph.edges))
+        assert_that(sorted(result.neighbours(Vertex(3)))).is_equal_to([Vertex(0), Vertex(1)])
+
+    def test__init__when_duplicated_reversed_edge__then_value_error(self):
+        # then
+        assert_that(UndirectedCsrGraph).raises(ValueError).when_called_with(
+            range(3), [(0, 1), (1, 2), (1, 0)])
+
+    def test__get_edge__when_reversed_direction__then_edge(self):
+        # when
+        result = self.test_object.get_edge(Vertex(5), Vertex(1))
+
+        # then
+        assert_that(result).is_equal_to(Edge(Vertex(1), Vertex(5)))
+        assert_that(self.test_object.properties[result]).is_equal_to("x")
+
+    def test__neighbours__then_vertices_of_adjacent_edges(self):
+        # when
+        result = self.test_object.neighbours(Vertex(1))
+
+        # then
+        assert_that(sorted(result)).is_equal_to([Vertex(1), Vertex(3), Vertex(5)])
+
+    def test__output_degree__then_number_of_adjacent_edges(self):
+        # when
+        result = self.test_object.output_degree(Vertex(3))
+
+        # then
+        assert_that(result).is_equal_to(3)
+
+    def test__as_directed__then_directed_graph(self):
+        # when
+        result = self.test_object.as_directed()
+
+        # then
+        assert_that(result.edges_count).is_equal_to(14)
+        assert_that(result.properties[Edge(Vertex(5), Vertex(1))]).is_equal_to("x")
@@ -71,6 +71,31 @@ class DirectedSimpleGraphTest(unittest.TestCase):
         assert_that(self.test_object.properties[vertex]).is_none()
         assert_that(self.test_object.properties[edge]).is_none()
 
+    def test__edge_column__then_attribute_values_by_edge(self):
+        # given
+        edge1 = self.test_object.add_edge_between(Vertex(6), Vertex(7), 2.5 + 1j)
+        edge2 = self.test_object.add_edge_between(Vertex(7), Vertex(6), 4.0 - 3j)
+        edge3 = self.test_object.add_edge_between(Vertex(1), Vertex(2))
+
+        # when
+        result = self.test_object.edge_column("imag", default=10.0)
+
+        # then
+        assert_that(dict(result)).is_equal_to({edge1: 1.0, edge2: -3.0, edge3: 10.0})
+        assert_that(result.values[result.edge_id(edge2)]).is_equal_to(-3.0)
+
+    def test__edge_column__when_no_attribute__then_attribute_error(self):
+        # given
+        self.test_object.add_edge_between(Vertex(6), Vertex(7), 2.5 + 1j)
+        self.test_object.add_edge_between(Vertex(1), Vertex(2))
+
+        # when
+        def function(name):
+            return self.test_object.edge_column(name)
+
+        # then
+        assert_that(function).raises(AttributeError).when_called_with("imag")
+
     def test__vertices_count__then_number_of_vertices(self):
         # when
         result = self.test_object.vertices_count
@@ -132,6 +157,16 @@ class DirectedSimpleGraphTest(unittest.TestCase):
         # then
         assert_that(result.id).is_equal_to(vertex_id)
 
+    def test__get_vertex__when_added_vertex__then_same_vertex(self):
+        # given
+        vertex = self.test_object.add_vertex(Vertex(12))
+
+        # when
+        result = self.test_object.get_vertex(12)
+
+        # then
+        assert_that(result).is_same_as(vertex)
+
     def test__get_vertex__when_not_exists__then_key_error(self):
         # when
         def function(id_):
@@ -245,6 +280,67 @@ class DirectedSimpleGraphTest(unittest.TestCase):
         # then
         assert_that(result).is_equal_to(5)
 
+    def test__predecessors__then_source_vertices_of_incoming_edges(self):
+        # given
+        self.test_object.add_edge_between(Vertex(1), Vertex(1))
+        self.test_object.add_edge_between(Vertex(3), Vertex(1))
+        self.test_object.add_edge_between(Vertex(4), Vertex(1))
+        self.test_object.add_edge_between(Vertex(1), Vertex(2))
+        self.test_object.add_edges([(7, 1), (1, 6)])
+
+        # when
+        result = self.test_object.predecessors(Vertex(1))
+
+        # then
+        assert_that(sorted(result)).is_equal_to([Vertex(1), Vertex(3), Vertex(4), Vertex(7)])
+
+    def test__incoming_edges__when_reversed__then_outgoing_edges_reversed(self):
+        # given
+        self.test_object.add_edge_between(Vertex(1), Vertex(1))
+        self.test_object.add_edge_between(Vertex(1), Vertex(3))
+        self.test_object.add_edge_between(Vertex(1), Vertex(4))
+        self.test_object.add_edge_between(Vertex(2), Vertex(1))
+
+        # when
+        self.test_object.reverse()
+        result = self.test_object.incoming_edges(Vertex(1))
+
+        # then
+        assert_that(sorted(result)).is_equal_to(
+            [Edge(Vertex(1), Vertex(1)), Edge(Vertex(3), Vertex(1)), Edge(Vertex(4), Vertex(1))])
+
+    @staticmethod
+    def test__predecessors__when_incoming_edges_kept__then_source_vertices_of_incoming_edges():
+        # given
+        test_object = DirectedSimpleGraph(range(10), incoming=True)
+        test_object.add_edge_between(Vertex(1), Vertex(1))
+        test_object.add_edge_between(Vertex(3), Vertex(1))
+        test_object.add_edge_between(Vertex(1), Vertex(2))
+        test_object.add_edges([(7, 1), (1, 6)])
+
+        # when
+        result = test_object.predecessors(Vertex(1))
+
+        # then
+        assert_that(sorted(result)).is_equal_to([Vertex(1), Vertex(3), Vertex(7)])
+        assert_that(test_object.input_degree(Vertex(1))).is_equal_to(3)
+
+    @staticmethod
+    def test__incoming_edges__when_incoming_edges_kept__then_outgoing_edges_reversed():
+        # given
+        test_object = DirectedSimpleGraph(range(10), incoming=True)
+        test_object.add_edge_between(Vertex(1), Vertex(3))
+        test_object.add_edge_between(Vertex(1), Vertex(4))
+        test_object.add_edge_between(Vertex(2), Vertex(1))
+
+        # when
+        test_object.reverse()
+        result = test_object.incoming_edges(Vertex(1))
+
+        # then
+        assert_that(sorted(result)).is_equal_to(
+            [Edge(Vertex(3), Vertex(1)), Edge(Vertex(4), Vertex(1))])
+
     def test__add_vertex__when_new_vertex__then_created_vertex(self):
         # given
         new_vertex_id = 13
@@ -291,6 +387,15 @@ class DirectedSimpleGraphTest(unittest.TestCase):
         assert_that(sorted(self.test_object.neighbours(vertex1))).is_equal_to([vertex1, vertex2])
         assert_that(list(self.test_object.neighbours(vertex2))).is_empty()
 
+    def test__add_edge_between__then_edge_refers_to_graph_vertices(self):
+        # when
+        result = self.test_object.add_edge_between(Vertex(1), Vertex(5))
+
+        # then
+        assert_that(result.source).is_same_as(self.test_object.get_vertex(1))
+        assert_that(result.destination).is_same_as(self.test_object.get_vertex(5))
+        assert_that(next(iter(self.test_object.adjacent_edges(Vertex(1))))).is_same_as(result)
+
     def test__add_edge_between__when_duplicated_edge__then_value_error(self):
         # given
         source = Vertex(3)
@@ -304,6 +409,47 @@ class DirectedSimpleGraphTest(unittest.TestCase):
         # then
         assert_that(function).raises(ValueError).when_called_with(source, destination)
 
+    @staticmethod
+    def test__from_edges__then_graph_with_edges_and_properties():
+        # when
+        result = DirectedSimpleGraph.from_edges([(0, 2, "x"), (2, 4), (0, 4), (4, 4)], [1])
+
+        # then
+        assert_that(sorted(result.vertices)).is_equal_to(
+            [Vertex(0), Vertex(1), Vertex(2), Vertex(4)])
+        assert_that(result.edges_count).is_equal_to(4)
+        assert_that(sorted(result.neighbours(Vertex(4)))).is_equal_to([Vertex(4)])
+        assert_that(result.properties[result.get_edge(0, 2)]).is_equal_to("x")
+        assert_that(result.properties[result.get_edge(2, 4)]).is_none()
+
+    def test__add_edges__when_duplicated_edge__then_value_error(self):
+        # given
+        self.test_object.add_edge_between(Vertex(3), Vertex(7))
+
+        # when
+        def function(edges):
+            return self.test_object.add_edges(edges)
+
+        # then
+        assert_that(function).raises(ValueError).when_called_with([(1, 2), (3, 7)])
+
+    def test__add_edges__when_duplicated_edge__then_graph_unchanged(self):
+        # given
+        self.test_object.add_edge_between(Vertex(3), Vertex(7))
+        vertices = sorted(self.test_object.vertices)
+        edges = sorted(self.test_object.edges)
+        neighbours = sorted(self.test_object.neighbours(Vertex(7)))
+
+        # when
+        with self.assertRaises(ValueError):
+            self.test_object.add_edges([(7, 3), (1, 2, "x"), (2, 12), (3, 7)])
+
+        # then
+        assert_that(sorted(self.test_object.vertices)).is_equal_to(vertices)
+        assert_that(sorted(self.test_object.edges)).is_equal_to(edges)
+        assert_that(self.test_object.edges_count).is_equal_to(len(edges))
+        assert_that(sorted(self.test_object.neighbours(Vertex(7)))).is_equal_to(neighbours)
+
     def test__reverse__then_all_edges_have_reversed_direction(self):
         # given
         vertex = Vertex(5)
@@ -369,3 +515,42 @@ class DirectedSimpleGraphTest(unittest.TestCase):
         assert_that(result.properties[Vertex(9)]).is_none()
         assert_that(result.properties[result.get_edge(2, 1)]).is_equal_to(edge_property)
         assert_that(result.properties[result.get_edge(5, 3)]).is_none()
+
+    def test__reversed_view__then_edges_reversed_without_copy(self):
+        # given
+        edge = self.test_object.add_edge_between(Vertex(1), Vertex(2), "zxcvb")
+        self.test_object.add_edge_between(Vertex(3), Vertex(5))
+        self.test_object.add_edge_between(Vertex(5), Vertex(4))
+        self.test_object.add_edge_between(Vertex(6), Vertex(2))
+
+        # when
+        result = self.test_object.reversed_view()
+        self.test_object.add_edge_between(Vertex(5), Vertex(7))
+
+        # then
+        assert_that(sorted(result.edges)).is_equal_to(
+            [Edge(Vertex(2), Vertex(1)), Edge(Vertex(2), Vertex(6)), Edge(Vertex(4), Vertex(5)),
+             Edge(Vertex(5), Vertex(3)), Edge(Vertex(7), Vertex(5))])
+        assert_that(sorted(result.neighbours(Vertex(2)))).is_equal_to([Vertex(1), Vertex(6)])
+        assert_that(result.output_degree(Vertex(5))).is_equal_to(1)
+        assert_that(result.input_degree(Vertex(5))).is_equal_to(2)
+        assert_that(result.get_edge(2, 1)).is_equal_to(edge.reversed())
+        assert_that(result.properties[edge.reversed()]).is_equal_to("zxcvb")
+        assert_that(result.reversed_view()).is_same_as(self.test_object)
+
+    def test__reversed_view__when_edges_traversed_again__then_same_edge_objects(self):
+        # given
+        self.test_object.add_edge_between(Vertex(1), Vertex(2))
+        self.test_object.add_edge_between(Vertex(6), Vertex(2))
+        test_object = self.test_object.reversed_view()
+        edges = test_object.adjacent_edges(Vertex(2))
+
+        # when
+        result = list(test_object.edges)
+
+        # then
+        assert_that(sorted(edges)).is_equal_to(
+            [Edge(Vertex(2), Vertex(1)), Edge(Vertex(2), Vertex(6))])
+
+        for edge in edges:
+            assert_that(result[result.index(edge)]).is_same_as(edge)
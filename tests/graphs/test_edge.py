@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Tests: Structure of graph edge."""
+import pickle
+import unittest
+
+from assertpy import assert_that
+
+from algolib.graphs import Edge, Vertex
+
+
+class EdgeTest(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.test_object = None
+
+    def setUp(self):
+        self.test_object = Edge(Vertex(3), Vertex("x"))
+
+    def test__setattr__then_attribute_error(self):
+        # when
+        def function(name):
+            setattr(self.test_object, name, Vertex(5))
+
+        # then
+        assert_that(function).raises(AttributeError).when_called_with("source")
+        assert_that(function).raises(AttributeError).when_called_with("destination")
+        assert_that(function).raises(AttributeError).when_called_with("other")
+        assert_that(self.test_object.source).is_equal_to(Vertex(3))
+
+    def test__delattr__then_attribute_error(self):
+        # when
+        def function(name):
+            delattr(self.test_object, name)
+
+        # then
+        assert_that(function).raises(AttributeError).when_called_with("source")
+        assert_that(function).raises(AttributeError).when_called_with("destination")
+        assert_that(self.test_object.destination).is_equal_to(Vertex("x"))
+
+    def test__pickle__then_equal_edge_with_same_hash(self):
+        # when
+        result = pickle.loads(pickle.dumps(self.test_object))
+
+        # then
+        assert_that(result).is_not_same_as(self.test_object)
+        assert_that(result).is_equal_to(self.test_object)
+        assert_that(hash(result)).is_equal_to(hash(self.test_object))
+        assert_that({self.test_object: 1}).contains_key(result)
+        assert_that(hash(result.source)).is_equal_to(hash(Vertex(3)))
+
+    def test__pickle__when_vertices_shared__then_identity_preserved(self):
+        # given
+        vertex = self.test_object.source
+        items = [vertex, self.test_object, self.test_object.reversed()]
+
+        # when
+        result = pickle.loads(pickle.dumps(items))
+
+        # then
+        assert_that(result).is_equal_to(items)
+        assert_that(result[1].source).is_same_as(result[0])
+        assert_that(result[2].destination).is_same_as(result[0])
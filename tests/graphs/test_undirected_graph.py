@@ -299,6 +299,48 @@ class UndirectedSimpleGraphTest(unittest.TestCase):
         # then
         assert_that(function).raises(ValueError).when_called_with(source, destination)
 
+    @staticmethod
+    def test__from_edges__then_graph_with_edges_and_properties():
+        # when
+        result = UndirectedSimpleGraph.from_edges([(0, 2, "x"), (2, 4), (0, 4), (4, 4)], [1])
+
+        # then
+        assert_that(sorted(result.vertices)).is_equal_to(
+            [Vertex(0), Vertex(1), Vertex(2), Vertex(4)])
+        assert_that(result.edges_count).is_equal_to(4)
+        assert_that(sorted(result.neighbours(Vertex(4)))).is_equal_to(
+            [Vertex(0), Vertex(2), Vertex(4)])
+        assert_that(result.properties[result.get_edge(0, 2)]).is_equal_to("x")
+        assert_that(result.properties[result.get_edge(2, 4)]).is_none()
+
+    def test__add_edges__when_duplicated_edge__then_value_error(self):
+        # given
+        self.test_object.add_edge_between(Vertex(3), Vertex(7))
+
+        # when
+        def function(edges):
+            return self.test_object.add_edges(edges)
+
+        # then
+        assert_that(function).raises(ValueError).when_called_with([(1, 2), (7, 3)])
+
+    def test__add_edges__when_duplicated_edge__then_graph_unchanged(self):
+        # given
+        self.test_object.add_edge_between(Vertex(3), Vertex(7))
+        vertices = sorted(self.test_object.vertices)
+        edges = sorted(self.test_object.edges)
+        neighbours = sorted(self.test_object.neighbours(Vertex(7)))
+
+        # when
+        with self.assertRaises(ValueError):
+            self.test_object.add_edges([(1, 2, "x"), (12, 12), (2, 12), (7, 3)])
+
+        # then
+        assert_that(sorted(self.test_object.vertices)).is_equal_to(vertices)
+        assert_that(sorted(self.test_object.edges)).is_equal_to(edges)
+        assert_that(self.test_object.edges_count).is_equal_to(len(edges))
+        assert_that(sorted(self.test_object.neighbours(Vertex(7)))).is_equal_to(neighbours)
+
     def test__as_directed__then_directed_graph(self):
         # given
         vertex = Vertex(5)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Tests: Structure of graph vertex."""
+import pickle
+import unittest
+
+from assertpy import assert_that
+
+from algolib.graphs import Vertex
+
+
+class VertexTest(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.test_object = None
+
+    def setUp(self):
+        self.test_object = Vertex(("a", 7))
+
+    def test__setattr__then_attribute_error(self):
+        # when
+        def function(name):
+            setattr(self.test_object, name, 12)
+
+        # then
+        assert_that(function).raises(AttributeError).when_called_with("id")
+        assert_that(function).raises(AttributeError).when_called_with("other")
+        assert_that(self.test_object.id).is_equal_to(("a", 7))
+
+    def test__delattr__then_attribute_error(self):
+        # when
+        def function(name):
+            delattr(self.test_object, name)
+
+        # then
+        assert_that(function).raises(AttributeError).when_called_with("id")
+        assert_that(self.test_object.id).is_equal_to(("a", 7))
+
+    def test__pickle__then_equal_vertex_with_same_hash(self):
+        # when
+        result = pickle.loads(pickle.dumps(self.test_object))
+
+        # then
+        assert_that(result).is_not_same_as(self.test_object)
+        assert_that(result).is_equal_to(self.test_object)
+        assert_that(hash(result)).is_equal_to(hash(self.test_object))
+        assert_that({self.test_object: 1}).contains_key(result)
+
+    def test__pickle__then_still_immutable(self):
+        # given
+        result = pickle.loads(pickle.dumps(self.test_object))
+
+        # when
+        def function(id_):
+            result.id = id_
+
+        # then
+        assert_that(function).raises(AttributeError).when_called_with(5)